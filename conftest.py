@@ -10,10 +10,24 @@ from __future__ import annotations
 from collections.abc import Callable
 
 import pytest
+from django.utils import translation
 
 from projects.models import Category, Project
 
 
+@pytest.fixture(autouse=True)
+def _reset_language():
+    """
+    Deactivate the language a request left active in the test thread.
+
+    URLs carry a language prefix, so ``reverse`` in the next test would
+    otherwise build French URLs after a French page was requested.
+    """
+
+    yield
+    translation.deactivate()
+
+
 @pytest.fixture
 def category_factory(db) -> Callable[..., Category]:
     """
@@ -58,14 +72,14 @@ def project_factory(db, category_factory) -> Callable[..., Project]:
         nonlocal counter
         counter += 1
 
-        category = overrides.pop(
-            "category",
-            category_factory(
+        if "category" in overrides:
+            category = overrides.pop("category")
+        else:
+            category = category_factory(
                 name="Study Projects",
                 slug="study-projects",
                 description="Projects completed during training.",
-            ),
-        )
+            )
 
         defaults = {
             "title": f"Localized Project {counter}",
@@ -0,0 +1,152 @@
+"""
+Async class-based views.
+
+Under ASGI a sync view holds the single thread Django runs sync code in for
+the whole request, so concurrent requests queue behind each other. The
+public pages therefore have async variants that fetch their data with the
+async ORM and cache API (``aget``, ``acount``, ``async for``) and only hand
+template rendering to that thread.
+
+The URLconfs route to the async variants when ``settings.ASYNC_VIEWS`` is
+on, which the ASGI deployment profile (gunicorn_asgi_config.py) does.
+"""
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.http import Http404
+from django.views.generic.base import ContextMixin
+from django.views.generic.detail import SingleObjectMixin
+
+
+def select_view(view_class, async_view_class):
+    """Return the view class matching ``settings.ASYNC_VIEWS``."""
+    return async_view_class if settings.ASYNC_VIEWS else view_class
+
+
+class AsyncTemplateMixin:
+    """
+    Serve a TemplateResponseMixin view from an async ``get``.
+
+    Add before the view class. Subclasses build the context in
+    ``aget_context_data``; the default reuses ``get_context_data`` and only
+    suits views whose context needs no queries.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        context = await self.aget_context_data(**kwargs)
+        return self.render_to_response(context)
+
+    async def aget_context_data(self, **kwargs):
+        return self.get_context_data(**kwargs)
+
+
+class AsyncDetailMixin(AsyncTemplateMixin):
+    """Async ``get`` for a DetailView, looking the object up with ``aget``."""
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        context = await self.aget_context_data(object=self.object)
+        return self.render_to_response(context)
+
+    async def aget_context_data(self, **kwargs):
+        """Context of SingleObjectMixin, which needs no queries."""
+        return SingleObjectMixin.get_context_data(self, **kwargs)
+
+    async def aget_object(self, queryset=None):
+        """Async SingleObjectMixin.get_object."""
+        if queryset is None:
+            queryset = self.get_queryset()
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        slug = self.kwargs.get(self.slug_url_kwarg)
+        if pk is not None:
+            queryset = queryset.filter(pk=pk)
+        if slug is not None and (pk is None or self.query_pk_and_slug):
+            queryset = queryset.filter(**{self.get_slug_field(): slug})
+        if pk is None and slug is None:
+            raise AttributeError(
+                f"Generic detail view {self.__class__.__name__} must be "
+                "called with either an object pk or a slug in the URLconf."
+            )
+        try:
+            return await queryset.aget()
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f"No {queryset.model._meta.verbose_name} found matching the "
+                "query"
+            )
+
+
+class AsyncListMixin(AsyncTemplateMixin):
+    """
+    Async ``get`` for a ListView.
+
+    The current page is fetched with ``acount`` and ``async for``, so
+    ``object_list`` and ``page_obj.object_list`` are lists in the context.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = self.get_queryset()
+        if not self.get_allow_empty() and not await self.object_list.aexists():
+            raise Http404(
+                f"Empty list and “{self.__class__.__name__}.allow_empty” is "
+                "False."
+            )
+        context = await self.aget_context_data()
+        return self.render_to_response(context)
+
+    async def aget_context_data(self, *, object_list=None, **kwargs):
+        """Async MultipleObjectMixin.get_context_data."""
+        queryset = object_list if object_list is not None else self.object_list
+        page_size = self.get_paginate_by(queryset)
+        context_object_name = self.get_context_object_name(queryset)
+        if page_size:
+            (
+                paginator,
+                page,
+                queryset,
+                is_paginated,
+            ) = await self.apaginate_queryset(queryset, page_size)
+        else:
+            paginator, page, is_paginated = None, None, False
+            queryset = [obj async for obj in queryset]
+        context = {
+            "paginator": paginator,
+            "page_obj": page,
+            "is_paginated": is_paginated,
+            "object_list": queryset,
+        }
+        if context_object_name is not None:
+            context[context_object_name] = queryset
+        context.update(kwargs)
+        return ContextMixin.get_context_data(self, **context)
+
+    async def apaginate_queryset(self, queryset, page_size):
+        """Async MultipleObjectMixin.paginate_queryset."""
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        # Paginator.count is a cached_property; fill it without a sync query.
+        paginator.count = await queryset.acount()
+        page_kwarg = self.page_kwarg
+        page = (
+            self.kwargs.get(page_kwarg)
+            or self.request.GET.get(page_kwarg)
+            or 1
+        )
+        try:
+            page_number = int(page)
+        except ValueError:
+            if page != "last":
+                raise Http404(
+                    "Page is not “last”, nor can it be converted to an int."
+                )
+            page_number = paginator.num_pages
+        try:
+            page = paginator.page(page_number)
+        except InvalidPage as e:
+            raise Http404(f"Invalid page ({page_number}): {e}")
+        page.object_list = [obj async for obj in page.object_list]
+        return (paginator, page, page.object_list, page.has_other_pages())
@@ -0,0 +1,19 @@
+"""
+Cache backends counting hits and misses per request.
+
+Django's and django-redis' backends with core.server_timing.CacheTimingMixin,
+so the Server-Timing header reports the cache work of each request.
+"""
+
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
+
+from core.server_timing import CacheTimingMixin
+
+
+class TimedLocMemCache(CacheTimingMixin, LocMemCache):
+    pass
+
+
+class TimedRedisCache(CacheTimingMixin, RedisCache):
+    pass
@@ -1,7 +1,7 @@
 from django.conf import settings
 from django.utils.translation import get_language
 
-from core.localization.translation_service import normalize_language_code
+from core.localization.translation_service import get_translator
 
 
 def global_settings(_request):
@@ -12,15 +12,20 @@ def global_settings(_request):
     }
 
 
-def site_info(_request):
+def site_info(request):
     """
     Expose portfolio person info to all templates.
     Replaces hardcoded data in views.
+    Also exposes the request translator used by the {% t %} tag.
     """
+    translator = getattr(request, "translator", None) or get_translator(
+        get_language()
+    )
     return {
         "person": settings.PORTFOLIO_PERSON,
         "site_url": settings.SITE_URL,
         "years_experience": settings.PORTFOLIO_PERSON.get("years_experience", 0),
-        "current_language": normalize_language_code(get_language()),
+        "current_language": translator.language,
+        "translator": translator,
         "available_languages": tuple(settings.LANGUAGES),
     }
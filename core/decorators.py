@@ -1,9 +1,11 @@
 from functools import wraps
 
+from asgiref.sync import iscoroutinefunction
 from django.core.cache import cache
 from django.http import HttpResponseForbidden
 
 from core.localization.translation_service import translate_text
+from core.shared_cache import tag_response
 
 
 def rate_limit(key_prefix, limit=5, period=3600):
@@ -26,3 +28,39 @@ def rate_limit(key_prefix, limit=5, period=3600):
             return view_func(request, *args, **kwargs)
         return wrapper
     return decorator
+
+
+def public_view(view_func):
+    """
+    Mark a view as public: anonymous, cookie-free and cacheable.
+
+    GET and HEAD requests to it skip the session, CSRF, authentication and
+    messages middleware, and its responses never set cookies or vary on
+    Cookie (see core.middleware.PublicViewMiddleware).
+    """
+    if iscoroutinefunction(view_func):
+
+        async def wrapper(request, *args, **kwargs):
+            return await view_func(request, *args, **kwargs)
+
+    else:
+
+        def wrapper(request, *args, **kwargs):
+            return view_func(request, *args, **kwargs)
+
+    wrapper.public_view = True
+    return wraps(view_func)(wrapper)
+
+
+def surrogate_keys(*keys):
+    """
+    Tag the responses of a sync function view with surrogate keys.
+
+    Class-based views use core.shared_cache.SurrogateKeyMixin instead.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            return tag_response(view_func(request, *args, **kwargs), keys)
+        return wrapper
+    return decorator
@@ -0,0 +1,277 @@
+"""
+On-demand image resizing backed by a bounded disk cache.
+
+Templates request exactly the size they render through signed URLs of the
+form ``/media/r/<width>x<height>/<path>?v=<version>&s=<signature>``, where
+the version changes with the source file so edits reach browsers and CDNs
+despite the year-long max-age. The first request
+resizes the source with Pillow and stores the result on disk; later requests
+are served straight from the cache. The cache is capped in bytes and evicts
+the least recently used variants first, once the size a worker tracks for it
+goes over the cap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.signing import Signer
+from django.urls import reverse
+from django.utils.crypto import constant_time_compare
+from django.utils._os import safe_join
+from PIL import Image
+
+from core import metrics
+
+logger = logging.getLogger("portfolio")
+
+STATIC_SOURCE_PREFIX = "static/"
+
+# Seconds after which a worker rescans the cache on its next write even below
+# the cap, to account for what the other workers wrote meanwhile.
+EVICTION_RESCAN_INTERVAL = 300.0
+
+# Per cache directory: its size at this process's last scan plus what the
+# process wrote since, and the monotonic time of that scan.
+_tracked_sizes: dict[Path, tuple[int, float]] = {}
+
+# Content type and cache file extension of each output format.
+ENCODINGS = {
+    "JPEG": ("image/jpeg", ".jpg"),
+    "PNG": ("image/png", ".png"),
+    "WEBP": ("image/webp", ".webp"),
+}
+
+_signer = Signer(salt="core.image-resize")
+
+
+def _signature_value(width: int, height: int, path: str, version: str) -> str:
+    return f"{width}x{height}/{path}?v={version}"
+
+
+def sign(width: int, height: int, path: str, version: str) -> str:
+    """Return the signature authorizing a resize of ``path``."""
+    return _signer.signature(_signature_value(width, height, path, version))
+
+
+def verify(
+    width: int, height: int, path: str, version: str, signature: str | None
+) -> bool:
+    """Return True when ``signature`` matches the requested resize."""
+    return bool(signature) and constant_time_compare(
+        signature, sign(width, height, path, version)
+    )
+
+
+def source_version(source: Path | None) -> str:
+    """Return a token that changes whenever the source file changes."""
+    if source is None:
+        return ""
+    stat = source.stat()
+    raw = f"{stat.st_mtime_ns}:{stat.st_size}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:12]
+
+
+def resized_image_url(path: str, width: int, height: int) -> str:
+    """
+    Build a signed resize URL.
+
+    Args:
+        path: Media-relative path, or a static path prefixed with ``static/``.
+        width: Maximum output width in pixels.
+        height: Maximum output height in pixels.
+
+    Returns:
+        str: URL of the resized variant.
+    """
+
+    url = reverse(
+        "resized_image",
+        kwargs={"width": width, "height": height, "path": path},
+    )
+    version = source_version(resolve_source(path))
+    return f"{url}?v={version}&s={sign(width, height, path, version)}"
+
+
+def resolve_source(path: str) -> Path | None:
+    """
+    Return the file backing a resize request, or None when it is unknown.
+
+    Paths stay confined to MEDIA_ROOT, or to the static files when prefixed
+    with ``static/``.
+    """
+
+    try:
+        if path.startswith(STATIC_SOURCE_PREFIX):
+            relative = path[len(STATIC_SOURCE_PREFIX) :]
+            found = finders.find(relative)
+            if found:
+                return Path(found)
+            if not settings.STATIC_ROOT:
+                return None
+            candidate = Path(safe_join(settings.STATIC_ROOT, relative))
+        else:
+            candidate = Path(safe_join(settings.MEDIA_ROOT, path))
+    except (SuspiciousFileOperation, OSError):
+        return None
+    return candidate if candidate.is_file() else None
+
+
+def render_resized(source: Path, width: int, height: int) -> tuple[bytes, str]:
+    """
+    Resize ``source`` to fit inside ``width`` x ``height``.
+
+    The aspect ratio is preserved and images are never upscaled. JPEG and
+    WebP sources keep their format; anything else is written as PNG.
+
+    Returns:
+        tuple[bytes, str]: Encoded image and its output format.
+    """
+
+    with Image.open(source) as image:
+        output_format = image.format if image.format in ENCODINGS else "PNG"
+        image.seek(0)
+        image = image.copy()
+
+    image.thumbnail((width, height), Image.LANCZOS)
+    if output_format == "JPEG" and image.mode not in {"RGB", "L"}:
+        image = image.convert("RGB")
+
+    buffer = BytesIO()
+    options = {"optimize": True}
+    if output_format in {"JPEG", "WEBP"}:
+        options["quality"] = 85
+    image.save(buffer, format=output_format, **options)
+    return buffer.getvalue(), output_format
+
+
+class ResizeCache:
+    """
+    Disk cache of resized variants with a total size cap and LRU eviction.
+
+    File modification times track recency: hits touch the file, and eviction
+    removes the oldest files until the cache fits under its cap again. The
+    directory is only scanned when the size tracked by this process crosses
+    the cap, or every EVICTION_RESCAN_INTERVAL seconds.
+    """
+
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = Path(directory or settings.IMAGE_RESIZE_CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = settings.IMAGE_RESIZE_CACHE_MAX_BYTES
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(source: Path, width: int, height: int) -> str:
+        """Return a cache key that changes whenever the source changes."""
+        stat = source.stat()
+        raw = f"{source}:{stat.st_mtime_ns}:{stat.st_size}:{width}x{height}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def path_for(self, key: str, extension: str) -> Path:
+        return self.directory / key[:2] / f"{key}{extension}"
+
+    def get(self, key: str, extension: str) -> Path | None:
+        """Return the cached file for ``key`` and mark it recently used."""
+        path = self.path_for(key, extension)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, extension: str, data: bytes) -> Path:
+        """Store ``data`` atomically and evict old entries if needed."""
+        path = self.path_for(key, extension)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._track(len(data), keep=path)
+        return path
+
+    def _track(self, written: int, keep: Path) -> None:
+        """Add a write to the tracked size; evict when it crosses the cap."""
+        size, scanned_at = _tracked_sizes.get(self.directory, (None, 0.0))
+        if (
+            size is None
+            or size + written > self.max_bytes
+            or time.monotonic() - scanned_at > EVICTION_RESCAN_INTERVAL
+        ):
+            self.evict(keep=keep)
+        else:
+            _tracked_sizes[self.directory] = (size + written, scanned_at)
+
+    def evict(self, keep: Path | None = None) -> int:
+        """
+        Remove least recently used files until the cache fits its cap.
+
+        Args:
+            keep: File that must survive eviction (the one just written).
+
+        Returns:
+            int: Number of evicted files.
+        """
+
+        entries = []
+        total = 0
+        for path in self.directory.rglob("*"):
+            if not path.is_file() or path.suffix == ".tmp":
+                continue
+            stat = path.stat()
+            total += stat.st_size
+            if path != keep:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        evicted = 0
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            total -= size
+            evicted += 1
+        _tracked_sizes[self.directory] = (total, time.monotonic())
+        if evicted:
+            logger.info(f"Resize cache: evicted {evicted} file(s)")
+        return evicted
+
+
+def get_resized(path: str, width: int, height: int) -> tuple[Path, str] | None:
+    """
+    Return the cached resized file for ``path``, rendering it on a miss.
+
+    Returns:
+        tuple[Path, str] | None: Cached file and its content type, or None
+        when the source does not exist or cannot be decoded.
+    """
+
+    source = resolve_source(path)
+    if source is None:
+        return None
+
+    cache = ResizeCache()
+    key = ResizeCache.key(source, width, height)
+    for content_type, extension in ENCODINGS.values():
+        cached = cache.get(key, extension)
+        if cached is not None:
+            return cached, content_type
+
+    try:
+        with metrics.IMAGE_RESIZES.track_inprogress():
+            data, output_format = render_resized(source, width, height)
+    except (OSError, Image.DecompressionBombError) as exc:
+        logger.warning(f"Resize failed for {path}: {exc}")
+        return None
+    content_type, extension = ENCODINGS[output_format]
+    return cache.put(key, extension, data), content_type
@@ -0,0 +1,149 @@
+"""
+Compiled, lazily loaded translation catalog.
+
+``content_catalog.py`` is a large module of dict literals. ``manage.py
+compile_catalog`` serializes it with marshal into a compact file that is read
+on first use instead of importing the module. Catalog keys are interned so
+repeated lookups compare by identity. Under gunicorn with ``preload_app`` the
+master loads the catalog once and workers share it copy-on-write.
+
+When the compiled file is missing or older than the source module, the
+module itself is imported so development setups keep working unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import os
+import sys
+import threading
+from pathlib import Path
+
+logger = logging.getLogger("portfolio")
+
+CATALOG_SOURCE = Path(__file__).with_name("content_catalog.py")
+FORMAT_VERSION = 1
+
+_catalogs = None
+_lock = threading.Lock()
+
+
+def source_digest() -> str:
+    """Return the SHA-256 digest of the catalog source module."""
+    return hashlib.sha256(CATALOG_SOURCE.read_bytes()).hexdigest()
+
+
+def compiled_catalog_path() -> Path:
+    """Return the path of the compiled catalog from the settings."""
+    from django.conf import settings
+
+    return Path(settings.LOCALIZATION_COMPILED_CATALOG)
+
+
+def compile_catalog(path: Path | None = None) -> int:
+    """
+    Compile the catalog module into its binary form.
+
+    Args:
+        path: Destination file
+            (default: settings.LOCALIZATION_COMPILED_CATALOG).
+
+    Returns:
+        int: Size of the written file in bytes.
+    """
+
+    from core.localization.content_catalog import (
+        CONTENT_TRANSLATIONS,
+        UI_TRANSLATIONS,
+    )
+
+    path = Path(path or compiled_catalog_path())
+    data = marshal.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "source_digest": source_digest(),
+            "ui": UI_TRANSLATIONS,
+            "content": CONTENT_TRANSLATIONS,
+        }
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def _interned(catalogs: dict) -> dict:
+    """Intern the language codes and keys of ``{language: {key: text}}``."""
+    return {
+        sys.intern(language): {
+            sys.intern(key): message for key, message in messages.items()
+        }
+        for language, messages in catalogs.items()
+    }
+
+
+def _load_compiled() -> tuple[dict, dict] | None:
+    path = compiled_catalog_path()
+    try:
+        payload = marshal.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as exc:
+        logger.warning(f"Ignoring unreadable compiled catalog {path}: {exc}")
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != FORMAT_VERSION
+        or payload.get("source_digest") != source_digest()
+    ):
+        logger.warning(
+            f"Compiled catalog {path} is stale, run manage.py compile_catalog"
+        )
+        return None
+    return _interned(payload["ui"]), payload["content"]
+
+
+def _load_module() -> tuple[dict, dict]:
+    from core.localization.content_catalog import (
+        CONTENT_TRANSLATIONS,
+        UI_TRANSLATIONS,
+    )
+
+    return UI_TRANSLATIONS, CONTENT_TRANSLATIONS
+
+
+def load_catalogs() -> tuple[dict, dict]:
+    """
+    Return ``(ui_translations, content_translations)``, loading them once.
+
+    Call this from the gunicorn master when preloading the application so
+    every worker inherits the loaded catalog.
+    """
+
+    global _catalogs
+    if _catalogs is None:
+        with _lock:
+            if _catalogs is None:
+                _catalogs = _load_compiled() or _load_module()
+    return _catalogs
+
+
+def ui_translations() -> dict:
+    """Return the UI catalog, keyed by language then message key."""
+    return load_catalogs()[0]
+
+
+def content_translations() -> dict:
+    """Return the content catalog, keyed by language then English source."""
+    return load_catalogs()[1]
+
+
+def reset_catalogs() -> None:
+    """Forget the loaded catalog so the next lookup reloads it."""
+    global _catalogs
+    with _lock:
+        _catalogs = None
@@ -7,9 +7,16 @@ and dynamic project content can share the same runtime behavior.
 
 from __future__ import annotations
 
+from contextvars import ContextVar, Token
+
+from django.conf import settings
 from django.utils.translation import get_language
 
-from core.localization.content_catalog import CONTENT_TRANSLATIONS, UI_TRANSLATIONS
+from core.localization.catalog_store import (
+    content_translations,
+    load_catalogs,
+    ui_translations,
+)
 
 DEFAULT_LANGUAGE = "en"
 
@@ -28,7 +35,11 @@ def normalize_language_code(language_code: str | None) -> str:
     if not language_code:
         return DEFAULT_LANGUAGE
     short_code = language_code.split("-")[0].lower()
-    return short_code if short_code in UI_TRANSLATIONS else DEFAULT_LANGUAGE
+    # Checked against settings.LANGUAGES so the catalog is not loaded here.
+    for code, _name in settings.LANGUAGES:
+        if code == short_code:
+            return short_code
+    return DEFAULT_LANGUAGE
 
 
 def get_current_language() -> str:
@@ -42,6 +53,111 @@ def get_current_language() -> str:
     return normalize_language_code(get_language())
 
 
+class Translator:
+    """
+    Catalog lookups bound to one language.
+
+    UI messages are merged with their English fallback once, so a lookup is
+    a single dict access, and messages with placeholders are precompiled to
+    their bound ``format_map``. Instances are immutable and shared.
+    """
+
+    __slots__ = ("language", "messages", "formatters", "content", "_ui")
+
+    def __init__(self, language: str):
+        ui, content = load_catalogs()
+        self._ui = ui
+        self.language = language
+        self.messages = {**ui[DEFAULT_LANGUAGE], **ui.get(language, {})}
+        self.formatters = {
+            key: message.format_map
+            for key, message in self.messages.items()
+            if "{" in message
+        }
+        self.content = (
+            None if language == DEFAULT_LANGUAGE else content.get(language, {})
+        )
+
+    def key(self, key: str, **kwargs) -> str:
+        """Translate a UI key, interpolating ``kwargs`` when given."""
+        if kwargs:
+            formatter = self.formatters.get(key)
+            if formatter is not None:
+                return formatter(kwargs)
+        return self.messages.get(key, key)
+
+    def text(self, text: str | None) -> str | None:
+        """Translate free-form content by its exact English source."""
+        if not text or self.content is None:
+            return text
+        return self.content.get(text, text)
+
+    def field(self, obj, field_name: str):
+        """Return the localized value of a model content field."""
+        value = getattr(obj, field_name, None)
+        if self.content is None:
+            return value
+        translations = getattr(obj, "translations", None) or {}
+        stored = translations.get(self.language, {})
+        if field_name in stored:
+            return stored[field_name]
+        if isinstance(value, list):
+            return [self.text(item) for item in value]
+        return self.text(value)
+
+
+_translators: dict[str, Translator] = {}
+_active_translator: ContextVar[Translator | None] = ContextVar(
+    "active_translator", default=None
+)
+
+
+def get_translator(language_code: str | None = None) -> Translator:
+    """
+    Return the translator for a language.
+
+    Without a language code, the translator activated for the current request
+    is returned, falling back to the active Django language.
+
+    Args:
+        language_code: Optional target language code.
+
+    Returns:
+        Translator: Shared translator bound to the normalized language.
+    """
+
+    if language_code is None:
+        active = _active_translator.get()
+        if active is not None:
+            return active
+        language = get_current_language()
+    else:
+        language = normalize_language_code(language_code)
+
+    translator = _translators.get(language)
+    if translator is None or translator._ui is not ui_translations():
+        translator = _translators[language] = Translator(language)
+    return translator
+
+
+def activate_translator(language_code: str | None) -> tuple[Translator, Token]:
+    """
+    Bind the translator used by language-less lookups in this context.
+
+    Returns:
+        tuple[Translator, Token]: Active translator and the token to pass to
+        ``deactivate_translator``.
+    """
+
+    translator = get_translator(language_code or DEFAULT_LANGUAGE)
+    return translator, _active_translator.set(translator)
+
+
+def deactivate_translator(token: Token) -> None:
+    """Restore the translator active before ``activate_translator``."""
+    _active_translator.reset(token)
+
+
 def translate_key(key: str, language_code: str | None = None, **kwargs) -> str:
     """
     Translate a UI key using the application catalog.
@@ -55,11 +171,7 @@ def translate_key(key: str, language_code: str | None = None, **kwargs) -> str:
         str: Localized string if found, otherwise the key itself.
     """
 
-    language = normalize_language_code(language_code or get_current_language())
-    message = UI_TRANSLATIONS.get(language, {}).get(key)
-    if message is None:
-        message = UI_TRANSLATIONS[DEFAULT_LANGUAGE].get(key, key)
-    return message.format(**kwargs) if kwargs else message
+    return get_translator(language_code).key(key, **kwargs)
 
 
 def translate_text(text: str | None, language_code: str | None = None) -> str | None:
@@ -74,12 +186,53 @@ def translate_text(text: str | None, language_code: str | None = None) -> str |
         str | None: Localized content when available, else the original text.
     """
 
-    if text in (None, ""):
-        return text
+    return get_translator(language_code).text(text)
+
+
+def build_content_translations(values: dict) -> dict[str, dict]:
+    """
+    Precompute the catalog translations of a model's content fields.
+
+    Args:
+        values: Mapping of field name to English text or list of texts.
+
+    Returns:
+        dict[str, dict]: ``{language: {field: localized value}}`` holding only
+        the fields the catalog actually translates.
+    """
+
+    translations = {}
+    for language, catalog in content_translations().items():
+        localized = {}
+        for field_name, value in values.items():
+            if isinstance(value, list):
+                items = [
+                    catalog.get(item, item) if isinstance(item, str) else item
+                    for item in value
+                ]
+                if items != value:
+                    localized[field_name] = items
+            elif value and value in catalog:
+                localized[field_name] = catalog[value]
+        if localized:
+            translations[language] = localized
+    return translations
+
+
+def translate_field(obj, field_name: str, language_code: str | None = None):
+    """
+    Return the localized value of a model content field.
+
+    Values precomputed in ``obj.translations`` are read directly; the exact
+    source-string lookup of ``translate_text`` is only used as a fallback.
 
-    language = normalize_language_code(language_code or get_current_language())
-    if language == DEFAULT_LANGUAGE:
-        return text
+    Args:
+        obj: Model instance exposing the field and a ``translations`` mapping.
+        field_name: Name of the content field.
+        language_code: Optional target language code.
 
-    return CONTENT_TRANSLATIONS.get(language, {}).get(text, text)
+    Returns:
+        Localized value, or the original value when no translation exists.
+    """
 
+    return get_translator(language_code).field(obj, field_name)
@@ -0,0 +1,118 @@
+"""
+Runtime maintenance mode.
+
+Maintenance is on while ``settings.MAINTENANCE_MODE`` is set or the flag
+file ``MAINTENANCE_FLAG_FILE`` exists. ``manage.py maintenance on/off``
+creates and removes the file, so every worker on the host switches within
+``CHECK_INTERVAL`` seconds, without a restart.
+
+Blocked requests get a 503 whose body was rendered once per language and
+kept in memory (see MaintenanceModeMiddleware): while the site is under
+stress, maintenance costs no template rendering or context processors.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template.loader import render_to_string
+
+# Seconds a flag file check is reused before the file is looked up again.
+CHECK_INTERVAL = 1.0
+TEMPLATE_NAME = "core/maintenance.html"
+
+_state = {"checked_at": -math.inf, "retry_after": None}
+_pages = {}
+
+
+def flag_file() -> Path:
+    return Path(settings.MAINTENANCE_FLAG_FILE)
+
+
+def enable(retry_after: int | None = None) -> None:
+    """
+    Switch maintenance mode on by writing the flag file.
+
+    Args:
+        retry_after: Seconds announced to clients in ``Retry-After``
+            (default: ``settings.MAINTENANCE_RETRY_AFTER``).
+    """
+
+    path = flag_file()
+    seconds = retry_after
+    if seconds is None:
+        seconds = settings.MAINTENANCE_RETRY_AFTER
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(f"{seconds}\n")
+    os.replace(tmp_path, path)
+    _state["checked_at"] = -math.inf
+
+
+def disable() -> None:
+    """Switch maintenance mode off by removing the flag file."""
+    flag_file().unlink(missing_ok=True)
+    _state["checked_at"] = -math.inf
+
+
+def retry_after() -> int | None:
+    """
+    Return the ``Retry-After`` seconds while maintenance is on, else None.
+
+    The flag file is looked up at most once per ``CHECK_INTERVAL``.
+    """
+
+    if settings.MAINTENANCE_MODE:
+        return settings.MAINTENANCE_RETRY_AFTER
+    now = time.monotonic()
+    if now - _state["checked_at"] >= CHECK_INTERVAL:
+        _state["retry_after"] = _read_flag()
+        _state["checked_at"] = now
+    return _state["retry_after"]
+
+
+def is_active() -> bool:
+    return retry_after() is not None
+
+
+def _read_flag() -> int | None:
+    try:
+        content = flag_file().read_text().strip()
+    except OSError:
+        return None
+    try:
+        return int(content)
+    except ValueError:
+        return settings.MAINTENANCE_RETRY_AFTER
+
+
+def page(language: str | None) -> bytes:
+    """Return the maintenance page of a language, rendered on first use."""
+    if language not in _pages:
+        language = _render_language(language)
+    return _pages[language]
+
+
+def render_pages() -> int:
+    """Render the maintenance page of every language; return the count."""
+    for language, _name in settings.LANGUAGES:
+        _render_language(language)
+    return len(_pages)
+
+
+def _render_language(language: str | None) -> str:
+    from core.localization.translation_service import get_translator
+
+    translator = get_translator(language)
+    if translator.language not in _pages:
+        _pages[translator.language] = render_to_string(
+            TEMPLATE_NAME,
+            {
+                "current_language": translator.language,
+                "translator": translator,
+            },
+        ).encode()
+    return translator.language
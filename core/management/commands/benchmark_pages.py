@@ -0,0 +1,114 @@
+"""
+Management command to measure server-side render time of public pages.
+
+Each page is requested through the full middleware stack with Django's test
+client, with the per-site cache middleware removed so every request renders
+its templates. Use it to compare changes to templates, tags and context.
+Streamed responses are consumed in full; "first byte" is the median time
+until their first chunk.
+
+Usage:
+    python manage.py benchmark_pages
+    python manage.py benchmark_pages --language fr --iterations 200
+    python manage.py benchmark_pages /projects/ /about/
+"""
+
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from projects.models import Project
+
+CACHE_MIDDLEWARE = {
+    "django.middleware.cache.UpdateCacheMiddleware",
+    "core.middleware.StreamingUpdateCacheMiddleware",
+    "django.middleware.cache.FetchFromCacheMiddleware",
+    "core.middleware.CompressedFetchFromCacheMiddleware",
+}
+
+
+class Command(BaseCommand):
+    help = "Measure average render time of public pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="Paths to benchmark "
+            "(default: home, project list, one project)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=50,
+            help="Requests per page after one warm-up request (default: 50)",
+        )
+        parser.add_argument(
+            "--language",
+            default=settings.LANGUAGE_CODE,
+            help="Language cookie sent with every request",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or self.default_paths()
+        iterations = max(options["iterations"], 1)
+        host = next(
+            (host for host in settings.ALLOWED_HOSTS if host not in {"*", ""}),
+            "localhost",
+        ).lstrip(".")
+        middleware = [
+            m for m in settings.MIDDLEWARE if m not in CACHE_MIDDLEWARE
+        ]
+
+        self.stdout.write(
+            f"Benchmarking {len(paths)} page(s), "
+            f"{iterations} request(s) each, "
+            f"language={options['language']}"
+        )
+        self.stdout.write("=" * 60)
+
+        with override_settings(MIDDLEWARE=middleware):
+            client = Client(HTTP_HOST=host)
+            client.cookies[settings.LANGUAGE_COOKIE_NAME] = options["language"]
+            for path in paths:
+                response = client.get(path)
+                if response.status_code != 200:
+                    raise CommandError(
+                        f"{path} returned {response.status_code}"
+                    )
+
+                timings = []
+                first_bytes = []
+                for _ in range(iterations):
+                    start = time.perf_counter()
+                    response = client.get(path)
+                    if response.streaming:
+                        chunks = iter(response.streaming_content)
+                        next(chunks, None)
+                        first_byte = time.perf_counter()
+                        for _chunk in chunks:
+                            pass
+                    else:
+                        first_byte = time.perf_counter()
+                    first_bytes.append((first_byte - start) * 1000)
+                    timings.append((time.perf_counter() - start) * 1000)
+
+                self.stdout.write(
+                    f"  {path:<40} mean {statistics.mean(timings):7.2f} ms  "
+                    f"median {statistics.median(timings):7.2f} ms  "
+                    f"min {min(timings):7.2f} ms  "
+                    f"first byte {statistics.median(first_bytes):7.2f} ms"
+                )
+
+        self.stdout.write("=" * 60)
+
+    def default_paths(self):
+        paths = [reverse("core:home"), reverse("projects:list")]
+        project = Project.published.order_by("order").first()
+        if project is not None:
+            paths.append(project.get_absolute_url())
+        return paths
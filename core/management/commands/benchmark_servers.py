@@ -0,0 +1,290 @@
+"""
+Management command to compare the sync (WSGI) and async (ASGI) deployments.
+
+Each profile is started as a real gunicorn server on a local port with the
+same number of workers, the per-site page cache disabled so every request
+renders, then loaded by concurrent clients for a fixed duration. Reported
+per profile: throughput, median and p99 latency, errors, and the
+proportional memory (PSS) of the whole server, master and workers, once the
+run is over.
+
+Profiles:
+    sync  gunicorn_config.py, portfolio_dimitri.wsgi, sync views
+    asgi  gunicorn_asgi_config.py, portfolio_dimitri.asgi, async views
+
+Usage:
+    python manage.py benchmark_servers
+    python manage.py benchmark_servers --workers 2 --concurrency 32
+    python manage.py benchmark_servers --profile asgi /projects/ /ai/
+"""
+
+import http.client
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.commands.benchmark_pages import Command as BenchmarkPages
+from core.warmup import memory_usage
+
+PROFILES = {
+    "sync": ("gunicorn_config.py", "portfolio_dimitri.wsgi:application"),
+    "asgi": ("gunicorn_asgi_config.py", "portfolio_dimitri.asgi:application"),
+}
+STARTUP_TIMEOUT = 60
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare throughput, p99 latency and memory of the WSGI and ASGI "
+        "servers"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="Paths requested in turn "
+            "(default: home, project list, one project)",
+        )
+        parser.add_argument(
+            "--profile",
+            action="append",
+            choices=sorted(PROFILES),
+            dest="profiles",
+            help="Profile to run (repeatable, default: sync and asgi)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=2,
+            help="Worker processes of every profile (default: 2)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=16,
+            help="Concurrent client connections (default: 16)",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=15.0,
+            help="Seconds of load per profile after warm-up (default: 15)",
+        )
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=8765,
+            help="Local port the servers listen on (default: 8765)",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or BenchmarkPages().default_paths()
+        profiles = options["profiles"] or ["sync", "asgi"]
+        port, workers = options["port"], options["workers"]
+        concurrency, duration = options["concurrency"], options["duration"]
+
+        self.stdout.write(
+            f"Benchmarking {', '.join(profiles)}: {workers} worker(s), "
+            f"{concurrency} connection(s), {duration:.0f}s, "
+            f"{len(paths)} page(s)"
+        )
+        self.stdout.write("=" * 60)
+
+        for profile in profiles:
+            with self.server(profile, workers, port) as pid:
+                self.wait_until_ready(port, paths)
+                result = self.load(port, paths, concurrency, duration)
+                memory = server_memory(pid)
+
+            latencies = sorted(result["latencies"])
+            if not latencies:
+                raise CommandError(f"{profile}: no successful request")
+            throughput = len(latencies) / result["elapsed"]
+            self.stdout.write(
+                f"  {profile:<5} {throughput:8.1f} req/s  "
+                f"median {statistics.median(latencies):7.1f} ms  "
+                f"p99 {percentile(latencies, 99):7.1f} ms  "
+                f"errors {result['errors']:<4} "
+                f"PSS {memory / 1024:6.1f} MiB"
+            )
+
+        self.stdout.write("=" * 60)
+
+    def server(self, profile, workers, port):
+        config, app = PROFILES[profile]
+        base_dir = Path(settings.BASE_DIR)
+        log_path = os.path.join(
+            tempfile.gettempdir(), f"benchmark-{profile}.log"
+        )
+        command = [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--config",
+            str(base_dir / config),
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            str(workers),
+            "--access-logfile",
+            os.devnull,
+            "--error-logfile",
+            log_path,
+            "--pid",
+            os.path.join(tempfile.gettempdir(), f"benchmark-{profile}.pid"),
+            app,
+        ]
+        env = {
+            **os.environ,
+            "CACHE_MIDDLEWARE_SECONDS": "0",
+            "STATIC_SITE_ROOT": "",
+        }
+        self.stdout.write(f"  {profile}: server log in {log_path}")
+        return _Server(command, env, base_dir, log_path)
+
+    def wait_until_ready(self, port, paths):
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                status = request(port, paths[0])[0]
+            except OSError:
+                status = None
+            if status == 200:
+                break
+            if time.monotonic() > deadline:
+                raise CommandError(
+                    f"Server did not answer {paths[0]} with 200"
+                )
+            time.sleep(0.5)
+        # One request per page and worker, so templates are compiled.
+        for path in paths * 4:
+            request(port, path)
+
+    def load(self, port, paths, concurrency, duration):
+        latencies = []
+        errors = 0
+        lock = threading.Lock()
+        deadline = time.monotonic() + duration
+
+        def client(offset):
+            nonlocal errors
+            index = offset
+            while time.monotonic() < deadline:
+                path = paths[index % len(paths)]
+                index += 1
+                start = time.perf_counter()
+                try:
+                    status = request(port, path)[0]
+                except OSError:
+                    status = None
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    if status == 200:
+                        latencies.append(elapsed)
+                    else:
+                        errors += 1
+
+        start = time.monotonic()
+        threads = [
+            threading.Thread(target=client, args=(offset,))
+            for offset in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return {
+            "latencies": latencies,
+            "errors": errors,
+            "elapsed": time.monotonic() - start,
+        }
+
+
+class _Server:
+    """Run a gunicorn command for the duration of a with block."""
+
+    def __init__(self, command, env, cwd, log_path):
+        self.command = command
+        self.env = env
+        self.cwd = cwd
+        self.log_path = log_path
+        self.process = None
+
+    def __enter__(self):
+        with open(self.log_path, "w") as log:
+            self.process = subprocess.Popen(
+                self.command,
+                env=self.env,
+                cwd=self.cwd,
+                stdout=log,
+                stderr=log,
+            )
+        return self.process.pid
+
+    def __exit__(self, *exc_info):
+        self.process.send_signal(signal.SIGTERM)
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+def request(port, path):
+    """GET a page as nginx would forward it; return (status, body size)."""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        connection.request(
+            "GET",
+            path,
+            headers={
+                "Host": "localhost",
+                "X-Forwarded-Proto": "https",
+                "Accept-Encoding": "identity",
+            },
+        )
+        response = connection.getresponse()
+        return response.status, len(response.read())
+    finally:
+        connection.close()
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of sorted values."""
+    index = max(round(percent / 100 * len(values)) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def server_memory(pid):
+    """
+    Proportional memory in KiB of a process and its children (Linux /proc).
+
+    PSS splits the pages workers share with the preloaded master between
+    them, so the total is what the server actually occupies.
+    """
+
+    children = {}
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        total += memory_usage(current).get("pss", 0)
+    return total
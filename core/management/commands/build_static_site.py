@@ -0,0 +1,153 @@
+"""
+Management command to export the public site as static files.
+
+Every page is rendered under each of its /<language>/ prefixes through the
+regular middleware stack (without the page cache) and written with gzip and
+brotli siblings. The security headers of the pages are written for nginx to
+include (see static_site.write_headers).
+See core/static_site.py for the layout and deploy/nginx.conf for serving.
+
+Usage:
+    python manage.py build_static_site
+    python manage.py build_static_site --output /var/www/portfolio/site
+    python manage.py build_static_site --page /en/projects/epic_events/
+    python manage.py build_static_site --project 3
+    python manage.py build_static_site --remove /en/projects/old-slug/
+"""
+
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+
+from core import static_site
+from core.management.commands.benchmark_pages import CACHE_MIDDLEWARE
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Render the public site into static files nginx can serve"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="Export directory (default: settings.STATIC_SITE_ROOT)",
+        )
+        parser.add_argument(
+            "--page",
+            action="append",
+            default=[],
+            dest="pages",
+            help="Only render this page "
+            "(repeatable, may include a query string)",
+        )
+        parser.add_argument(
+            "--project",
+            action="append",
+            default=[],
+            type=int,
+            dest="projects",
+            help="Render the pages showing this project id (repeatable)",
+        )
+        parser.add_argument(
+            "--remove",
+            action="append",
+            default=[],
+            help="Remove this exported page (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        if options["output"]:
+            root = Path(options["output"])
+        else:
+            root = static_site.export_root()
+        if root is None:
+            raise CommandError("Set STATIC_SITE_ROOT or pass --output")
+
+        full_build = not (
+            options["pages"] or options["projects"] or options["remove"]
+        )
+        if full_build:
+            pages = static_site.site_pages()
+        else:
+            pages = list(options["pages"])
+            for project in Project.objects.filter(pk__in=options["projects"]):
+                pages += static_site.pages_for_project(project)
+            pages = list(dict.fromkeys(pages))
+
+        removed = 0
+        for page in options["remove"]:
+            removed += static_site.remove_page(root, page)
+
+        start = time.perf_counter()
+        written, skipped = self.render_pages(root, pages)
+
+        if full_build:
+            removed += self.prune(root, written)
+
+        self.stdout.write("=" * 60)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Exported {len(pages)} page(s) to {root} "
+                f"in {time.perf_counter() - start:.1f}s"
+            )
+        )
+        self.stdout.write(f"  Files written: {len(written)}")
+        self.stdout.write(f"  Files removed: {removed}")
+        if skipped:
+            self.stdout.write(
+                self.style.WARNING(f"  Pages skipped: {skipped}")
+            )
+        self.stdout.write("=" * 60)
+
+    def render_pages(self, root, pages):
+        site = urlsplit(settings.SITE_URL)
+        middleware = [
+            m for m in settings.MIDDLEWARE if m not in CACHE_MIDDLEWARE
+        ]
+        written = set()
+        skipped = 0
+        headers_written = False
+
+        with override_settings(
+            MIDDLEWARE=middleware,
+            STREAM_HTML_RESPONSES=False,
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, site.hostname],
+        ):
+            client = Client(HTTP_HOST=site.netloc)
+            for page in pages:
+                response = client.get(page, secure=site.scheme == "https")
+                if response.status_code != 200:
+                    skipped += 1
+                    if response.status_code == 404:
+                        static_site.remove_page(root, page)
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"⚠ {page} returned {response.status_code}, "
+                            "not exported"
+                        )
+                    )
+                    continue
+                written.update(
+                    static_site.write_page(root, page, response.content)
+                )
+                if not headers_written:
+                    static_site.write_headers(root, response)
+                    headers_written = True
+        return written, skipped
+
+    def prune(self, root, written):
+        """Remove files left over from pages that no longer exist."""
+        removed = 0
+        for language in static_site.export_languages():
+            language_dir = root / language
+            if not language_dir.is_dir():
+                continue
+            for path in language_dir.rglob("*"):
+                if path.is_file() and path not in written:
+                    path.unlink()
+                    removed += 1
+        return removed
@@ -0,0 +1,40 @@
+"""
+Management command to compile the translation catalog into binary form.
+
+The compiled file is loaded lazily on first use instead of importing the
+content_catalog module in every process. Run it at build time and after
+editing core/localization/content_catalog.py.
+
+Usage:
+    python manage.py compile_catalog
+"""
+
+from django.core.management.base import BaseCommand
+
+from core.localization.catalog_store import (
+    compile_catalog,
+    compiled_catalog_path,
+    reset_catalogs,
+)
+
+
+class Command(BaseCommand):
+    help = "Compile core/localization/content_catalog.py into a binary catalog"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=str,
+            default=None,
+            help="Destination file (default: LOCALIZATION_COMPILED_CATALOG)",
+        )
+
+    def handle(self, *args, **options):
+        path = options["output"] or compiled_catalog_path()
+        size = compile_catalog(path)
+        reset_catalogs()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Compiled catalog written to {path} ({size} bytes)"
+            )
+        )
@@ -0,0 +1,133 @@
+"""
+Management command to convert animated GIF art into animated WebP + poster.
+
+Each ``<name>.gif`` found in the image directories gets two siblings:
+``<name>.anim.webp`` (the animation) and ``<name>.poster.webp`` (its first
+frame). Templates show the poster and swap in the animation only while it is
+visible. Files whose variants are newer than the GIF are skipped.
+
+Usage:
+    python manage.py convert_gifs
+    python manage.py convert_gifs --dry-run
+"""
+
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.management.commands.optimize_images import _format_size
+from core.utils import ANIMATED_SUFFIX, POSTER_SUFFIX, convert_animated_gif
+
+# Card art is rendered at 248 CSS pixels; gallery images at up to 800.
+CARD_MAX_DIMENSION = 496
+GALLERY_MAX_DIMENSION = 1600
+
+
+def variant_paths(path):
+    """Return the animated and poster paths generated for a GIF."""
+    stem = path.with_suffix("")
+    return (
+        stem.with_name(f"{stem.name}{ANIMATED_SUFFIX}"),
+        stem.with_name(f"{stem.name}{POSTER_SUFFIX}"),
+    )
+
+
+class Command(BaseCommand):
+    help = "Convert animated GIFs into animated WebP files with poster frames"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report expected savings without writing any file",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Convert GIFs even when their variants are up to date",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING("DRY RUN MODE - No file will be written")
+            )
+
+        converted = 0
+        skipped = 0
+        errors = 0
+        total_before = 0
+        total_after = 0
+        for path in self.collect_gifs():
+            relative = os.path.relpath(path, settings.BASE_DIR)
+            animated_path, poster_path = variant_paths(path)
+            if not options["force"] and self.is_up_to_date(
+                path, animated_path, poster_path
+            ):
+                skipped += 1
+                continue
+
+            max_dimension = (
+                CARD_MAX_DIMENSION
+                if path.stem.endswith("_card")
+                else GALLERY_MAX_DIMENSION
+            )
+            data = path.read_bytes()
+            try:
+                animated, poster = convert_animated_gif(data, max_dimension)
+            except Exception as exc:  # Pillow raises many error types
+                errors += 1
+                self.stdout.write(self.style.ERROR(f"  ✗ {relative}: {exc}"))
+                continue
+
+            if not dry_run:
+                animated_path.write_bytes(animated)
+                poster_path.write_bytes(poster)
+            converted += 1
+            total_before += len(data)
+            total_after += len(animated)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"  ✓ {relative}: {_format_size(len(data))} -> "
+                    f"{_format_size(len(animated))} animated, "
+                    f"{_format_size(len(poster))} poster"
+                )
+            )
+
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS("\nConversion Summary:"))
+        self.stdout.write(f"  Converted: {converted}")
+        self.stdout.write(f"  Skipped:   {skipped}")
+        self.stdout.write(f"  Errors:    {errors}")
+        self.stdout.write(
+            f"  {'Expected savings' if dry_run else 'Saved'}: "
+            f"{_format_size(total_before - total_after)} "
+            f"({_format_size(total_before)} -> {_format_size(total_after)})"
+        )
+        self.stdout.write("=" * 60)
+
+    def collect_gifs(self):
+        """Return unique GIF paths found under the configured directories."""
+        seen = set()
+        gifs = []
+        for directory in settings.IMAGE_OPTIMIZATION_DIRS:
+            directory = Path(directory)
+            if not directory.exists():
+                continue
+            for path in sorted(directory.rglob("*.gif")):
+                resolved = path.resolve()
+                if resolved not in seen:
+                    seen.add(resolved)
+                    gifs.append(resolved)
+        return gifs
+
+    @staticmethod
+    def is_up_to_date(path, *variants):
+        source_mtime = path.stat().st_mtime
+        return all(
+            variant.exists() and variant.stat().st_mtime >= source_mtime
+            for variant in variants
+        )
@@ -0,0 +1,54 @@
+"""
+Management command to switch maintenance mode at runtime.
+
+Creates or removes settings.MAINTENANCE_FLAG_FILE; running workers pick the
+change up within a second (see core/maintenance.py).
+
+Usage:
+    python manage.py maintenance on
+    python manage.py maintenance on --retry-after 600
+    python manage.py maintenance off
+    python manage.py maintenance status
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core import maintenance
+
+
+class Command(BaseCommand):
+    help = "Switch maintenance mode on or off without restarting the server"
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["on", "off", "status"])
+        parser.add_argument(
+            "--retry-after",
+            type=int,
+            help=(
+                "Seconds announced in Retry-After "
+                f"(default: {settings.MAINTENANCE_RETRY_AFTER})"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["action"] == "on":
+            maintenance.enable(options["retry_after"])
+        elif options["action"] == "off":
+            maintenance.disable()
+
+        retry_after = maintenance.retry_after()
+        if retry_after is None:
+            self.stdout.write(self.style.SUCCESS("Maintenance mode is off"))
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Maintenance mode is on (Retry-After: {retry_after}s)"
+                )
+            )
+        if options["action"] == "off" and settings.MAINTENANCE_MODE:
+            self.stdout.write(
+                self.style.WARNING(
+                    "MAINTENANCE_MODE is set; unset it to go live"
+                )
+            )
@@ -0,0 +1,245 @@
+"""
+Management command to recompress existing static and media images in bulk.
+
+Images are only optimized when they are saved through the models, so files
+committed to static/ or copied into media/ are shipped as exported. This
+command re-encodes raster images and minifies SVGs in parallel, and keeps a
+content-hash ledger so that already processed files are skipped on the next
+run.
+
+Usage:
+    python manage.py optimize_images
+    python manage.py optimize_images --dry-run
+    python manage.py optimize_images --extension .svg
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.svg import minify_svg
+from core.utils import ANIMATED_SUFFIX, recompress_image
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".svg"}
+
+
+def _format_size(size):
+    """Return a human readable byte count."""
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _optimize_file(path, dry_run):
+    """
+    Recompress or minify a single image file (runs inside a worker process).
+
+    Returns:
+        dict: Outcome with the original and resulting sizes and the digest of
+        the bytes left on disk.
+    """
+
+    data = Path(path).read_bytes()
+    result = {"path": path, "before": len(data), "after": len(data)}
+    try:
+        if path.lower().endswith(".svg"):
+            optimized, image_format = minify_svg(data), "SVG"
+        else:
+            optimized, image_format = recompress_image(data)
+    except Exception as exc:  # Pillow raises many different error types
+        result.update(status="error", error=str(exc), digest=_digest(data))
+        return result
+
+    result["format"] = image_format
+    if len(optimized) >= len(data):
+        result.update(status="kept", digest=_digest(data))
+        return result
+
+    result.update(status="optimized", after=len(optimized))
+    if dry_run:
+        result["digest"] = _digest(data)
+        return result
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as tmp_file:
+        tmp_file.write(optimized)
+    os.replace(tmp_path, path)
+    result["digest"] = _digest(optimized)
+    return result
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompress static and media images in parallel, skipping processed "
+        "files"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report expected savings without touching any file",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of worker processes (default: all cores)",
+        )
+        parser.add_argument(
+            "--ledger",
+            type=str,
+            default=str(settings.IMAGE_OPTIMIZATION_LEDGER),
+            help="Path to the JSON content-hash ledger",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Ignore the ledger and process every image again",
+        )
+        parser.add_argument(
+            "--extension",
+            action="append",
+            dest="extensions",
+            help="Only process files with this extension "
+            "(repeatable, e.g. .svg)",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        ledger_path = Path(options["ledger"])
+        ledger = {} if options["force"] else self.load_ledger(ledger_path)
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING("DRY RUN MODE - No file will be modified")
+            )
+
+        pending = []
+        skipped = 0
+        for path in self.collect_images(options["extensions"]):
+            if _digest(path.read_bytes()) in ledger:
+                skipped += 1
+                continue
+            pending.append(str(path))
+
+        self.stdout.write(
+            f"Processing {len(pending)} image(s) with {options['workers']} "
+            f"worker(s), {skipped} already optimized"
+        )
+
+        total_before = 0
+        total_after = 0
+        errors = 0
+        workers = max(options["workers"], 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_optimize_file, path, dry_run) for path in pending
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                relative = os.path.relpath(result["path"], settings.BASE_DIR)
+
+                if result["status"] == "error":
+                    errors += 1
+                    self.stdout.write(
+                        self.style.ERROR(f"  ✗ {relative}: {result['error']}")
+                    )
+                    continue
+
+                total_before += result["before"]
+                total_after += result["after"]
+                saved = result["before"] - result["after"]
+                if result["status"] == "optimized":
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"  ✓ {relative}: "
+                            f"{_format_size(result['before'])} -> "
+                            f"{_format_size(result['after'])} "
+                            f"(-{_format_size(saved)})"
+                        )
+                    )
+                else:
+                    self.stdout.write(f"  = {relative}: kept original")
+
+                if not dry_run:
+                    ledger[result["digest"]] = {
+                        "path": relative,
+                        "format": result["format"],
+                        "original_bytes": result["before"],
+                        "optimized_bytes": result["after"],
+                    }
+
+        if not dry_run:
+            self.save_ledger(ledger_path, ledger)
+
+        saved_total = total_before - total_after
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS("\nOptimization Summary:"))
+        self.stdout.write(f"  Processed: {len(pending) - errors}")
+        self.stdout.write(f"  Skipped:   {skipped}")
+        self.stdout.write(f"  Errors:    {errors}")
+        self.stdout.write(
+            f"  {'Expected savings' if dry_run else 'Saved'}: "
+            f"{_format_size(saved_total)} "
+            f"({_format_size(total_before)} -> {_format_size(total_after)})"
+        )
+        self.stdout.write("=" * 60)
+
+    def collect_images(self, extensions=None):
+        """Return unique image paths found under the configured directories."""
+        if extensions:
+            extensions = {
+                f".{extension.lower().lstrip('.')}" for extension in extensions
+            }
+        else:
+            extensions = IMAGE_EXTENSIONS
+        seen = set()
+        images = []
+        for directory in settings.IMAGE_OPTIMIZATION_DIRS:
+            directory = Path(directory)
+            if not directory.exists():
+                continue
+            for path in sorted(directory.rglob("*")):
+                if path.suffix.lower() not in extensions:
+                    continue
+                if path.name.endswith(ANIMATED_SUFFIX):
+                    # Generated by convert_gifs; Pillow cannot recompress them.
+                    continue
+                resolved = path.resolve()
+                if resolved in seen:
+                    continue
+                seen.add(resolved)
+                images.append(resolved)
+        return images
+
+    def load_ledger(self, ledger_path):
+        if not ledger_path.exists():
+            return {}
+        try:
+            return json.loads(ledger_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"⚠ Ignoring unreadable ledger: {ledger_path}"
+                )
+            )
+            return {}
+
+    def save_ledger(self, ledger_path, ledger):
+        ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        ledger_path.write_text(
+            json.dumps(ledger, indent=2, sort_keys=True), encoding="utf-8"
+        )
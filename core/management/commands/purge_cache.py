@@ -0,0 +1,45 @@
+"""
+Management command to purge pages from the shared cache by surrogate key.
+
+Sends the keys to settings.CACHE_PURGE_URL, as content changes do
+automatically (see core/shared_cache.py for the keys).
+
+Usage:
+    python manage.py purge_cache --all
+    python manage.py purge_cache project-3 section-home
+"""
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+from core import shared_cache
+
+
+class Command(BaseCommand):
+    help = "Purge shared-cache pages tagged with the given surrogate keys"
+
+    def add_arguments(self, parser):
+        parser.add_argument("keys", nargs="*", help="Surrogate keys to purge")
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help=f"Purge every tagged page (key '{shared_cache.SITE_KEY}')",
+        )
+
+    def handle(self, *args, **options):
+        if not shared_cache.purge_enabled():
+            raise CommandError("Set CACHE_PURGE_URL to purge the shared cache")
+        keys = list(options["keys"])
+        if options["all"]:
+            keys.append(shared_cache.SITE_KEY)
+        if not keys:
+            raise CommandError("Give surrogate keys to purge or --all")
+
+        try:
+            status = shared_cache.purge(keys)
+        except requests.RequestException as exc:
+            raise CommandError(f"Purge failed: {exc}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Purged {' '.join(keys)} (HTTP {status})")
+        )
@@ -0,0 +1,37 @@
+"""
+Markdown rendering for project rich text.
+
+Project descriptions, challenges and learnings are written in Markdown.
+``render_markdown`` turns them into HTML once, when a project is saved, so
+detail pages emit stored markup instead of parsing text on every request.
+
+Raw HTML in the source is escaped rather than passed through, and links
+with unsafe schemes (``javascript:``, ``vbscript:``...) are left as text, so
+the output can be marked safe.
+"""
+
+from __future__ import annotations
+
+from markdown_it import MarkdownIt
+
+# CommonMark plus GFM tables and strikethrough. Single newlines become <br>
+# to match how the texts were displayed before Markdown support.
+_renderer = MarkdownIt("commonmark", {"breaks": True, "html": False}).enable(
+    ["table", "strikethrough"]
+)
+
+
+def render_markdown(text: str | None) -> str:
+    """
+    Render Markdown text to HTML.
+
+    Args:
+        text: Markdown source.
+
+    Returns:
+        str: HTML fragment (not marked safe), or "" for empty text.
+    """
+
+    if not text:
+        return ""
+    return _renderer.render(text).strip()
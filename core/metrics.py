@@ -0,0 +1,168 @@
+"""
+Prometheus metrics, served on /metrics to internal addresses.
+
+Gunicorn runs each worker in its own process. When the
+``PROMETHEUS_MULTIPROC_DIR`` environment variable is set (gunicorn_config.py)
+prometheus_client keeps the values of every worker in memory-mapped files in
+that directory, and the /metrics view merges them whichever worker answers
+the scrape. Without it (runserver, tests) values stay in the process.
+
+Hit ratios are computed when querying, e.g. for the page cache:
+
+    sum(rate(portfolio_page_cache_requests_total{result="hit"}[5m]))
+      / sum(rate(portfolio_page_cache_requests_total[5m]))
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import os
+import time
+
+from django.conf import settings
+from django.urls import Resolver404, resolve
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from core.warmup import memory_usage
+
+# Seconds a worker's memory reading is reused before /proc is read again.
+MEMORY_CHECK_INTERVAL = 15.0
+
+REQUEST_LATENCY = Histogram(
+    "portfolio_request_duration_seconds",
+    "Time to serve a request, body included, by route.",
+    ["route", "method", "status"],
+)
+RESPONSE_SIZE = Histogram(
+    "portfolio_response_size_bytes",
+    "Size of the response bodies, by route.",
+    ["route"],
+    buckets=(1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+DB_QUERIES = Histogram(
+    "portfolio_request_db_queries",
+    "Database queries run by a request, by route.",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+PAGE_CACHE = Counter(
+    "portfolio_page_cache_requests",
+    "Cacheable requests answered from the page cache (hit) or not (miss).",
+    ["result"],
+)
+VIEW_CACHE = Counter(
+    "portfolio_view_cache_requests",
+    "Lookups of the project sidebar and navigation caches.",
+    ["cache", "result"],
+)
+IMAGE_RESIZES = Gauge(
+    "portfolio_image_resizes_in_progress",
+    "Image resizes being rendered (see core/image_resize.py).",
+    multiprocess_mode="livesum",
+)
+WORKER_MEMORY = Gauge(
+    "portfolio_worker_memory_bytes",
+    "Memory of each worker: rss, pss and unique "
+    "(pages no other process shares).",
+    ["kind"],
+    multiprocess_mode="liveall",
+)
+
+_memory_checked_at = {"time": -MEMORY_CHECK_INTERVAL}
+
+
+def route_name(request) -> str:
+    """
+    Return the URL name of a request, a label of bounded cardinality.
+
+    Page cache hits are answered before URL resolution; their path is
+    resolved here.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return "unmatched"
+    return match.view_name
+
+
+def observe_request(route: str, method: str, status: int, timings) -> None:
+    """Record a completed request from its timings (core/server_timing.py)."""
+    REQUEST_LATENCY.labels(route, method, f"{status // 100}xx").observe(
+        time.perf_counter() - timings.started
+    )
+    RESPONSE_SIZE.labels(route).observe(timings.size)
+    DB_QUERIES.labels(route).observe(timings.db_count)
+    update_worker_memory()
+
+
+def count_page_cache(hit: bool) -> None:
+    PAGE_CACHE.labels("hit" if hit else "miss").inc()
+
+
+def count_view_cache(cache_name: str, hit: bool) -> None:
+    VIEW_CACHE.labels(cache_name, "hit" if hit else "miss").inc()
+
+
+def update_worker_memory() -> None:
+    """Refresh the memory gauges, at most once per MEMORY_CHECK_INTERVAL."""
+    now = time.monotonic()
+    if now - _memory_checked_at["time"] < MEMORY_CHECK_INTERVAL:
+        return
+    _memory_checked_at["time"] = now
+    for kind, kib in memory_usage().items():
+        WORKER_MEMORY.labels(kind).set(kib * 1024)
+
+
+def _in_networks(address: str, networks) -> bool:
+    try:
+        address = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(
+        address in ipaddress.ip_network(network, strict=False)
+        for network in networks
+        if network != "unix"
+    )
+
+
+def client_address(request) -> str:
+    """
+    Return the address of the client behind a request.
+
+    REMOTE_ADDR is the direct peer. Only when that peer is one of
+    METRICS_TRUSTED_PROXIES is the X-Real-IP header it sets used instead:
+    any other client could forge it. ``unix`` in that list trusts peers on
+    the unix socket (nginx in deploy/nginx.conf), which have no address.
+    """
+    peer = request.META.get("REMOTE_ADDR") or ""
+    proxies = settings.METRICS_TRUSTED_PROXIES
+    if (not peer and "unix" in proxies) or _in_networks(peer, proxies):
+        return request.META.get("HTTP_X_REAL_IP") or peer
+    return peer
+
+
+def is_internal(request) -> bool:
+    """Return True when the request comes from METRICS_ALLOWED_IPS."""
+    return _in_networks(client_address(request), settings.METRICS_ALLOWED_IPS)
+
+
+def render() -> tuple[bytes, str]:
+    """Return the metrics of every worker and their content type."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    update_worker_memory()
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,11 +1,59 @@
+import gzip
 import logging
+import time
 
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
 from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
 from django.db import connection, reset_queries
-from django.shortcuts import render
+from django.http import HttpResponse
+from django.middleware.cache import (
+    FetchFromCacheMiddleware,
+    UpdateCacheMiddleware,
+)
+from django.middleware.csrf import CsrfViewMiddleware
+from django.urls import Resolver404, resolve
+from django.utils.cache import cc_delim_re, patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from core import maintenance, metrics, preload, server_timing
+from core.localization.translation_service import (
+    activate_translator,
+    deactivate_translator,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
 
 logger = logging.getLogger("portfolio")
 
+# Content codings stored with each cached page, in order of preference.
+# Encoding happens once per cache store, so the slowest levels are used.
+PAGE_ENCODINGS = {
+    "gzip": lambda content: gzip.compress(content, compresslevel=9, mtime=0),
+}
+if brotli is not None:
+    PAGE_ENCODINGS = {
+        "br": lambda content: brotli.compress(content, quality=11),
+        **PAGE_ENCODINGS,
+    }
+# Only these responses are encoded (and, when streamed, cached).
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/xml",
+    "application/javascript",
+    "image/svg+xml",
+)
+
 
 class QueryCountDebugMiddleware:
     """
@@ -39,39 +87,300 @@ class QueryCountDebugMiddleware:
         return response
 
 
-class MaintenanceModeMiddleware:
+class AsyncCapableMiddleware:
     """
-    Display a maintenance page when MAINTENANCE_MODE setting is True.
-    Allows admin access.
+    Base for middleware running natively in both sync and async stacks.
+
+    Under ASGI, MiddlewareMixin runs every process_* hook in the thread
+    Django keeps for sync code. Subclasses implement ``__call__`` and
+    ``__acall__`` instead, so cheap checks stay on the event loop.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+class ServerTimingMiddleware(AsyncCapableMiddleware):
+    """
+    Report the database, cache, template and view time of each request in
+    a Server-Timing header (see core/server_timing.py), and log it as JSON
+    when SERVER_TIMING_LOG is on.
+
+    Must be the outermost middleware: page cache hits are timed too and
+    Django's page cache never stores the header. Responses that shared
+    caches may store (public, s-maxage) go without it, so nginx and CDNs
+    never replay stale timings; SERVER_TIMING_LOG still logs them. Streamed
+    pages render after the headers are sent; their log line is written
+    once the stream ends.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        server_timing.install_on_open_connections()
+        if self.async_mode:
+            # An async hook keeps process_view on the event loop.
+            self.process_view = self.aprocess_view
 
     def __call__(self, request):
-        if getattr(settings, "MAINTENANCE_MODE", False):
-            # Allow admin access and static files
-            if not (
-                request.path.startswith("/admin/")
-                or request.path.startswith("/static/")
-            ):
-                logger.info(
-                    f"Maintenance mode: Blocked access to {request.path}"
-                )
-                return render(request, "core/maintenance.html", status=503)
+        if self.async_mode:
+            return self.__acall__(request)
+        timings, token = server_timing.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            server_timing.stop(token)
+        return self.add_timings(request, response, timings)
 
-        return self.get_response(request)
+    async def __acall__(self, request):
+        timings, token = server_timing.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            server_timing.stop(token)
+        return self.add_timings(request, response, timings)
 
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self.start_view()
 
-class SecurityHeadersMiddleware:
-    """Add security headers like Content Security Policy."""
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self.start_view()
+
+    @staticmethod
+    def start_view():
+        timings = server_timing.current()
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+
+    def add_timings(self, request, response, timings):
+        timings.end_view()
+        if not self.shared_cacheable(response):
+            response["Server-Timing"] = timings.header()
+        if settings.SERVER_TIMING_LOG:
+            status, streamed = response.status_code, response.streaming
+            server_timing.when_complete(
+                response,
+                timings,
+                lambda timings: timings.log(
+                    request, status, bytes=timings.size, streamed=streamed
+                ),
+            )
+        return response
+
+    @staticmethod
+    def shared_cacheable(response):
+        """Return True when nginx or a CDN may store the response."""
+        cache_control = response.get("Cache-Control", "")
+        directives = {
+            directive.split("=", 1)[0].strip().lower()
+            for directive in cc_delim_re.split(cache_control)
+        }
+        return bool(directives & {"public", "s-maxage"})
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """
+    Record the latency, size and query count of each request for /metrics
+    (see core/metrics.py).
+
+    Goes right after ServerTimingMiddleware, whose timings it shares; it
+    opens its own when the Server-Timing header is off. Streamed pages are
+    recorded once their last chunk is sent.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        timings, token = self.open_timings()
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                server_timing.stop(token)
+        return self.record(request, response, timings)
+
+    async def __acall__(self, request):
+        timings, token = self.open_timings()
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                server_timing.stop(token)
+        return self.record(request, response, timings)
+
+    @staticmethod
+    def open_timings():
+        timings = server_timing.current()
+        if timings is not None:
+            return timings, None
+        return server_timing.start()
+
+    @staticmethod
+    def record(request, response, timings):
+        route, method, status = (
+            metrics.route_name(request),
+            request.method,
+            response.status_code,
+        )
+        server_timing.when_complete(
+            response,
+            timings,
+            lambda timings: metrics.observe_request(
+                route, method, status, timings
+            ),
+        )
+        return response
+
+
+class PreloadHintsMiddleware(AsyncCapableMiddleware):
+    """
+    Announce the critical assets of HTML pages in a Link header, and in a
+    103 Early Hints response sent before the view under ASGI servers that
+    support it (see core/preload.py).
+
+    Must come after the page cache middleware, so cached pages keep the
+    header.
+    """
 
     def __init__(self, get_response):
-        self.get_response = get_response
+        super().__init__(get_response)
+        if self.async_mode:
+            # Early hints can only be sent by the ASGI handler.
+            self.process_view = self.aprocess_view
 
     def __call__(self, request):
-        response = self.get_response(request)
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.add_links(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.add_links(request, await self.get_response(request))
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        links = preload.route_links(request.resolver_match.view_name)
+        if links:
+            await preload.send_early_hints(links)
+
+    @staticmethod
+    def add_links(request, response):
+        if response.status_code != 200 or not response.get(
+            "Content-Type", ""
+        ).startswith("text/html"):
+            return response
+        match = request.resolver_match
+        key = preload.template_key(response)
+        if match is not None:
+            # Pages from a view cache have lost their template names.
+            key = key or preload.route_template(match.view_name)
+            preload.remember_route(match.view_name, key)
+        if key is None:
+            return response
+
+        links = preload.template_links(key)
+        if links is None and response.streaming:
+            # The header is sent before the body: the next pages get it.
+            learn = (
+                preload.alearn_from_chunks
+                if response.is_async
+                else preload.learn_from_chunks
+            )
+            response.streaming_content = learn(
+                response.streaming_content, key, response.charset
+            )
+            return response
+        if links is None:
+            links = preload.learn(
+                key, response.content.decode(response.charset, "replace")
+            )
+        if links:
+            response["Link"] = ", ".join(links)
+        return response
+
+
+class TranslatorMiddleware(AsyncCapableMiddleware):
+    """
+    Bind the translator of the request language once per request.
+    Must come after LocaleMiddleware. Template tags and filters then use
+    request.translator instead of normalizing the language on every call.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        request.translator, token = activate_translator(
+            getattr(request, "LANGUAGE_CODE", None)
+        )
+        try:
+            return self.get_response(request)
+        finally:
+            deactivate_translator(token)
+
+    async def __acall__(self, request):
+        request.translator, token = activate_translator(
+            getattr(request, "LANGUAGE_CODE", None)
+        )
+        try:
+            return await self.get_response(request)
+        finally:
+            deactivate_translator(token)
+
+
+class MaintenanceModeMiddleware(AsyncCapableMiddleware):
+    """
+    Answer 503 with Retry-After while maintenance mode is on.
+
+    The flag can be flipped at runtime (see core/maintenance.py). The body
+    is pre-rendered per language and served from memory, so blocked
+    requests never reach the template engine. Admin, static files and
+    metrics stay reachable.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.blocked_response(request)
+        if response is not None:
+            return response
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        response = self.blocked_response(request)
+        if response is not None:
+            return response
+        return await self.get_response(request)
+
+    @staticmethod
+    def blocked_response(request):
+        retry_after = maintenance.retry_after()
+        if retry_after is None or request.path.startswith(
+            ("/admin/", "/metrics", settings.STATIC_URL)
+        ):
+            return None
+        language = getattr(request, "LANGUAGE_CODE", None)
+        response = HttpResponse(maintenance.page(language), status=503)
+        response["Retry-After"] = str(retry_after)
+        response["Cache-Control"] = "no-store"
+        return response
+
+
+class SecurityHeadersMiddleware(AsyncCapableMiddleware):
+    """Add security headers like Content Security Policy."""
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.add_headers(self.get_response(request))
 
+    async def __acall__(self, request):
+        return self.add_headers(await self.get_response(request))
+
+    @staticmethod
+    def add_headers(response):
         # Only add CSP in production
         if not settings.DEBUG and getattr(settings, 
                                           "CONTENT_SECURITY_POLICY", ""):
@@ -80,3 +389,279 @@ class SecurityHeadersMiddleware:
             )
 
         return response
+
+
+class PublicViewMiddleware(AsyncCapableMiddleware):
+    """
+    Route GET/HEAD requests for @public_view views around the session layer.
+
+    Resolves the URL up front and sets ``request.is_public_view``; the
+    Public* session, CSRF, authentication and messages middleware below it
+    then step aside, so nothing reads the session or issues cookies. Any
+    Set-Cookie or ``Vary: Cookie`` that still reaches it on a public
+    response is dropped (and logged), which keeps one page cache entry per
+    URL and language.
+    Must come after LocaleMiddleware and before the Public* middleware.
+    """
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        self.mark(request)
+        return self.strip_cookies(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        self.mark(request)
+        return self.strip_cookies(request, await self.get_response(request))
+
+    @staticmethod
+    def mark(request):
+        request.is_public_view = False
+        if request.method not in ("GET", "HEAD"):
+            return
+        try:
+            urlconf = getattr(request, "urlconf", None)
+            match = resolve(request.path_info, urlconf)
+        except Resolver404:
+            return
+        request.is_public_view = getattr(match.func, "public_view", False)
+
+    @staticmethod
+    def strip_cookies(request, response):
+        if not request.is_public_view:
+            return response
+        vary = []
+        if response.has_header("Vary"):
+            vary = cc_delim_re.split(response["Vary"])
+        if response.cookies or any(h.lower() == "cookie" for h in vary):
+            logger.warning(
+                f"Public view {request.path} tried to set cookies or Vary: "
+                "Cookie; dropped"
+            )
+            response.cookies.clear()
+            vary = [h for h in vary if h.lower() != "cookie"]
+            if vary:
+                response["Vary"] = ", ".join(vary)
+            else:
+                del response["Vary"]
+        return response
+
+
+class PublicViewBypassMixin:
+    """Skip a MiddlewareMixin middleware for requests to public views."""
+
+    def __call__(self, request):
+        if not self.async_mode and getattr(request, "is_public_view", False):
+            return self.get_response(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if getattr(request, "is_public_view", False):
+            return await self.get_response(request)
+        return await super().__acall__(request)
+
+
+class PublicSessionMiddleware(PublicViewBypassMixin, SessionMiddleware):
+    """SessionMiddleware that leaves public views without request.session."""
+
+
+class PublicCsrfViewMiddleware(PublicViewBypassMixin, CsrfViewMiddleware):
+    """CsrfViewMiddleware that never sets the CSRF cookie on public views."""
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if getattr(request, "is_public_view", False):
+            return None
+        return super().process_view(
+            request, callback, callback_args, callback_kwargs
+        )
+
+
+class PublicAuthenticationMiddleware(
+    PublicViewBypassMixin, AuthenticationMiddleware
+):
+    """AuthenticationMiddleware; public views render as anonymous."""
+
+
+class PublicMessageMiddleware(PublicViewBypassMixin, MessageMiddleware):
+    """MessageMiddleware that leaves public views without message storage."""
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoiseMiddleware that also runs in an async stack.
+
+    WhiteNoise is sync only, and a sync middleware at the top of the stack
+    would run every async view below it through the sync thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings=settings)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            find_file = sync_to_async(self.find_file)
+            static_file = await find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+class _BufferedResponse(HttpResponse):
+    """
+    Stand-in for a response while the cache decision is made.
+    UpdateCacheMiddleware defers storing renderable responses to their
+    post-render callbacks, which run once the full body is known.
+    """
+
+    def __init__(self, response):
+        super().__init__(status=response.status_code)
+        for header, value in response.items():
+            self[header] = value
+        self.cookies = response.cookies
+        self.callbacks = []
+
+    def render(self):
+        return self
+
+    def add_post_render_callback(self, callback):
+        self.callbacks.append(callback)
+
+
+class CachedPage(HttpResponse):
+    """
+    Cached response holding its body pre-encoded for each content coding.
+    Built once when a page is stored, so cache hits never compress.
+    """
+
+    def __init__(self, content, status=200):
+        super().__init__(content, status=status)
+        self.encoded = {
+            encoding: compress(content)
+            for encoding, compress in PAGE_ENCODINGS.items()
+        }
+
+    def for_request(self, request):
+        """Return the variant matching the request's Accept-Encoding."""
+        accepted = _accepted_encodings(
+            request.META.get("HTTP_ACCEPT_ENCODING", "")
+        )
+        for encoding, body in self.encoded.items():
+            if encoding in accepted:
+                response = HttpResponse(body, status=self.status_code)
+                for header, value in self.items():
+                    response[header] = value
+                response.cookies = self.cookies
+                response["Content-Encoding"] = encoding
+                response["Content-Length"] = str(len(body))
+                return response
+        return self
+
+
+def _accepted_encodings(header):
+    """Return the content codings an Accept-Encoding header allows."""
+    accepted = set()
+    for item in header.split(","):
+        encoding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=") if params else "1"
+        try:
+            if float(quality) > 0:
+                accepted.add(encoding.strip().lower())
+        except ValueError:
+            continue
+    if "*" in accepted:
+        accepted.update(PAGE_ENCODINGS)
+    return accepted
+
+
+class StreamingUpdateCacheMiddleware(UpdateCacheMiddleware):
+    """
+    UpdateCacheMiddleware storing pages as CachedPage, streamed ones included.
+    Streams are passed through unchanged while their chunks are buffered;
+    the full body is stored only if the client consumed the whole stream.
+    Other stored pages are answered with the client's encoded variant.
+    Responses get Vary: Accept-Encoding after the cache key is learned, so
+    one cache entry serves every encoding.
+    """
+
+    def process_response(self, request, response):
+        if (
+            response.status_code != 200
+            or response.has_header("Content-Encoding")
+            or not response.get("Content-Type", "").startswith(
+                COMPRESSIBLE_TYPES
+            )
+        ):
+            return super().process_response(request, response)
+
+        buffered = _BufferedResponse(response)
+        super().process_response(request, buffered)
+        for header, value in buffered.items():
+            response[header] = value
+        if not buffered.callbacks:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if response.streaming:
+            store_when_complete = (
+                self._astore_when_complete
+                if response.is_async
+                else self._store_when_complete
+            )
+            response.streaming_content = store_when_complete(
+                response.streaming_content, buffered
+            )
+            return response
+        # The page was just encoded for the cache; send the client's variant.
+        return self._store(buffered, response.content).for_request(request)
+
+    def _store_when_complete(self, chunks, buffered):
+        body = []
+        for chunk in chunks:
+            body.append(chunk)
+            yield chunk
+        self._store(buffered, b"".join(body))
+
+    async def _astore_when_complete(self, chunks, buffered):
+        body = []
+        async for chunk in chunks:
+            body.append(chunk)
+            yield chunk
+        await sync_to_async(self._store)(buffered, b"".join(body))
+
+    @staticmethod
+    def _store(buffered, content):
+        page = CachedPage(content, status=buffered.status_code)
+        for header, value in buffered.items():
+            page[header] = value
+        page.cookies = buffered.cookies
+        patch_vary_headers(page, ("Accept-Encoding",))
+        for callback in buffered.callbacks:
+            callback(page)
+        return page
+
+
+class CompressedFetchFromCacheMiddleware(FetchFromCacheMiddleware):
+    """FetchFromCacheMiddleware serving the encoding a client accepts."""
+
+    def process_request(self, request):
+        response = super().process_request(request)
+        if response is not None:
+            metrics.count_page_cache(hit=True)
+        elif request._cache_update_cache:
+            metrics.count_page_cache(hit=False)
+        if isinstance(response, CachedPage):
+            return response.for_request(request)
+        return response
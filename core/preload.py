@@ -0,0 +1,181 @@
+"""
+Preload hints for the critical assets of each page template.
+
+The stylesheets and blocking scripts of a page's <head> are only found by
+the browser once the HTML arrives. ``PreloadHintsMiddleware`` announces
+them earlier:
+
+    Link header      on every HTML page: ``rel=preload`` for our own files,
+                     ``rel=preconnect`` for third-party origins (fonts...)
+    103 Early Hints  sent before the view runs, when the ASGI server offers
+                     the ``http.response.early_hint`` extension
+
+The list is read once per template from the first page rendered with it,
+so the URLs are the ones {% static %} and {% compress %} produced from the
+whitenoise and compressor manifests. Early hints are keyed by route: a
+route's template is only known once it has been rendered. Pages served
+from a view cache have no template name and are keyed by route.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+
+EARLY_HINT_EXTENSION = "http.response.early_hint"
+
+# Origins whose stylesheets load font files from another origin; fonts are
+# fetched in CORS mode, so that connection needs the crossorigin flag.
+FONT_ORIGINS = {
+    "https://fonts.googleapis.com": "https://fonts.gstatic.com",
+    "https://api.fontshare.com": "https://cdn.fontshare.com",
+}
+
+_template_links: dict[tuple[str, ...], list[str]] = {}
+_route_templates: dict[str, tuple[str, ...]] = {}
+_send: ContextVar = ContextVar("early_hints_send", default=None)
+
+
+class _HeadParser(HTMLParser):
+    """Collect the stylesheets and blocking scripts of an HTML <head>."""
+
+    def __init__(self):
+        super().__init__()
+        self.assets = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "link" and attrs.get("href"):
+            if "stylesheet" in (attrs.get("rel") or "").lower().split():
+                self.assets.append((attrs["href"], "style"))
+        elif tag == "script" and attrs.get("src"):
+            deferred = {"async", "defer"} & attrs.keys()
+            if not deferred and attrs.get("type") != "module":
+                self.assets.append((attrs["src"], "script"))
+
+
+def critical_links(head: str) -> list[str]:
+    """
+    Return the Link header values announcing the assets of an HTML <head>.
+
+    Same-origin stylesheets and scripts are preloaded; third-party ones get
+    a preconnect to their origin, plus one to their font origin.
+    """
+
+    parser = _HeadParser()
+    parser.feed(head)
+    preloads = []
+    origins = {}
+    for url, destination in parser.assets:
+        parts = urlsplit(url)
+        if not parts.netloc:
+            preloads.append(f"<{url}>; rel=preload; as={destination}")
+            continue
+        origin = f"{parts.scheme or 'https'}://{parts.netloc}"
+        origins.setdefault(origin, False)
+        if origin in FONT_ORIGINS:
+            origins[FONT_ORIGINS[origin]] = True
+    return [
+        *(
+            f"<{origin}>; rel=preconnect" + ("; crossorigin" if cors else "")
+            for origin, cors in origins.items()
+        ),
+        *preloads,
+    ]
+
+
+def template_key(response) -> tuple[str, ...] | None:
+    """Return the template names a page response was rendered from."""
+    names = getattr(response, "template_name", None)
+    if not names:
+        return None
+    if isinstance(names, str):
+        return (names,)
+    if isinstance(names, (list, tuple)):
+        return tuple(names)
+    return None
+
+
+def learn(key: tuple[str, ...], html: str) -> list[str] | None:
+    """Store the links of a template from a page rendered with it."""
+    head, found, _body = html.partition("</head>")
+    if not found:
+        return None
+    links = _template_links[key] = critical_links(head)
+    return links
+
+
+def learn_from_chunks(chunks, key: tuple[str, ...], charset: str):
+    """Pass a streamed page through, learning its links once <head> is sent."""
+    head = b""
+    for chunk in chunks:
+        if head is not None:
+            head += chunk
+            if b"</head>" in head:
+                learn(key, head.decode(charset, "replace"))
+                head = None
+        yield chunk
+
+
+async def alearn_from_chunks(chunks, key: tuple[str, ...], charset: str):
+    head = b""
+    async for chunk in chunks:
+        if head is not None:
+            head += chunk
+            if b"</head>" in head:
+                learn(key, head.decode(charset, "replace"))
+                head = None
+        yield chunk
+
+
+def route_template(route: str) -> tuple[str, ...]:
+    """Return the template key of a route, the route itself if unknown."""
+    return _route_templates.get(route, (f"route:{route}",))
+
+
+def remember_route(route: str, key: tuple[str, ...]) -> None:
+    """Record the template a route renders, for its next early hints."""
+    _route_templates[route] = key
+
+
+def template_links(key: tuple[str, ...]) -> list[str] | None:
+    """Return the stored links of a template; always relearned under DEBUG."""
+    if settings.DEBUG:
+        return None
+    return _template_links.get(key)
+
+
+def route_links(route: str) -> list[str] | None:
+    key = _route_templates.get(route)
+    return None if key is None else template_links(key)
+
+
+async def send_early_hints(links: list[str]) -> bool:
+    """Send a 103 Early Hints response if the ASGI server supports it."""
+    send = _send.get()
+    if send is None or not links:
+        return False
+    await send(
+        {
+            "type": EARLY_HINT_EXTENSION,
+            "links": [link.encode() for link in links],
+        }
+    )
+    return True
+
+
+class EarlyHintsASGIHandler(ASGIHandler):
+    """ASGIHandler exposing ``send`` to send_early_hints for the request."""
+
+    async def handle(self, scope, receive, send):
+        if EARLY_HINT_EXTENSION not in (scope.get("extensions") or {}):
+            return await super().handle(scope, receive, send)
+        token = _send.set(send)
+        try:
+            return await super().handle(scope, receive, send)
+        finally:
+            _send.reset(token)
@@ -0,0 +1,273 @@
+"""
+Per-request timing of the database, cache, templates and view.
+
+``ServerTimingMiddleware`` opens a ``RequestTimings`` for each request in a
+context variable, which follows the request into the thread async views
+run their ORM calls in. Three probes add to it while it is open:
+
+    database   an execute wrapper on every connection (connection_created)
+    cache      the CacheTimingMixin of the cache backends
+               (core/cache_backends.py)
+    templates  the TimedDjangoTemplates backend (core/template_backends.py)
+
+The result is sent as a ``Server-Timing`` header, visible in the browser's
+network panel, and logged as one JSON line when ``SERVER_TIMING_LOG`` is
+on. Outside a request the probes cost one context variable lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+logger = logging.getLogger("portfolio.timing")
+
+_current: ContextVar[RequestTimings | None] = ContextVar(
+    "server_timing", default=None
+)
+_MISSING = object()
+
+
+class RequestTimings:
+    """Durations (seconds) and counters collected during one request."""
+
+    __slots__ = (
+        "started",
+        "view_started",
+        "view",
+        "db",
+        "db_count",
+        "cache",
+        "cache_hits",
+        "cache_misses",
+        "template",
+        "size",
+        "on_complete",
+    )
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.view = None
+        self.db = 0.0
+        self.db_count = 0
+        self.cache = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template = 0.0
+        self.size = None
+        self.on_complete = None
+
+    def end_view(self) -> None:
+        """Close the view phase: from process_view to the returned response."""
+        if self.view_started is not None and self.view is None:
+            self.view = (
+                time.perf_counter() - self.view_started - self.template
+            )
+
+    def metrics(self) -> list[tuple[str, float | None, int | None]]:
+        """Return (name, duration in ms, count) of each measured phase."""
+        total = (time.perf_counter() - self.started) * 1000
+        metrics = [
+            ("db", self.db * 1000, None),
+            ("db-count", None, self.db_count),
+            ("cache", self.cache * 1000, None),
+            ("cache-hit", None, self.cache_hits),
+            ("cache-miss", None, self.cache_misses),
+        ]
+        if self.template:
+            metrics.append(("tpl", self.template * 1000, None))
+        if self.view is not None:
+            metrics.append(("view", self.view * 1000, None))
+        metrics.append(("total", total, None))
+        return metrics
+
+    def header(self) -> str:
+        """Return the Server-Timing header value."""
+        return ", ".join(
+            (
+                f"{name};dur={duration:.1f}"
+                if count is None
+                else f"{name};desc={count}"
+            )
+            for name, duration, count in self.metrics()
+        )
+
+    def log(self, request, status, **extra) -> None:
+        """Log the timings of a request as one JSON line."""
+        line = {
+            "method": request.method,
+            "path": request.path,
+            "status": status,
+            **{
+                f"{name}_ms" if count is None else name: (
+                    round(duration, 1) if count is None else count
+                )
+                for name, duration, count in self.metrics()
+            },
+            **extra,
+        }
+        logger.info(json.dumps(line))
+
+
+def current() -> RequestTimings | None:
+    """Return the timings of the current request, if one is being timed."""
+    return _current.get()
+
+
+def start():
+    """Open the timings of a request; return them and the reset token."""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def stop(token) -> None:
+    _current.reset(token)
+
+
+def when_complete(response, timings, callback) -> None:
+    """
+    Call ``callback(timings)`` once the body of ``response`` is complete.
+
+    Streamed bodies render after the headers are sent: their chunks are run
+    with the timings open (template and query time count for the request)
+    and ``timings.size`` is set to the bytes sent before the callbacks run.
+    """
+    if not response.streaming:
+        timings.size = len(response.content)
+        callback(timings)
+        return
+    if timings.on_complete is None:
+        timings.on_complete = []
+        if response.is_async:
+            response.streaming_content = _atimed_chunks(
+                response.streaming_content, timings
+            )
+        else:
+            response.streaming_content = _timed_chunks(
+                response.streaming_content, timings
+            )
+    timings.on_complete.append(callback)
+
+
+def _timed_chunks(chunks, timings):
+    chunks = iter(chunks)
+    size = 0
+    while True:
+        token = _current.set(timings)
+        start_time = time.perf_counter()
+        try:
+            chunk = next(chunks, None)
+        finally:
+            timings.template += time.perf_counter() - start_time
+            _current.reset(token)
+        if chunk is None:
+            break
+        size += len(chunk)
+        yield chunk
+    _complete(timings, size)
+
+
+async def _atimed_chunks(chunks, timings):
+    chunks = aiter(chunks)
+    size = 0
+    while True:
+        token = _current.set(timings)
+        start_time = time.perf_counter()
+        try:
+            chunk = await anext(chunks, None)
+        finally:
+            timings.template += time.perf_counter() - start_time
+            _current.reset(token)
+        if chunk is None:
+            break
+        size += len(chunk)
+        yield chunk
+    _complete(timings, size)
+
+
+def _complete(timings, size):
+    timings.size = size
+    for callback in timings.on_complete:
+        callback(timings)
+
+
+def time_query(execute, sql, params, many, context):
+    """Execute wrapper adding each query to the current request's timings."""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start_time = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db += time.perf_counter() - start_time
+        timings.db_count += 1
+
+
+@receiver(connection_created)
+def install_query_timer(sender=None, connection=None, **kwargs):
+    """Add time_query to a database connection, once."""
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+def install_on_open_connections() -> None:
+    """Add time_query to the connections this thread opened already."""
+    for connection in connections.all(initialized_only=True):
+        install_query_timer(connection=connection)
+
+
+class CacheTimingMixin:
+    """
+    Count cache hits and misses and time cache calls of the current request.
+
+    Mixed into cache backends before the backend class. Async calls go
+    through the sync methods (BaseCache.aget...), so they are counted too.
+    """
+
+    def get(self, key, default=None, version=None, **kwargs):
+        timings = _current.get()
+        if timings is None:
+            return super().get(key, default, version=version, **kwargs)
+        start_time = time.perf_counter()
+        value = super().get(key, _MISSING, version=version, **kwargs)
+        timings.cache += time.perf_counter() - start_time
+        if value is _MISSING:
+            timings.cache_misses += 1
+            return default
+        timings.cache_hits += 1
+        return value
+
+    def get_many(self, keys, version=None, **kwargs):
+        timings = _current.get()
+        if timings is None:
+            return super().get_many(keys, version=version, **kwargs)
+        keys = list(keys)
+        start_time = time.perf_counter()
+        # BaseCache.get_many loops over get(); count each key once.
+        token = _current.set(None)
+        try:
+            values = super().get_many(keys, version=version, **kwargs)
+        finally:
+            _current.reset(token)
+        timings.cache += time.perf_counter() - start_time
+        timings.cache_hits += len(values)
+        timings.cache_misses += len(keys) - len(values)
+        return values
+
+    def set(self, *args, **kwargs):
+        timings = _current.get()
+        if timings is None:
+            return super().set(*args, **kwargs)
+        start_time = time.perf_counter()
+        try:
+            return super().set(*args, **kwargs)
+        finally:
+            timings.cache += time.perf_counter() - start_time
@@ -0,0 +1,213 @@
+"""
+Headers and purging for shared caches in front of Django.
+
+Public pages are tagged with surrogate keys naming what they show, sent as
+``Surrogate-Key`` (space separated, Fastly, Varnish) and ``Cache-Tag``
+(comma separated, Cloudflare), with a ``Cache-Control`` allowing shared
+caches (nginx proxy_cache, a CDN) to keep them ``SHARED_CACHE_SECONDS`` and
+serve them stale while refetching.
+
+Keys:
+    site                  every tagged page
+    section-<name>        one section page (home, ai, cli, django, about...)
+    projects              pages listing or counting the published projects
+    technologies          pages listing every technology
+    categories            pages listing every category
+    project-<pk>          pages showing a project
+    technology-<pk>       pages showing a technology
+    category-<pk>         pages showing a category
+
+Content changes queue the keys to purge (projects/signals.py); they are
+POSTed to ``CACHE_PURGE_URL`` once the transaction commits, batched over
+``PURGE_DELAY`` seconds. ``manage.py purge_cache`` purges by hand.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+
+logger = logging.getLogger("portfolio")
+
+SITE_KEY = "site"
+PROJECTS_KEY = "projects"
+TECHNOLOGIES_KEY = "technologies"
+CATEGORIES_KEY = "categories"
+
+# Seconds to wait for more changes before sending a purge.
+PURGE_DELAY = 2.0
+PURGE_TIMEOUT = 10
+
+_pending = {}
+_timer = None
+_lock = threading.Lock()
+
+
+def section_key(name: str) -> str:
+    return f"section-{name}"
+
+
+def project_key(pk) -> str:
+    return f"project-{pk}"
+
+
+def technology_key(pk) -> str:
+    return f"technology-{pk}"
+
+
+def category_key(pk) -> str:
+    return f"category-{pk}"
+
+
+def project_keys(projects) -> list[str]:
+    """
+    Return the keys of projects shown on a page.
+
+    Includes their category and, when prefetched, their technologies;
+    nothing is queried, so async views can call it.
+    """
+
+    keys = []
+    for project in projects:
+        keys.append(project_key(project.pk))
+        if project.category_id:
+            keys.append(category_key(project.category_id))
+        prefetched = getattr(project, "_prefetched_objects_cache", {})
+        for technology in prefetched.get("technologies", ()):
+            keys.append(technology_key(technology.pk))
+    return keys
+
+
+def tag_response(response, keys):
+    """
+    Add the surrogate keys and shared-cache headers to a public response.
+
+    Args:
+        response: Response of a public view.
+        keys: Surrogate keys of the page; ``site`` is always added.
+    """
+
+    keys = list(dict.fromkeys([SITE_KEY, *keys]))
+    response["Surrogate-Key"] = " ".join(keys)
+    response["Cache-Tag"] = ",".join(keys)
+    if settings.SHARED_CACHE_SECONDS:
+        patch_cache_control(
+            response,
+            public=True,
+            s_maxage=settings.SHARED_CACHE_SECONDS,
+            stale_while_revalidate=settings.SHARED_CACHE_STALE_SECONDS,
+        )
+    return response
+
+
+class SurrogateKeyMixin:
+    """
+    Tag the response of a TemplateResponseMixin view with surrogate keys.
+
+    Add before the view class. ``get_surrogate_keys`` receives the context,
+    so the sync and async variants of a view tag the same keys.
+    """
+
+    surrogate_keys = ()
+
+    def get_surrogate_keys(self, context):
+        return list(self.surrogate_keys)
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        return tag_response(response, self.get_surrogate_keys(context))
+
+
+def project_change_keys(project) -> list[str]:
+    """
+    Return the keys to purge when a project is saved.
+
+    Pages already showing it carry its key; the detail pages it may now
+    appear on (similar project, previous/next) carry their own project's.
+    """
+
+    return [
+        project_key(project.pk),
+        PROJECTS_KEY,
+        *(project_key(other.pk) for other in project.get_linked_projects()),
+    ]
+
+
+def purge_enabled() -> bool:
+    """Return whether content changes are purged from the shared cache."""
+    return bool(settings.CACHE_PURGE_URL)
+
+
+def purge(keys) -> int:
+    """
+    Ask the shared cache to drop the pages tagged with any of ``keys``.
+
+    Sends the keys both as a ``Surrogate-Key`` header and as a JSON body
+    ``{"tags": [...]}``, with ``CACHE_PURGE_TOKEN`` as bearer token.
+
+    Returns:
+        int: HTTP status of the purge endpoint.
+
+    Raises:
+        requests.RequestException: The endpoint failed or refused the purge.
+    """
+
+    keys = list(dict.fromkeys(keys))
+    headers = {"Surrogate-Key": " ".join(keys)}
+    if settings.CACHE_PURGE_TOKEN:
+        headers["Authorization"] = f"Bearer {settings.CACHE_PURGE_TOKEN}"
+    response = requests.post(
+        settings.CACHE_PURGE_URL,
+        json={"tags": keys},
+        headers=headers,
+        timeout=PURGE_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.status_code
+
+
+def schedule_purge(keys) -> None:
+    """
+    Queue keys for purging once the current transaction commits.
+
+    Does nothing unless ``CACHE_PURGE_URL`` is set. Keys queued within
+    ``PURGE_DELAY`` seconds are sent in one request from a background
+    thread, so saving a project never waits on the purge endpoint.
+    """
+
+    if not purge_enabled():
+        return
+    keys = list(keys)
+    transaction.on_commit(lambda: _queue(keys))
+
+
+def _queue(keys):
+    global _timer
+    with _lock:
+        _pending.update(dict.fromkeys(keys))
+        if _timer is None:
+            _timer = threading.Timer(PURGE_DELAY, _send_pending)
+            _timer.daemon = True
+            _timer.start()
+
+
+def _send_pending():
+    global _timer
+    with _lock:
+        keys = list(_pending)
+        _pending.clear()
+        _timer = None
+
+    if not keys:
+        return
+    try:
+        purge(keys)
+    except requests.RequestException as exc:
+        logger.error(f"Could not purge {len(keys)} surrogate key(s): {exc}")
+    else:
+        logger.info(f"Purged surrogate keys: {' '.join(keys)}")
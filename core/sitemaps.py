@@ -7,13 +7,19 @@ class StaticViewSitemap(Sitemap):
 
     priority = 0.9
     changefreq = "weekly"
+    # One entry per language, each listing the others as hreflang alternates.
+    i18n = True
+    alternates = True
+    x_default = True
 
     def items(self):
         return [
             "core:home",
+            "core:ai",
+            "core:cli",
+            "core:django",
             "core:about",
             "core:skills",
-            "core:contact",
             "projects:list",
         ]
 
@@ -141,6 +141,30 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 
 
+// Play animated card/gallery art only while visible (poster frame otherwise)
+document.addEventListener('DOMContentLoaded', () => {
+  const animatedImages = document.querySelectorAll('img[data-animated-src]');
+  if (animatedImages.length === 0) return;
+  if (!('IntersectionObserver' in window)) return;
+  if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+
+  const observer = new IntersectionObserver(
+    (entries) => {
+      entries.forEach((entry) => {
+        const img = entry.target;
+        if (!img.dataset.posterSrc) {
+          img.dataset.posterSrc = img.currentSrc || img.src;
+        }
+        img.src = entry.isIntersecting ? img.dataset.animatedSrc : img.dataset.posterSrc;
+      });
+    },
+    { threshold: 0.25 }
+  );
+
+  animatedImages.forEach((img) => observer.observe(img));
+});
+
+
 // Animate skill bars on scroll (for about page)
 document.addEventListener('DOMContentLoaded', () => {
   const skillBars = document.querySelectorAll('.skill-bar');
@@ -0,0 +1,335 @@
+"""
+Static export of the public site.
+
+``manage.py build_static_site`` renders every public page in every language
+into ``STATIC_SITE_ROOT`` with gzip and brotli siblings, laid out for nginx
+to serve directly by request path (see deploy/nginx.conf):
+
+    <root>/<language>/<path>/index.html          page without query string
+    <root>/<language>/<path>/index@<query>.html  list filter variants
+    <root>/sitemap.xml, robots.txt
+    <root>/nginx-headers.conf                    security headers for nginx
+
+Pages are localized by their /<language>/ URL prefix. Anything not exported
+(the root language redirect, admin, language switch, free-text search...)
+falls through to Django. When an export exists, project, technology and
+category changes schedule an incremental rebuild of the affected pages only
+(see projects/signals.py); the rebuild runs out of process after the
+transaction commits so saving in the admin is not slowed down, and a
+background thread of the worker waits for it to finish.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import reverse
+from django.utils import translation
+
+logger = logging.getLogger("portfolio")
+
+PAGE_FILE = "index.html"
+HEADERS_FILE = "nginx-headers.conf"
+# Headers the middleware adds to every page; nginx repeats them on exported
+# pages, which it serves without going through Django.
+SECURITY_HEADERS = (
+    "Content-Security-Policy",
+    "Strict-Transport-Security",
+    "Cross-Origin-Opener-Policy",
+    "X-Frame-Options",
+    "X-Content-Type-Options",
+    "Referrer-Policy",
+)
+# Sibling suffix of each encoding stored next to an exported file.
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+LIST_SORTS = ("order", "recent", "title")
+
+# Seconds to wait for more changes before starting an incremental rebuild.
+REBUILD_DELAY = 2.0
+
+_pending = {"pages": {}, "projects": {}, "removed": {}, "full": False}
+_timer = None
+_lock = threading.Lock()
+
+# Pages that show project lists or counts, re-rendered on any project change.
+LISTING_ROUTES = ("core:home", "core:ai", "core:cli", "core:django")
+SECTION_ROUTES = (*LISTING_ROUTES, "core:about", "core:skills")
+
+
+def export_root() -> Path | None:
+    """Return the export directory, or None when static export is off."""
+    root = getattr(settings, "STATIC_SITE_ROOT", "")
+    return Path(root) if root else None
+
+
+def export_languages() -> list[str]:
+    """Return the language codes every page is exported in."""
+    return [code for code, _name in settings.LANGUAGES]
+
+
+def each_language(build) -> list[str]:
+    """Return the pages ``build()`` lists, once per exported language."""
+    pages = []
+    for language in export_languages():
+        with translation.override(language):
+            pages += build()
+    return pages
+
+
+def page_file(root: Path, page: str) -> Path:
+    """
+    Return the file a page is exported to.
+
+    Args:
+        root: Export directory.
+        page: Path with optional query string, e.g.
+            ``/en/projects/?category=cli``.
+    """
+
+    path, _, query = page.partition("?")
+    directory = root / path.strip("/")
+    if not path.endswith("/"):
+        return directory
+    return directory / (f"index@{query}.html" if query else PAGE_FILE)
+
+
+def list_pages() -> list[str]:
+    """
+    Return the project list pages of the active language: filter variants
+    and their pagination.
+
+    Query strings are spelled exactly as the filter form and the pagination
+    links produce them, since nginx matches the raw query string.
+    """
+
+    from projects.models import Category, Project, Technology
+
+    list_url = reverse("projects:list")
+    published = Project.published.all()
+    category_slugs = list(
+        Category.objects.filter(projects__in=published)
+        .distinct()
+        .values_list("slug", flat=True)
+    )
+    tech_slugs = list(
+        Technology.objects.filter(projects__in=published)
+        .distinct()
+        .values_list("slug", flat=True)
+    )
+
+    pages = [list_url]
+    # Filter form: selects submit q, category and sort, checkboxes add tech.
+    for category in ["", *category_slugs]:
+        for sort in LIST_SORTS:
+            form = {"q": "", "category": category, "sort": sort}
+            pages.append(f"{list_url}?{urlencode(form)}")
+    for tech in tech_slugs:
+        form = {"q": "", "category": "", "sort": "order", "tech": tech}
+        pages.append(f"{list_url}?{urlencode(form)}")
+
+    # Category sitemap entries and pagination links.
+    filters = [{}]
+    filters += [{"category": category} for category in category_slugs]
+    filters += [{"tech": tech} for tech in tech_slugs]
+    for params in filters:
+        queryset = published
+        if "category" in params:
+            queryset = queryset.filter(category__slug=params["category"])
+            pages.append(f"{list_url}?{urlencode(params)}")
+        if "tech" in params:
+            queryset = queryset.filter(technologies__slug=params["tech"])
+        page_count = math.ceil(queryset.count() / settings.PROJECTS_PER_PAGE)
+        for number in range(2, page_count + 1):
+            pages.append(f"{list_url}?{urlencode({'page': number, **params})}")
+    return pages
+
+
+def listing_pages() -> list[str]:
+    """Return every page that lists projects."""
+    return [
+        *each_language(
+            lambda: [
+                *(reverse(route) for route in LISTING_ROUTES),
+                *list_pages(),
+            ]
+        ),
+        reverse("sitemap"),
+    ]
+
+
+def site_pages() -> list[str]:
+    """Return every exported page."""
+    from projects.models import Project
+
+    projects = list(Project.published.all())
+    return [
+        *each_language(
+            lambda: [
+                *(reverse(route) for route in SECTION_ROUTES),
+                *list_pages(),
+                *(project.get_absolute_url() for project in projects),
+            ]
+        ),
+        reverse("sitemap"),
+        reverse("robots"),
+    ]
+
+
+def project_pages(project) -> list[str]:
+    """Return the detail page of a project in every language."""
+    return each_language(lambda: [project.get_absolute_url()])
+
+
+def pages_for_project(project) -> list[str]:
+    """
+    Return the pages showing a project.
+
+    Covers its own page, the listing pages, the detail pages that may show
+    it as a similar project (same category or a shared technology) and its
+    previous/next neighbours.
+    """
+
+    others = project.get_linked_projects()
+    own = project_pages(project) if project.is_published else []
+    details = each_language(
+        lambda: sorted({other.get_absolute_url() for other in others})
+    )
+    return [*own, *details, *listing_pages()]
+
+
+def write_page(root: Path, page: str, content: bytes) -> list[Path]:
+    """
+    Write a page and its encoded siblings atomically.
+
+    Returns:
+        list[Path]: Files written.
+    """
+
+    from core.middleware import PAGE_ENCODINGS
+
+    target = page_file(root, page)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    written = [(target, content)]
+    for encoding, compress in PAGE_ENCODINGS.items():
+        sibling = target.with_name(target.name + ENCODING_SUFFIXES[encoding])
+        written.append((sibling, compress(content)))
+
+    for path, data in written:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    return [path for path, _data in written]
+
+
+def write_headers(root: Path, response) -> Path:
+    """
+    Write the nginx ``add_header`` lines of the security headers of a page.
+
+    The values are taken from a rendered page, so the export is served with
+    the headers the middleware would have sent.
+    """
+
+    lines = [
+        f'add_header {header} "{_nginx_quote(response[header])}" always;\n'
+        for header in SECURITY_HEADERS
+        if response.has_header(header)
+    ]
+    path = root / HEADERS_FILE
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text("".join(lines))
+    os.replace(tmp_path, path)
+    return path
+
+
+def _nginx_quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def remove_page(root: Path, page: str) -> int:
+    """Remove an exported page and its siblings; return the files removed."""
+    target = page_file(root, page)
+    removed = 0
+    for suffix in ("", *ENCODING_SUFFIXES.values()):
+        path = target.with_name(target.name + suffix)
+        if path.exists():
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def schedule_rebuild(pages=(), projects=(), removed=(), full=False) -> None:
+    """
+    Queue exported pages for re-rendering once the current transaction commits.
+
+    Does nothing unless an export exists. Requests arriving within
+    ``REBUILD_DELAY`` seconds are merged and handed to a single
+    ``build_static_site`` process, so bulk edits (load_projects, m2m
+    updates) trigger one rebuild.
+
+    Args:
+        pages: Pages to re-render.
+        projects: Primary keys of projects whose pages to re-render.
+        removed: Pages to delete from the export.
+        full: Rebuild the whole export instead.
+    """
+
+    root = export_root()
+    if root is None or not root.is_dir():
+        return
+    transaction.on_commit(lambda: _queue(pages, projects, removed, full))
+
+
+def _queue(pages, projects, removed, full):
+    global _timer
+    with _lock:
+        _pending["pages"].update(dict.fromkeys(pages))
+        _pending["projects"].update(dict.fromkeys(projects))
+        _pending["removed"].update(dict.fromkeys(removed))
+        _pending["full"] = _pending["full"] or full
+        if _timer is None:
+            _timer = threading.Timer(REBUILD_DELAY, _launch_rebuild)
+            _timer.daemon = True
+            _timer.start()
+
+
+def _launch_rebuild():
+    global _timer
+    with _lock:
+        pending = dict(_pending)
+        _pending.update(pages={}, projects={}, removed={}, full=False)
+        _timer = None
+
+    command = [
+        sys.executable,
+        str(Path(settings.BASE_DIR) / "manage.py"),
+        "build_static_site",
+    ]
+    if not pending["full"]:
+        for page in pending["pages"]:
+            command += ["--page", page]
+        for project_id in pending["projects"]:
+            command += ["--project", str(project_id)]
+        for page in pending["removed"]:
+            command += ["--remove", page]
+    # Runs in the timer thread, which waits for the rebuild and reaps it.
+    try:
+        result = subprocess.run(
+            command, cwd=settings.BASE_DIR, start_new_session=True, check=False
+        )
+    except OSError as exc:
+        logger.error(f"Could not start static site rebuild: {exc}")
+        return
+    if result.returncode:
+        logger.error(
+            f"Static site rebuild failed with exit code {result.returncode}"
+        )
@@ -0,0 +1,207 @@
+"""
+Streaming template rendering.
+
+A regular TemplateResponse renders the whole page into one string before
+the first byte is sent, so the browser cannot start fetching the CSS and
+fonts referenced from <head> until the slowest part of the page is done.
+
+``StreamingTemplateMixin`` renders the page as a ``StreamingHttpResponse``
+instead, flushing the output at each ``{% stream_flush %}`` placed at the
+top level of a template (``core/base.html`` flushes after the navbar).
+Streaming is opt-in per view and globally gated by the
+``STREAM_HTML_RESPONSES`` setting. Async views stream through an async
+iterator that renders each chunk in the sync thread.
+``core.middleware.StreamingUpdateCacheMiddleware`` buffers streamed pages
+and caches their full body.
+"""
+
+from __future__ import annotations
+
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.template import loader
+from django.template.base import Node, TextNode
+from django.template.context import make_context
+from django.template.loader_tags import (
+    BLOCK_CONTEXT_KEY,
+    BlockContext,
+    BlockNode,
+    ExtendsNode,
+)
+from django.utils import translation
+
+from core.localization.translation_service import (
+    activate_translator,
+    deactivate_translator,
+)
+
+# Marker yielded by _iter_template where the output should be flushed.
+_FLUSH = object()
+
+
+class FlushNode(Node):
+    """Node of ``{% stream_flush %}``: renders nothing, marks a flush point."""
+
+    def render(self, context):
+        return ""
+
+
+def _add_root_blocks(extends_node, parent, context):
+    """Register the blocks of an extends chain, as ExtendsNode.render does."""
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(extends_node.blocks)
+
+    for node in parent.nodelist:
+        # The ExtendsNode has to be the first non-text node.
+        if not isinstance(node, TextNode):
+            if not isinstance(node, ExtendsNode):
+                blocks = parent.nodelist.get_nodes_by_type(BlockNode)
+                block_context.add_blocks({n.name: n for n in blocks})
+            break
+
+
+def _iter_template(template, context):
+    """
+    Yield the rendered top-level nodes of a template, following ``extends``.
+
+    Only the root template's top-level ``FlushNode``s become flush points;
+    blocks and includes render as a whole.
+    """
+
+    for node in template.nodelist:
+        if isinstance(node, ExtendsNode):
+            parent = node.get_parent(context)
+            _add_root_blocks(node, parent, context)
+            with context.render_context.push_state(
+                parent, isolated_context=False
+            ):
+                yield from _iter_template(parent, context)
+            return
+        if isinstance(node, FlushNode):
+            yield _FLUSH
+        else:
+            yield node.render_annotated(context)
+
+
+def _iter_chunks(pieces):
+    """Join rendered pieces into one chunk per flush point."""
+    buffer = []
+    for piece in pieces:
+        if piece is _FLUSH:
+            if buffer:
+                yield "".join(buffer)
+                buffer = []
+        else:
+            buffer.append(piece)
+    if buffer:
+        yield "".join(buffer)
+
+
+@contextmanager
+def _request_language(request):
+    """
+    Activate the request language while a chunk renders.
+
+    Chunks render after the middleware has returned, so the language and
+    translator bound by LocaleMiddleware and TranslatorMiddleware are
+    re-activated around each chunk rather than across yields.
+    """
+
+    language = getattr(request, "LANGUAGE_CODE", None) if request else None
+    if language is None:
+        yield
+        return
+    with translation.override(language):
+        _translator, token = activate_translator(language)
+        try:
+            yield
+        finally:
+            deactivate_translator(token)
+
+
+def stream_template(template_name, context=None, request=None, using=None):
+    """
+    Render a template lazily, one chunk per top-level ``{% stream_flush %}``.
+
+    Args:
+        template_name: Template name or list of names to try.
+        context: Template context dict.
+        request: Current request, enables context processors.
+        using: Optional template engine alias.
+
+    Returns:
+        Iterator[str]: Rendered chunks.
+    """
+
+    if isinstance(template_name, (list, tuple)):
+        backend_template = loader.select_template(template_name, using=using)
+    else:
+        backend_template = loader.get_template(template_name, using=using)
+    template = backend_template.template
+    context = make_context(
+        context, request, autoescape=backend_template.backend.engine.autoescape
+    )
+
+    def generate():
+        chunks = _iter_chunks(_iter_template(template, context))
+        with ExitStack() as stack:
+            with _request_language(request):
+                stack.enter_context(
+                    context.render_context.push_state(template)
+                )
+                # Runs the context processors.
+                stack.enter_context(context.bind_template(template))
+                context.template_name = template.name
+            while True:
+                with _request_language(request):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+
+    return generate()
+
+
+async def _async_chunks(chunks):
+    """Iterate a stream_template iterator, rendering each chunk in a thread."""
+    next_chunk = sync_to_async(next)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
+
+
+class StreamingTemplateMixin:
+    """
+    Stream the response of a TemplateResponseMixin view.
+
+    Add before the view base class. Falls back to a regular TemplateResponse
+    when ``settings.STREAM_HTML_RESPONSES`` is off.
+    """
+
+    def render_to_response(self, context, **response_kwargs):
+        if not getattr(settings, "STREAM_HTML_RESPONSES", False):
+            return super().render_to_response(context, **response_kwargs)
+
+        # The body renders after CsrfViewMiddleware has processed the
+        # response, so the token used by {% csrf_token %} is issued now.
+        # Public views bypass the CSRF middleware and must not set its cookie.
+        if not getattr(self.request, "is_public_view", False):
+            get_token(self.request)
+        response_kwargs.setdefault("content_type", self.content_type)
+        chunks = stream_template(
+            self.get_template_names(),
+            context,
+            self.request,
+            using=self.template_engine,
+        )
+        if self.view_is_async:
+            chunks = _async_chunks(chunks)
+        response = StreamingHttpResponse(chunks, **response_kwargs)
+        # As on a TemplateResponse, for core.preload.
+        response.template_name = self.get_template_names()
+        return response
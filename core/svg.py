@@ -0,0 +1,282 @@
+"""
+SVG minification and inlining helpers.
+
+Card art is exported from vector editors with metadata, editor namespaces and
+coordinates carrying far more precision than a 500px card can show.
+``minify_svg`` removes that overhead, rounding coordinates to a precision
+relative to the drawing size rather than a fixed number of decimals;
+``inline_svg`` returns minified markup ready to be embedded in a template,
+so small images avoid an extra request.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from pathlib import Path
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+# Namespaces only meaningful to the editor that produced the file.
+EDITOR_NAMESPACES = {
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://www.bohemiancoding.com/sketch/ns",
+    "http://www.serif.com/",
+    "http://ns.adobe.com/AdobeIllustrator/10.0/",
+    "http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/",
+    "http://ns.adobe.com/Extensibility/1.0/",
+    "http://ns.adobe.com/Graphs/1.0/",
+    "http://ns.adobe.com/SaveForWeb/1.0/",
+    "http://ns.adobe.com/Variables/1.0/",
+    "http://ns.adobe.com/xap/1.0/",
+    "http://purl.org/dc/elements/1.1/",
+    "http://creativecommons.org/ns#",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+}
+
+# Attributes holding coordinates or lengths whose precision can be reduced.
+NUMERIC_ATTRIBUTES = {
+    "cx", "cy", "d", "dx", "dy", "fx", "fy", "height", "points", "r", "rx",
+    "ry", "stroke-width", "viewBox", "width", "x", "x1", "x2", "y", "y1",
+    "y2",
+}  # fmt: skip
+
+# Attributes holding scale factors and ratios, which the drawing size says
+# nothing about: they keep RATIO_PRECISION decimals whatever its size.
+RATIO_ATTRIBUTES = {
+    "gradientTransform", "offset", "patternTransform", "transform",
+}  # fmt: skip
+RATIO_PRECISION = 4
+
+# Elements whose whitespace is rendered and must be preserved.
+TEXT_ELEMENTS = {"text", "tspan", "textPath", "style", "title", "desc"}
+
+# Coordinates keep this many significant digits of the drawing size: a
+# 600-unit viewBox keeps one decimal, a 24-unit icon two.
+SIGNIFICANT_DIGITS = 4
+
+# Decimals kept when the document declares no usable size.
+DEFAULT_PRECISION = 2
+
+NUMBER_PATTERN = re.compile(r"[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+ID_REFERENCE_PATTERN = re.compile(r"url\(#([^)]+)\)")
+
+
+def _split_tag(name: str) -> tuple[str, str]:
+    """Split an ElementTree ``{namespace}local`` name into its parts."""
+    if name.startswith("{"):
+        namespace, local = name[1:].split("}", 1)
+        return namespace, local
+    return "", name
+
+
+def _format_number(token: str, precision: int) -> str:
+    if "." not in token and "e" not in token.lower():
+        return token
+    value = round(float(token), precision)
+    text = f"{value:.{precision}f}".rstrip("0").rstrip(".")
+    return "0" if text in {"-0", ""} else text
+
+
+def round_numbers(value: str, precision: int = 2) -> str:
+    """
+    Round every decimal number in an attribute value to ``precision`` digits.
+
+    Numbers that were written back to back (``1.5.5`` in path data) are kept
+    apart with a space so rounding never merges them into one.
+    """
+
+    output = []
+    position = 0
+    last_char = ""
+    for match in NUMBER_PATTERN.finditer(value):
+        separator = value[position : match.start()]
+        if separator:
+            output.append(separator)
+            last_char = separator[-1]
+        number = _format_number(match.group(), precision)
+        if (last_char.isdigit() or last_char == ".") and (
+            number[0].isdigit() or number[0] == "."
+        ):
+            output.append(" ")
+        output.append(number)
+        last_char = number[-1]
+        position = match.end()
+    output.append(value[position:])
+    return "".join(output)
+
+
+def drawing_precision(
+    root: ET.Element, digits: int = SIGNIFICANT_DIGITS
+) -> int:
+    """
+    Return the decimals needed to keep ``digits`` significant digits of the
+    largest dimension of the drawing (its viewBox, else width and height).
+    """
+
+    view_box = NUMBER_PATTERN.findall(root.get("viewBox", ""))
+    sizes = [float(number) for number in view_box[2:4]]
+    if len(sizes) < 2:
+        matches = (
+            NUMBER_PATTERN.match(root.get(name, ""))
+            for name in ("width", "height")
+        )
+        sizes = [float(match.group()) for match in matches if match]
+    size = max((abs(value) for value in sizes), default=0)
+    if not size:
+        return DEFAULT_PRECISION
+    return max(0, digits - 1 - math.floor(math.log10(size)))
+
+
+def _is_editor_name(name: str) -> bool:
+    return _split_tag(name)[0] in EDITOR_NAMESPACES
+
+
+def _strip_element(
+    element: ET.Element, precision: int, keep_whitespace: bool
+):
+    for child in list(element):
+        namespace, local = _split_tag(child.tag)
+        if namespace in EDITOR_NAMESPACES or local == "metadata":
+            # Keep the text following the removed element in the document.
+            if child.tail and child.tail.strip():
+                previous = element.text or ""
+                element.text = previous + child.tail
+            element.remove(child)
+            continue
+        _strip_element(
+            child, precision, keep_whitespace or local in TEXT_ELEMENTS
+        )
+        if not keep_whitespace and child.tail and not child.tail.strip():
+            child.tail = None
+
+    for name in list(element.attrib):
+        local = _split_tag(name)[1]
+        if _is_editor_name(name):
+            del element.attrib[name]
+        elif local in NUMERIC_ATTRIBUTES:
+            element.attrib[name] = round_numbers(
+                element.attrib[name], precision
+            )
+        elif local in RATIO_ATTRIBUTES:
+            element.attrib[name] = round_numbers(
+                element.attrib[name], max(precision, RATIO_PRECISION)
+            )
+
+    if not keep_whitespace and element.text and not element.text.strip():
+        element.text = None
+
+
+def _parse(data: bytes | str) -> ET.Element:
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError as exc:
+        raise ValueError(f"Invalid SVG: {exc}") from exc
+    if _split_tag(root.tag)[1] != "svg":
+        raise ValueError("Root element is not <svg>")
+    return root
+
+
+def minify_svg(data: bytes | str, precision: int | None = None) -> bytes:
+    """
+    Return a minified copy of an SVG document.
+
+    Comments, the XML prolog, ``<metadata>``, editor namespaces and
+    insignificant whitespace are removed, and coordinates are rounded to
+    ``precision`` decimal places, by default relative to the drawing size
+    (see ``drawing_precision``). Transforms and gradient stop offsets keep
+    at least RATIO_PRECISION decimals.
+
+    Args:
+        data: SVG document.
+        precision: Number of decimals kept in coordinates and lengths.
+
+    Returns:
+        bytes: UTF-8 encoded minified SVG.
+
+    Raises:
+        ValueError: If the document is not a well-formed SVG.
+    """
+
+    root = _parse(data)
+    if precision is None:
+        precision = drawing_precision(root)
+    _strip_element(root, precision, keep_whitespace=False)
+    return ET.tostring(root, encoding="unicode").encode("utf-8")
+
+
+def _prefix_ids(root: ET.Element, prefix: str) -> None:
+    """Namespace every id of an inlined SVG so several can share a page."""
+    ids = {element.get("id") for element in root.iter() if element.get("id")}
+    if not ids:
+        return
+
+    def replace_reference(match):
+        target = match.group(1)
+        return f"url(#{prefix}-{target})" if target in ids else match.group()
+
+    href_names = {"href", f"{{{XLINK_NS}}}href"}
+    for element in root.iter():
+        for name, value in element.attrib.items():
+            if name == "id":
+                element.set(name, f"{prefix}-{value}")
+            elif (
+                name in href_names
+                and value.startswith("#")
+                and value[1:] in ids
+            ):
+                element.set(name, f"#{prefix}-{value[1:]}")
+            elif "url(#" in value:
+                element.set(
+                    name, ID_REFERENCE_PATTERN.sub(replace_reference, value)
+                )
+
+
+@lru_cache(maxsize=64)
+def _inline_markup(path, mtime_ns, size, id_prefix, attributes):
+    root = _parse(Path(path).read_bytes())
+    _strip_element(root, drawing_precision(root), keep_whitespace=False)
+    if id_prefix:
+        _prefix_ids(root, id_prefix)
+    root.attrib.pop("width", None)
+    root.attrib.pop("height", None)
+    for name, value in attributes:
+        root.set(name, value)
+    return ET.tostring(root, encoding="unicode")
+
+
+def inline_svg(path, id_prefix: str = "", attributes=None) -> str:
+    """
+    Return minified SVG markup suitable for embedding in HTML.
+
+    Results are cached per process and invalidated when the file changes.
+
+    Args:
+        path: SVG file on disk.
+        id_prefix: Prefix applied to ids and references so they stay unique
+            when several SVGs are inlined on the same page.
+        attributes: Attributes to set on the root ``<svg>`` element.
+
+    Returns:
+        str: SVG markup (not marked safe).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a well-formed SVG.
+    """
+
+    stat = Path(path).stat()
+    return _inline_markup(
+        str(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        id_prefix,
+        tuple(sorted((attributes or {}).items())),
+    )
@@ -0,0 +1,38 @@
+"""
+Template backends.
+
+``TimedDjangoTemplates`` is Django's template backend with the render time
+of each top-level template added to the request timings
+(core/server_timing.py). Includes and inclusion tags render inside their
+parent and are not counted twice.
+"""
+
+import time
+
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template.exceptions import TemplateDoesNotExist
+
+from core import server_timing
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        timings = server_timing.current()
+        if timings is None:
+            return super().render(context, request)
+        start_time = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.template += time.perf_counter() - start_time
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
@@ -1,6 +1,10 @@
+from pathlib import PurePosixPath
+
 from django import template
 from django.templatetags.static import static
 
+from core.image_resize import STATIC_SOURCE_PREFIX, resized_image_url
+
 
 register = template.Library()
 
@@ -23,3 +27,26 @@ def project_image(project, default: str = "img/dim-gggl.png") -> str:
         # If file missing or storage error, fallback to static
         pass
     return static(default)
+
+
+@register.simple_tag
+def resized_url(source, width, height) -> str:
+    """Return a signed URL serving an image resized to fit the given box.
+
+    Args:
+        source: Image FieldFile, media-relative path, or static path prefixed
+            with ``static/``.
+        width: Rendered width in pixels.
+        height: Rendered height in pixels.
+
+    Returns:
+        URL of the resized variant; vector images are returned unchanged.
+    """
+    name = getattr(source, "name", source) or ""
+    if not name:
+        return ""
+    if PurePosixPath(name).suffix.lower() == ".svg":
+        if name.startswith(STATIC_SOURCE_PREFIX):
+            return static(name[len(STATIC_SOURCE_PREFIX) :])
+        return source.url if hasattr(source, "url") else name
+    return resized_image_url(name, int(width), int(height))
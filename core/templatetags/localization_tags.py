@@ -5,18 +5,28 @@ Template tags and filters for application-managed translations.
 from __future__ import annotations
 
 from django import template
+from django.urls import reverse, translate_url
+from django.utils import translation
+from django.utils.translation import get_language_from_path
 from django.utils.safestring import mark_safe
 
-from core.localization.translation_service import (
-    get_current_language,
-    translate_key,
-    translate_text,
-)
+from core.localization.translation_service import get_translator
 
 
 register = template.Library()
 
 
+def _context_translator(context):
+    """Return the request translator exposed by the site_info processor."""
+    translator = context.get("translator")
+    if translator is None:
+        request = context.get("request")
+        translator = getattr(request, "translator", None) or get_translator(
+            getattr(request, "LANGUAGE_CODE", None)
+        )
+    return translator
+
+
 @register.simple_tag(takes_context=True)
 def t(context, key: str, **kwargs) -> str:
     """
@@ -31,11 +41,7 @@ def t(context, key: str, **kwargs) -> str:
         str: Localized UI string.
     """
 
-    request = context.get("request")
-    language_code = (
-        getattr(request, "LANGUAGE_CODE", None) if request is not None else None
-    )
-    return translate_key(key, language_code=language_code, **kwargs)
+    return _context_translator(context).key(key, **kwargs)
 
 
 @register.filter
@@ -50,7 +56,23 @@ def translate_content(value):
         str | None: Localized text.
     """
 
-    return translate_text(value)
+    return get_translator().text(value)
+
+
+@register.filter
+def localized(obj, field_name: str):
+    """
+    Return the localized value of a model content field.
+
+    Args:
+        obj: Model instance with precomputed ``translations``.
+        field_name: Content field to read.
+
+    Returns:
+        Localized field value.
+    """
+
+    return get_translator().field(obj, field_name)
 
 
 @register.simple_tag
@@ -62,7 +84,31 @@ def current_language() -> str:
         str: Current normalized language code.
     """
 
-    return get_current_language()
+    return get_translator().language
+
+
+@register.simple_tag(takes_context=True)
+def language_url(context, language: str) -> str:
+    """
+    Return the URL of the current page in another language.
+
+    The switcher links to it instead of posting to set_language, so pages
+    served from the static export need no CSRF token.
+
+    Args:
+        context: Django template context.
+        language: Target language code.
+
+    Returns:
+        str: The page under the language prefix, or that language's home
+        page for pages without one.
+    """
+
+    request = context.get("request")
+    if request is None or get_language_from_path(request.path_info) is None:
+        with translation.override(language):
+            return reverse("core:home")
+    return translate_url(request.get_full_path(), language)
 
 
 @register.simple_tag(takes_context=True)
@@ -77,14 +123,8 @@ def intro_lines(context) -> str:
         str: Safe JavaScript array literal.
     """
 
-    request = context.get("request")
-    language_code = (
-        getattr(request, "LANGUAGE_CODE", None) if request is not None else None
-    )
-    lines = [
-        translate_key(f"intro.line_{index}", language_code=language_code)
-        for index in range(1, 10)
-    ]
+    translator = _context_translator(context)
+    lines = [translator.key(f"intro.line_{index}") for index in range(1, 10)]
     escaped_lines = [
         line.replace("\\", "\\\\").replace('"', '\\"') for line in lines
     ]
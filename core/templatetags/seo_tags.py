@@ -5,7 +5,8 @@ from urllib.parse import urljoin
 from django import template
 from django.conf import settings
 from django.templatetags.static import static
-from django.utils.translation import get_language
+from django.urls import translate_url
+from django.utils.translation import get_language, get_language_from_path
 
 from core.localization.translation_service import normalize_language_code, translate_key
 
@@ -48,6 +49,35 @@ def _absolute_url(request, url: str) -> str:
     return request.build_absolute_uri(url)
 
 
+def _language_alternates(request) -> list[dict[str, str]]:
+    """
+    Return the hreflang alternates of the current page.
+
+    Only pages under a language prefix have alternates; x-default points to
+    the default language version.
+    """
+
+    if request is None or get_language_from_path(request.path_info) is None:
+        return []
+    path = request.get_full_path()
+    alternates = [
+        {
+            "language": code,
+            "url": request.build_absolute_uri(translate_url(path, code)),
+        }
+        for code, _name in settings.LANGUAGES
+    ]
+    alternates.append(
+        {
+            "language": "x-default",
+            "url": request.build_absolute_uri(
+                translate_url(path, settings.LANGUAGE_CODE)
+            ),
+        }
+    )
+    return alternates
+
+
 @register.inclusion_tag("core/components/meta_tags.html", takes_context=True)
 def seo_meta_tags(
     context, title=None, description=None, image=None, page_type="website"
@@ -81,4 +111,5 @@ def seo_meta_tags(
         "twitter_handle": DEFAULT_TWITTER_HANDLE,
         "keywords": translate_key("seo.keywords", language_code),
         "locale": "fr_FR" if language_code == "fr" else "en_US",
+        "alternates": _language_alternates(request),
     }
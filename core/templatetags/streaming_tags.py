@@ -0,0 +1,24 @@
+"""
+Template tags for streamed responses.
+"""
+
+from django import template
+
+from core.streaming import FlushNode
+
+
+register = template.Library()
+
+
+@register.tag
+def stream_flush(parser, token):
+    """
+    Mark a point where a streamed response sends what it has rendered.
+
+    Only effective at the top level of the root template; renders nothing
+    in regular responses.
+    """
+
+    if len(token.split_contents()) != 1:
+        raise template.TemplateSyntaxError("'stream_flush' takes no arguments")
+    return FlushNode()
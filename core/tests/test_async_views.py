@@ -0,0 +1,165 @@
+"""
+Tests for the async view variants served under ASGI.
+"""
+import re
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory
+
+from core.middleware import SecurityHeadersMiddleware, TranslatorMiddleware
+from core.localization.translation_service import get_translator
+from core.views import (
+    AIView,
+    AboutView,
+    AsyncAboutView,
+    AsyncAIView,
+    AsyncCLIProjectsView,
+    AsyncDjangoProjectsView,
+    CLIProjectsView,
+    DjangoProjectsView,
+)
+from projects.views import (
+    AsyncProjectDetailView,
+    AsyncProjectListView,
+    ProjectDetailView,
+    ProjectListView,
+)
+
+CSRF_TOKEN = re.compile(r'name="csrfmiddlewaretoken" value="[^"]+"')
+
+SECTION_VIEWS = [
+    (AIView, AsyncAIView),
+    (CLIProjectsView, AsyncCLIProjectsView),
+    (DjangoProjectsView, AsyncDjangoProjectsView),
+    (AboutView, AsyncAboutView),
+]
+
+
+def _request(path="/", **params):
+    request = RequestFactory().get(path, params)
+    request.user = AnonymousUser()
+    request.LANGUAGE_CODE = "en"
+    return request
+
+
+def _render(view_class, request, **kwargs):
+    view = view_class.as_view()
+    if view_class.view_is_async:
+        response = async_to_sync(view)(request, **kwargs)
+    else:
+        response = view(request, **kwargs)
+    if response.streaming:
+
+        async def consume():
+            return "".join([chunk.decode() async for chunk in response])
+
+        return response, async_to_sync(consume)()
+    response.render()
+    return response, CSRF_TOKEN.sub("", response.content.decode())
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+    @pytest.fixture(autouse=True)
+    def _no_streaming(self, settings):
+        settings.STREAM_HTML_RESPONSES = False
+
+    @pytest.mark.parametrize(("view_class", "async_view_class"), SECTION_VIEWS)
+    def test_section_pages_match_sync_views(
+        self, view_class, async_view_class, project_factory
+    ):
+        project_factory(slug="epic_events")
+
+        _response, expected = _render(view_class, _request())
+        _response, rendered = _render(async_view_class, _request())
+
+        assert async_view_class.view_is_async
+        assert rendered == expected
+
+    def test_project_list_matches_sync_view(
+        self, monkeypatch, project_factory, category_factory
+    ):
+        monkeypatch.setattr(ProjectListView, "paginate_by", 2)
+        category = category_factory()
+        for _ in range(3):
+            project_factory(category=category)
+
+        for params in ({}, {"page": "2"}, {"sort": "title", "q": "CRM"}):
+            _response, expected = _render(ProjectListView, _request(**params))
+            _response, rendered = _render(
+                AsyncProjectListView, _request(**params)
+            )
+            assert rendered == expected
+
+    def test_project_list_rejects_invalid_page(self, project_factory):
+        project_factory()
+
+        with pytest.raises(Http404):
+            _render(AsyncProjectListView, _request(page="9"))
+
+    def test_project_detail_matches_sync_view(
+        self, project_factory, category_factory
+    ):
+        category = category_factory()
+        projects = [project_factory(category=category) for _ in range(3)]
+        slug = projects[1].slug
+
+        _response, expected = _render(
+            ProjectDetailView, _request(**{"from": "cli"}), slug=slug
+        )
+        _response, rendered = _render(
+            AsyncProjectDetailView, _request(**{"from": "cli"}), slug=slug
+        )
+
+        assert rendered == expected
+        assert projects[0].title in rendered
+
+    def test_project_detail_unknown_slug_is_404(self, db):
+        with pytest.raises(Http404):
+            _render(AsyncProjectDetailView, _request(), slug="missing")
+
+    def test_streamed_async_page_uses_async_iterator(
+        self, settings, project_factory
+    ):
+        settings.STREAM_HTML_RESPONSES = True
+        project = project_factory()
+
+        response, body = _render(
+            AsyncProjectDetailView, _request(), slug=project.slug
+        )
+
+        assert response.is_async
+        assert project.title in body
+        assert body.rstrip().endswith("</html>")
+
+
+class TestAsyncMiddleware:
+    def test_translator_is_bound_around_async_views(self):
+        seen = {}
+
+        async def view(request):
+            seen["translator"] = get_translator()
+            return HttpResponse()
+
+        middleware = TranslatorMiddleware(view)
+        request = _request()
+        request.LANGUAGE_CODE = "fr"
+        async_to_sync(middleware)(request)
+
+        assert iscoroutinefunction(middleware)
+        assert seen["translator"] is request.translator
+        assert get_translator() is not request.translator
+
+    def test_security_headers_added_in_async_mode(self, settings):
+        settings.DEBUG = False
+        settings.CONTENT_SECURITY_POLICY = "default-src 'self'"
+
+        async def view(request):
+            return HttpResponse()
+
+        response = async_to_sync(SecurityHeadersMiddleware(view))(_request())
+
+        assert response["Content-Security-Policy"] == "default-src 'self'"
@@ -0,0 +1,79 @@
+"""
+Tests for the compiled, lazily loaded translation catalog.
+"""
+
+from __future__ import annotations
+
+import marshal
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from core.localization import catalog_store
+from core.localization.content_catalog import (
+    CONTENT_TRANSLATIONS,
+    UI_TRANSLATIONS,
+)
+from core.localization.translation_service import normalize_language_code
+
+
+@pytest.fixture
+def compiled_path(tmp_path, settings):
+    path = tmp_path / "catalog.bin"
+    settings.LOCALIZATION_COMPILED_CATALOG = path
+    catalog_store.reset_catalogs()
+    yield path
+    catalog_store.reset_catalogs()
+
+
+class TestCatalogStore:
+    def test_should_load_compiled_catalog_with_interned_keys(
+        self, compiled_path
+    ):
+        """
+        Ensure the compiled catalog matches the module and interns its keys.
+        """
+
+        call_command("compile_catalog", stdout=StringIO())
+
+        ui, content = catalog_store.load_catalogs()
+
+        assert ui == UI_TRANSLATIONS
+        assert content == CONTENT_TRANSLATIONS
+        key = next(iter(ui["fr"]))
+        assert key is sys.intern("".join(key))
+
+    def test_should_fall_back_to_module_when_compiled_catalog_is_stale(
+        self, compiled_path
+    ):
+        """
+        Ensure an outdated compiled catalog is ignored.
+        """
+
+        compiled_path.write_bytes(
+            marshal.dumps(
+                {
+                    "version": catalog_store.FORMAT_VERSION,
+                    "source_digest": "outdated",
+                    "ui": {"en": {}},
+                    "content": {},
+                }
+            )
+        )
+
+        ui, _content = catalog_store.load_catalogs()
+
+        assert ui is UI_TRANSLATIONS
+
+    def test_should_normalize_language_without_loading_catalog(
+        self, compiled_path
+    ):
+        """
+        Ensure language normalization does not trigger a catalog load.
+        """
+
+        assert normalize_language_code("fr-FR") == "fr"
+        assert normalize_language_code("de") == "en"
+        assert catalog_store._catalogs is None
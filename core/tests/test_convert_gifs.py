@@ -0,0 +1,62 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from PIL import Image
+
+
+@pytest.fixture
+def image_dir(tmp_path, settings):
+    directory = tmp_path / "images"
+    directory.mkdir()
+    settings.IMAGE_OPTIMIZATION_DIRS = [directory]
+    return directory
+
+
+def _write_animated_gif(path, size=(64, 64)):
+    frames = [
+        Image.new("RGB", size, color) for color in ("#94db40", "#ef0041")
+    ]
+    frames[0].save(
+        path,
+        save_all=True,
+        append_images=frames[1:],
+        duration=80,
+        loop=0,
+    )
+
+
+def _run(*args):
+    output = StringIO()
+    call_command("convert_gifs", *args, stdout=output)
+    return output.getvalue()
+
+
+class TestConvertGifsCommand:
+    def test_writes_animated_webp_and_poster(self, image_dir):
+        _write_animated_gif(image_dir / "demo_card.gif", size=(800, 800))
+
+        _run()
+
+        with Image.open(image_dir / "demo_card.anim.webp") as animated:
+            assert animated.format == "WEBP"
+            assert animated.n_frames == 2
+            assert max(animated.size) == 496
+        with Image.open(image_dir / "demo_card.poster.webp") as poster:
+            assert getattr(poster, "n_frames", 1) == 1
+
+    def test_skips_gifs_with_up_to_date_variants(self, image_dir):
+        _write_animated_gif(image_dir / "demo_card.gif")
+        _run()
+
+        output = _run()
+
+        assert "Skipped:   1" in output
+
+    def test_reports_static_gifs_as_errors(self, image_dir):
+        Image.new("RGB", (8, 8)).save(image_dir / "still.gif")
+
+        output = _run()
+
+        assert "Not an animated GIF" in output
+        assert not (image_dir / "still.anim.webp").exists()
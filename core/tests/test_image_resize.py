@@ -0,0 +1,163 @@
+import os
+from io import BytesIO
+
+import pytest
+from django.middleware.cache import FetchFromCacheMiddleware
+from django.test import RequestFactory
+from PIL import Image
+
+from core import views
+from core.image_resize import ResizeCache, resized_image_url
+from core.middleware import StreamingUpdateCacheMiddleware
+
+
+@pytest.fixture(autouse=True)
+def resize_settings(tmp_path, settings):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.IMAGE_RESIZE_CACHE_DIR = tmp_path / "resized"
+    settings.IMAGE_RESIZE_CACHE_MAX_BYTES = 10 * 1024 * 1024
+    settings.IMAGE_RESIZE_ACCEL_REDIRECT_PREFIX = ""
+    (tmp_path / "media" / "projects").mkdir(parents=True)
+    Image.new("RGB", (800, 400), "#94db40").save(
+        tmp_path / "media" / "projects" / "shot.png"
+    )
+    return settings
+
+
+def _content(response):
+    return b"".join(response.streaming_content)
+
+
+class TestResizedImageView:
+    def test_signed_request_returns_resized_image(self, client):
+        response = client.get(resized_image_url("projects/shot.png", 200, 200))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/png"
+        assert "immutable" in response["Cache-Control"]
+        assert Image.open(BytesIO(_content(response))).size == (200, 100)
+
+    def test_invalid_signature_is_rejected(self, client):
+        url = resized_image_url("projects/shot.png", 200, 200)
+
+        response = client.get(url.replace("200x200", "2000x2000"))
+
+        assert response.status_code == 403
+
+    def test_path_traversal_is_not_served(self, client):
+        response = client.get(resized_image_url("../secret.png", 200, 200))
+
+        assert response.status_code == 404
+
+    def test_second_request_is_served_from_disk_cache(
+        self, client, resize_settings
+    ):
+        url = resized_image_url("projects/shot.png", 200, 200)
+        _content(client.get(url))
+        cache_dir = resize_settings.IMAGE_RESIZE_CACHE_DIR
+        cached = list(cache_dir.rglob("*.png"))
+
+        response = client.get(url)
+
+        assert len(cached) == 1
+        assert response.status_code == 200
+        assert list(cache_dir.rglob("*.png")) == cached
+
+    def test_accel_redirect_hands_cache_file_to_the_web_server(
+        self, client, resize_settings
+    ):
+        resize_settings.IMAGE_RESIZE_ACCEL_REDIRECT_PREFIX = "/_resized/"
+
+        response = client.get(resized_image_url("projects/shot.png", 200, 200))
+
+        assert response["X-Accel-Redirect"].startswith("/_resized/")
+        assert response.content == b""
+
+    def test_editing_the_source_changes_the_url(self, resize_settings):
+        source = resize_settings.MEDIA_ROOT / "projects" / "shot.png"
+        url = resized_image_url("projects/shot.png", 200, 200)
+
+        Image.new("RGB", (800, 400), "#ef0041").save(source)
+        os.utime(source, ns=(1, 1))
+
+        assert resized_image_url("projects/shot.png", 200, 200) != url
+
+    def test_version_is_covered_by_the_signature(self, client):
+        url = resized_image_url("projects/shot.png", 200, 200)
+        version = url.split("v=")[1].split("&")[0]
+
+        response = client.get(url.replace(f"v={version}", "v=0"))
+
+        assert response.status_code == 403
+
+    def test_accel_redirects_are_kept_out_of_the_page_cache(
+        self, resize_settings
+    ):
+        resize_settings.IMAGE_RESIZE_ACCEL_REDIRECT_PREFIX = "/_resized/"
+        url = resized_image_url("projects/shot.png", 200, 200)
+
+        def view(request):
+            return views.resized_image(request, 200, 200, "projects/shot.png")
+
+        request = RequestFactory().get(url)
+        assert FetchFromCacheMiddleware(view).process_request(request) is None
+        StreamingUpdateCacheMiddleware(view).process_response(
+            request, view(request)
+        )
+
+        fetch = FetchFromCacheMiddleware(view)
+        assert fetch.process_request(RequestFactory().get(url)) is None
+
+    def test_variant_evicted_before_it_is_opened_is_rendered_again(
+        self, client, monkeypatch
+    ):
+        get_resized = views.get_resized
+        evicted = []
+
+        def evicting_get_resized(*args):
+            cached_path, content_type = get_resized(*args)
+            if not evicted:
+                cached_path.unlink()
+                evicted.append(cached_path)
+            return cached_path, content_type
+
+        monkeypatch.setattr(views, "get_resized", evicting_get_resized)
+
+        response = client.get(resized_image_url("projects/shot.png", 200, 200))
+
+        assert evicted
+        assert response.status_code == 200
+        assert Image.open(BytesIO(_content(response))).size == (200, 100)
+
+
+class TestResizeCache:
+    def test_evicts_least_recently_used_files_over_the_cap(self, tmp_path):
+        cache = ResizeCache(directory=tmp_path / "cache", max_bytes=250)
+        oldest = cache.put("aa" + "0" * 62, ".png", b"x" * 100)
+        recent = cache.put("bb" + "0" * 62, ".png", b"x" * 100)
+        os.utime(oldest, (1, 1))
+
+        newest = cache.put("cc" + "0" * 62, ".png", b"x" * 100)
+
+        assert not oldest.exists()
+        assert recent.exists()
+        assert newest.exists()
+
+    def test_scans_the_directory_only_when_the_cap_is_crossed(
+        self, tmp_path, monkeypatch
+    ):
+        cache = ResizeCache(directory=tmp_path / "cache", max_bytes=250)
+        cache.put("aa" + "0" * 62, ".png", b"x" * 100)
+        scans = []
+        evict = ResizeCache.evict
+        monkeypatch.setattr(
+            ResizeCache,
+            "evict",
+            lambda self, keep=None: scans.append(keep) or evict(self, keep),
+        )
+
+        cache.put("bb" + "0" * 62, ".png", b"x" * 100)
+        assert scans == []
+
+        newest = cache.put("cc" + "0" * 62, ".png", b"x" * 100)
+        assert scans == [newest]
@@ -0,0 +1,104 @@
+import random
+from io import BytesIO
+
+import pytest
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image, ImageCms, ImageDraw
+
+from core.utils import classify_image, optimize_image, recompress_image
+
+
+def _upload(image, name="upload.png"):
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return SimpleUploadedFile(
+        name, buffer.getvalue(), content_type="image/png"
+    )
+
+
+def _terminal_screenshot():
+    image = Image.new("RGB", (400, 240), "#0b0f0c")
+    draw = ImageDraw.Draw(image)
+    for row in range(12):
+        draw.text(
+            (8, 8 + row * 18), f"$ clinkey --length {row}", fill="#94db40"
+        )
+    return image
+
+
+def _photo():
+    rng = random.Random(7)
+    image = Image.new("RGB", (64, 64))
+    image.putdata(
+        [
+            (x * 4 + rng.randrange(24), y * 4 + rng.randrange(24), 128)
+            for y in range(64)
+            for x in range(64)
+        ]
+    )
+    return image.resize((256, 256), Image.BICUBIC)
+
+
+def _transparent_logo():
+    image = Image.new("RGBA", (128, 128), (0, 0, 0, 0))
+    ImageDraw.Draw(image).ellipse((16, 16, 112, 112), fill="#94db40")
+    return image
+
+
+class TestClassifyImage:
+    def test_classifies_screenshots_photos_and_transparent_images(self):
+        assert classify_image(_terminal_screenshot()) == "flat"
+        assert classify_image(_photo()) == "photo"
+        assert classify_image(_transparent_logo()) == "transparent"
+
+    def test_opaque_alpha_channel_is_not_transparent(self):
+        assert classify_image(_terminal_screenshot().convert("RGBA")) == "flat"
+
+
+class TestOptimizeImage:
+    def test_screenshot_is_not_forced_to_jpeg(self):
+        optimized = optimize_image(_upload(_terminal_screenshot()))
+
+        assert optimized.image_format in {"PNG", "WEBP"}
+        assert optimized.image_class == "flat"
+        assert optimized.name.endswith((".png", ".webp"))
+
+    def test_transparent_image_keeps_alpha(self):
+        optimized = optimize_image(_upload(_transparent_logo()))
+
+        with Image.open(optimized) as result:
+            assert result.convert("RGBA").getpixel((0, 0))[3] == 0
+        assert optimized.content_type in {"image/png", "image/webp"}
+
+    def test_records_bytes_saved(self):
+        upload = _upload(_photo())
+
+        optimized = optimize_image(upload)
+
+        assert optimized.image_class == "photo"
+        assert optimized.bytes_saved == upload.size - optimized.size
+        assert optimized.bytes_saved > 0
+
+
+class TestRecompressImage:
+    @pytest.mark.parametrize("image_format", ["JPEG", "PNG", "WEBP"])
+    @pytest.mark.parametrize("source", [_photo, _terminal_screenshot])
+    def test_keeps_the_color_profile_and_exif(self, image_format, source):
+        srgb = ImageCms.createProfile("sRGB")
+        profile = ImageCms.ImageCmsProfile(srgb).tobytes()
+        exif = Image.Exif()
+        exif[0x0131] = "portfolio-test"  # Software
+        buffer = BytesIO()
+        source().save(
+            buffer,
+            format=image_format,
+            icc_profile=profile,
+            exif=exif.tobytes(),
+        )
+
+        data, _format = recompress_image(buffer.getvalue())
+
+        with Image.open(BytesIO(data)) as result:
+            assert result.info["icc_profile"] == profile
+            assert result.getexif()[0x0131] == "portfolio-test"
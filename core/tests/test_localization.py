@@ -6,7 +6,16 @@ from __future__ import annotations
 
 import pytest
 from django.conf import settings
+from django.test import Client
 from django.urls import reverse
+from django.utils import translation
+
+from core.localization.translation_service import (
+    activate_translator,
+    deactivate_translator,
+    get_translator,
+    translate_text,
+)
 
 
 @pytest.mark.django_db
@@ -28,7 +37,8 @@ class TestLocalization:
 
     def test_should_switch_to_french_via_language_endpoint(self, client):
         """
-        Ensure the language switch stores the French locale and updates the UI.
+        Ensure the language switch stores the French locale and redirects to
+        the French URL of the page.
         """
 
         response = client.post(
@@ -37,9 +47,10 @@ class TestLocalization:
         )
 
         assert response.status_code == 302
+        assert response.url == "/fr/"
         assert response.cookies[settings.LANGUAGE_COOKIE_NAME].value == "fr"
 
-        localized_response = client.get(reverse("core:home"))
+        localized_response = client.get(response.url)
 
         assert localized_response.status_code == 200
         content = localized_response.content.decode()
@@ -49,3 +60,117 @@ class TestLocalization:
         assert "À propos" in content
         assert "EN" in content
 
+    def test_switcher_links_to_the_same_page_in_the_other_language(
+        self, client, project_factory
+    ):
+        """
+        Ensure the switcher is a plain link, usable from exported pages.
+        """
+
+        project = project_factory()
+        with translation.override("fr"):
+            french_url = project.get_absolute_url()
+
+        content = client.get(project.get_absolute_url()).content.decode()
+
+        assert f'href="{french_url}"' in content
+        assert 'hreflang="fr"' in content
+
+    def test_language_endpoint_requires_a_csrf_token(self):
+        """
+        Ensure the language switch endpoint keeps its CSRF protection.
+        """
+
+        response = Client(enforce_csrf_checks=True).post(
+            reverse("set_language"), data={"language": "fr"}
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize(
+        ("headers", "location"),
+        [
+            ({}, "/en/"),
+            ({"HTTP_ACCEPT_LANGUAGE": "fr-FR,fr;q=0.9"}, "/fr/"),
+            ({"HTTP_COOKIE": f"{settings.LANGUAGE_COOKIE_NAME}=fr"}, "/fr/"),
+        ],
+    )
+    def test_should_detect_language_only_on_the_bare_root(
+        self, client, headers, location
+    ):
+        """
+        Ensure / redirects to the preferred language and prefixed pages
+        ignore the visitor's preferences.
+        """
+
+        response = client.get("/", **headers)
+
+        assert response.status_code == 302
+        assert response.url == location
+
+        page = client.get("/en/", **headers)
+
+        assert 'lang="en"' in page.content.decode()
+        assert "Accept-Language" not in page.get("Vary", "")
+
+    def test_should_link_language_alternates(self, client, project_factory):
+        """
+        Ensure pages and the sitemap list every language version.
+        """
+
+        project = project_factory()
+
+        content = client.get(f"/fr/projects/{project.slug}/").content.decode()
+
+        alternates = (("en", "en"), ("fr", "fr"), ("x-default", "en"))
+        for hreflang, prefix in alternates:
+            assert (
+                f'<link rel="alternate" hreflang="{hreflang}" '
+                f'href="http://testserver/{prefix}/projects/{project.slug}/">'
+            ) in content
+
+        sitemap = client.get(reverse("sitemap")).content.decode()
+
+        assert f"/fr/projects/{project.slug}/</loc>" in sitemap
+        assert 'hreflang="x-default"' in sitemap
+
+
+class TestTranslator:
+    def test_should_bind_merged_catalog_and_precompiled_formats(self):
+        """
+        Ensure the translator falls back to English and formats placeholders.
+        """
+
+        translator = get_translator("fr-FR")
+
+        assert translator is get_translator("fr")
+        assert translator.language == "fr"
+        assert "summary.projects_count" in translator.formatters
+        assert translator.key("summary.projects_count", count=3) == "3 projets"
+        assert translator.key("missing.key") == "missing.key"
+
+    def test_should_use_activated_translator_for_language_less_lookups(self):
+        """
+        Ensure lookups without a language use the translator bound per request.
+        """
+
+        _translator, token = activate_translator("fr")
+        try:
+            assert translate_text("Study Projects") == "Projets d'étude"
+        finally:
+            deactivate_translator(token)
+
+        assert translate_text("Study Projects", "en") == "Study Projects"
+
+    @pytest.mark.django_db
+    def test_should_expose_request_translator_to_templates(self, client):
+        """
+        Ensure the middleware binds the translator of the request language.
+        """
+
+        with translation.override("fr"):
+            response = client.get(reverse("core:home"))
+
+        assert response.wsgi_request.translator.language == "fr"
+        translator = response.wsgi_request.translator
+        assert response.context["translator"] is translator
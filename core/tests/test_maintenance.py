@@ -0,0 +1,98 @@
+"""
+Tests for the runtime maintenance mode.
+"""
+import math
+from io import StringIO
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from core import maintenance
+from core.middleware import MaintenanceModeMiddleware
+
+
+@pytest.fixture(autouse=True)
+def flag_file(settings, tmp_path, monkeypatch):
+    settings.MAINTENANCE_MODE = False
+    settings.MAINTENANCE_FLAG_FILE = tmp_path / ".maintenance"
+    monkeypatch.setattr(maintenance, "CHECK_INTERVAL", 0)
+    monkeypatch.setattr(maintenance, "_pages", {})
+    monkeypatch.setattr(
+        maintenance, "_state", {"checked_at": -math.inf, "retry_after": None}
+    )
+    return settings.MAINTENANCE_FLAG_FILE
+
+
+@pytest.mark.django_db
+class TestMaintenanceMode:
+    def test_command_switches_the_site_without_restart(
+        self, client, flag_file
+    ):
+        call_command(
+            "maintenance", "on", "--retry-after", "600", stdout=StringIO()
+        )
+
+        response = client.get(reverse("core:home"))
+
+        assert flag_file.exists()
+        assert response.status_code == 503
+        assert response["Retry-After"] == "600"
+        assert response["Cache-Control"] == "no-store"
+        assert b"Maintenance in progress" in response.content
+
+        call_command("maintenance", "off", stdout=StringIO())
+
+        assert client.get(reverse("core:home")).status_code == 200
+
+    def test_serves_the_pre_rendered_page_of_the_request_language(
+        self, client, monkeypatch
+    ):
+        maintenance.enable()
+        assert maintenance.render_pages() == 2
+
+        def fail(*args, **kwargs):
+            raise AssertionError("maintenance page rendered during a request")
+
+        monkeypatch.setattr(maintenance, "render_to_string", fail)
+
+        response = client.get("/fr/projects/")
+
+        assert response.status_code == 503
+        assert "Maintenance en cours" in response.content.decode()
+
+    def test_admin_stays_reachable(self, client):
+        maintenance.enable()
+
+        response = client.get(reverse("admin:login"))
+
+        assert response.status_code == 200
+
+    def test_flag_file_is_checked_once_per_interval(
+        self, monkeypatch, flag_file
+    ):
+        monkeypatch.setattr(maintenance, "CHECK_INTERVAL", 60)
+        maintenance.disable()
+        assert not maintenance.is_active()
+
+        flag_file.write_text("120\n")
+
+        assert not maintenance.is_active()
+        maintenance._state["checked_at"] -= 60
+        assert maintenance.retry_after() == 120
+
+    def test_blocks_requests_in_async_mode(self):
+        async def view(request):
+            return HttpResponse()
+
+        maintenance.enable(30)
+        request = RequestFactory().get("/en/")
+        request.LANGUAGE_CODE = "en"
+
+        response = async_to_sync(MaintenanceModeMiddleware(view))(request)
+
+        assert response.status_code == 503
+        assert response["Retry-After"] == "30"
@@ -0,0 +1,154 @@
+"""
+Tests for the Prometheus metrics and the /metrics endpoint.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from core.middleware import CompressedFetchFromCacheMiddleware
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    def test_internal_scrape_lists_per_route_metrics(self, client):
+        client.get(reverse("projects:list"))
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert "no-cache" in response["Cache-Control"]
+        content = response.content.decode()
+        bucket = 'portfolio_request_duration_seconds_bucket{le="0.005"'
+        assert bucket in content
+        assert 'route="projects:list"' in content
+        assert "portfolio_worker_memory_bytes" in content
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"REMOTE_ADDR": "203.0.113.7"},
+            {"REMOTE_ADDR": "127.0.0.1", "HTTP_X_REAL_IP": "203.0.113.7"},
+            {"REMOTE_ADDR": "203.0.113.7", "HTTP_X_REAL_IP": "127.0.0.1"},
+        ],
+    )
+    def test_other_addresses_get_a_404(self, client, headers):
+        assert client.get("/metrics", **headers).status_code == 404
+
+    def test_real_ip_is_read_from_the_proxy_on_the_unix_socket(self, client):
+        response = client.get(
+            "/metrics", REMOTE_ADDR="", HTTP_X_REAL_IP="127.0.0.1"
+        )
+
+        assert response.status_code == 200
+
+    def test_allowed_networks_are_configurable(self, client, settings):
+        settings.METRICS_ALLOWED_IPS = ["10.0.0.0/8"]
+
+        response = client.get("/metrics", HTTP_X_REAL_IP="10.1.2.3")
+
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+class TestRequestMetrics:
+    def test_request_latency_size_and_queries_are_recorded(
+        self, client, project_factory
+    ):
+        project_factory()
+        labels = {"route": "projects:list"}
+        count = _sample("portfolio_request_db_queries_count", **labels)
+        queries = _sample("portfolio_request_db_queries_sum", **labels)
+        size = _sample("portfolio_response_size_bytes_sum", **labels)
+
+        body = b"".join(client.get(reverse("projects:list")))
+
+        assert (
+            _sample("portfolio_request_db_queries_count", **labels)
+            == count + 1
+        )
+        assert _sample("portfolio_request_db_queries_sum", **labels) > queries
+        assert _sample(
+            "portfolio_response_size_bytes_sum", **labels
+        ) == size + len(body)
+        assert _sample(
+            "portfolio_request_duration_seconds_count",
+            route="projects:list",
+            method="GET",
+            status="2xx",
+        )
+
+    def test_sidebar_cache_hits_and_misses_are_counted(self, client):
+        cache.clear()
+        name = "portfolio_view_cache_requests_total"
+        labels = {"cache": "sidebar"}
+        misses = _sample(name, result="miss", **labels)
+        hits = _sample(name, result="hit", **labels)
+
+        client.get(reverse("projects:list"))
+        client.get(reverse("projects:list"))
+
+        assert _sample(name, result="miss", **labels) == misses + 1
+        assert _sample(name, result="hit", **labels) == hits + 1
+
+    def test_page_cache_misses_are_counted(self):
+        cache.clear()
+        misses = _sample("portfolio_page_cache_requests_total", result="miss")
+        middleware = CompressedFetchFromCacheMiddleware(
+            lambda request: HttpResponse()
+        )
+
+        assert middleware.process_request(RequestFactory().get("/en/")) is None
+        assert (
+            _sample("portfolio_page_cache_requests_total", result="miss")
+            == misses + 1
+        )
+
+
+def test_metrics_of_every_worker_process_are_merged(tmp_path):
+    """Values written by forked workers are all rendered by any of them."""
+    script = """
+import os
+import django
+
+django.setup()
+from core import metrics
+
+metrics.count_page_cache(hit=True)
+pid = os.fork()
+if pid == 0:
+    metrics.count_page_cache(hit=True)
+    os._exit(0)
+os.waitpid(pid, 0)
+print(metrics.render()[0].decode())
+"""
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "portfolio_dimitri.settings",
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path),
+    }
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(django_settings.BASE_DIR),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    hits = 'portfolio_page_cache_requests_total{result="hit"} 2.0'
+    assert hits in result.stdout
@@ -0,0 +1,95 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from PIL import Image
+
+
+@pytest.fixture
+def image_dir(tmp_path, settings):
+    directory = tmp_path / "images"
+    directory.mkdir()
+    settings.IMAGE_OPTIMIZATION_DIRS = [directory]
+    settings.IMAGE_OPTIMIZATION_LEDGER = tmp_path / "ledger.json"
+    return directory
+
+
+def _write_uncompressed_png(path):
+    image = Image.new("RGB", (200, 200), "#94db40")
+    image.save(path, format="PNG", compress_level=0)
+    return path.stat().st_size
+
+
+def _run(*args):
+    output = StringIO()
+    call_command("optimize_images", "--workers=1", *args, stdout=output)
+    return output.getvalue()
+
+
+class TestOptimizeImagesCommand:
+    def test_recompresses_images_and_records_them_in_the_ledger(
+        self, image_dir, settings
+    ):
+        path = image_dir / "card.png"
+        original_size = _write_uncompressed_png(path)
+
+        output = _run()
+
+        assert path.stat().st_size < original_size
+        assert "card.png" in output
+        ledger = json.loads(settings.IMAGE_OPTIMIZATION_LEDGER.read_text())
+        assert [entry["original_bytes"] for entry in ledger.values()] == [
+            original_size
+        ]
+
+    def test_skips_files_already_in_the_ledger(self, image_dir):
+        _write_uncompressed_png(image_dir / "card.png")
+        _run()
+
+        output = _run()
+
+        assert "Processing 0 image(s)" in output
+        assert "1 already optimized" in output
+
+    def test_dry_run_reports_savings_without_writing(
+        self, image_dir, settings
+    ):
+        path = image_dir / "card.png"
+        original_size = _write_uncompressed_png(path)
+
+        output = _run("--dry-run")
+
+        assert path.stat().st_size == original_size
+        assert "Expected savings" in output
+        assert not settings.IMAGE_OPTIMIZATION_LEDGER.exists()
+
+    def test_keeps_original_when_result_is_not_smaller(self, image_dir):
+        path = image_dir / "tiny.png"
+        Image.new("L", (1, 1)).save(path, format="PNG", optimize=True)
+        original_bytes = path.read_bytes()
+
+        output = _run()
+
+        assert path.read_bytes() == original_bytes
+        assert "kept original" in output
+
+    def test_minifies_svgs_and_filters_by_extension(self, image_dir):
+        svg = image_dir / "card.svg"
+        svg.write_text(
+            '<?xml version="1.0"?>\n<!-- editor export -->\n'
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">\n'
+            "  <metadata>exported</metadata>\n"
+            '  <path d="M 0.123456 1.987654 L 2.5 3.5"/>\n'
+            "</svg>\n"
+        )
+        original_size = svg.stat().st_size
+        png = image_dir / "card.png"
+        png_size = _write_uncompressed_png(png)
+
+        output = _run("--extension", ".svg")
+
+        assert svg.stat().st_size < original_size
+        assert "metadata" not in svg.read_text()
+        assert png.stat().st_size == png_size
+        assert "Processing 1 image(s)" in output
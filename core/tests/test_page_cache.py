@@ -0,0 +1,79 @@
+"""
+Tests for pre-compressed cached pages.
+"""
+import gzip
+
+import brotli
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.middleware import (
+    CompressedFetchFromCacheMiddleware,
+    StreamingUpdateCacheMiddleware,
+)
+
+PAGE = b"<html><body>" + b"<p>cached page</p>" * 200 + b"</body></html>"
+
+
+class TestCompressedPageCache:
+    def setup_method(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.renders = 0
+
+    def _view(self, request):
+        self.renders += 1
+        return HttpResponse(PAGE, content_type="text/html; charset=utf-8")
+
+    def _get(self, accept_encoding=""):
+        request = self.factory.get(
+            "/page/", HTTP_ACCEPT_ENCODING=accept_encoding
+        )
+        fetch = CompressedFetchFromCacheMiddleware(self._view)
+        response = fetch.process_request(request)
+        if response is None:
+            response = StreamingUpdateCacheMiddleware(self._view)(request)
+        return response
+
+    def test_hits_serve_the_accepted_encoding(self):
+        self._get()
+
+        br = self._get("gzip, deflate, br")
+        gz = self._get("gzip, deflate")
+        raw = self._get("identity")
+
+        assert self.renders == 1
+        assert br["Content-Encoding"] == "br"
+        assert brotli.decompress(br.content) == PAGE
+        assert gz["Content-Encoding"] == "gzip"
+        assert gzip.decompress(gz.content) == PAGE
+        assert gz["Content-Length"] == str(len(gz.content))
+        assert not raw.has_header("Content-Encoding")
+        assert raw.content == PAGE
+        for response in (br, gz, raw):
+            assert "Accept-Encoding" in response["Vary"]
+
+    def test_refused_encodings_are_not_served(self):
+        self._get()
+
+        response = self._get("br;q=0, gzip")
+
+        assert response["Content-Encoding"] == "gzip"
+
+    def test_miss_is_answered_with_encoded_variant(self):
+        response = self._get("br")
+
+        assert response["Content-Encoding"] == "br"
+        assert brotli.decompress(response.content) == PAGE
+
+    def test_binary_responses_are_left_alone(self):
+        def view(request):
+            return HttpResponse(b"\x89PNG", content_type="image/png")
+
+        request = self.factory.get("/image/", HTTP_ACCEPT_ENCODING="br")
+        CompressedFetchFromCacheMiddleware(view).process_request(request)
+        response = StreamingUpdateCacheMiddleware(view)(request)
+
+        assert not response.has_header("Content-Encoding")
+        assert response.content == b"\x89PNG"
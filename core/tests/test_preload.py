@@ -0,0 +1,126 @@
+"""
+Tests for the preload Link header and 103 Early Hints.
+"""
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.signals import request_started
+from django.db import close_old_connections
+from django.urls import reverse
+
+from core import preload
+
+HEAD = """
+<head>
+  <link href="https://fonts.googleapis.com/css2?family=Inter&amp;display=swap"
+        rel="stylesheet" />
+  <link href="https://api.fontshare.com/v2/css?f[]=array@401" rel="stylesheet">
+  <link rel="icon" href="/static/favicon/favicon.svg" />
+  <link rel="stylesheet" href="/static/css/theme-variables.4f2a.css">
+  <script src="https://tweakcn.com/live-preview.min.js"></script>
+  <script defer src="/static/core/js/main.js"></script>
+</head>
+"""
+
+
+@pytest.fixture(autouse=True)
+def learned(monkeypatch):
+    monkeypatch.setattr(preload, "_template_links", {})
+    monkeypatch.setattr(preload, "_route_templates", {})
+
+
+def test_critical_links_preload_own_assets_and_preconnect_third_parties():
+    assert preload.critical_links(HEAD) == [
+        "<https://fonts.googleapis.com>; rel=preconnect",
+        "<https://fonts.gstatic.com>; rel=preconnect; crossorigin",
+        "<https://api.fontshare.com>; rel=preconnect",
+        "<https://cdn.fontshare.com>; rel=preconnect; crossorigin",
+        "<https://tweakcn.com>; rel=preconnect",
+        "</static/css/theme-variables.4f2a.css>; rel=preload; as=style",
+    ]
+
+
+@pytest.mark.django_db
+class TestLinkHeader:
+    def test_page_announces_its_head_assets(self, client):
+        response = client.get(reverse("core:about"))
+
+        links = response["Link"].split(", ")
+        preconnect = "<https://fonts.gstatic.com>; rel=preconnect; crossorigin"
+        assert preconnect in links
+        assert any(
+            "/css/theme-variables" in link and "as=style" in link
+            for link in links
+        )
+
+    def test_streamed_page_is_learned_for_the_next_requests(
+        self, client, settings
+    ):
+        settings.DEBUG = False
+        settings.STREAM_HTML_RESPONSES = True
+
+        first = client.get(reverse("core:ai"))
+        b"".join(first.streaming_content)
+        second = client.get(reverse("core:ai"))
+
+        assert not first.has_header("Link")
+        assert "rel=preload; as=style" in second["Link"]
+
+    def test_other_responses_are_left_alone(self, client):
+        assert not client.get(reverse("robots")).has_header("Link")
+
+
+async def _asgi_get(path):
+    """Run a GET through EarlyHintsASGIHandler; return the messages sent."""
+    messages = []
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Future()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "2",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+        "extensions": {preload.EARLY_HINT_EXTENSION: {}},
+    }
+    await preload.EarlyHintsASGIHandler()(scope, receive, send)
+    return messages
+
+
+@pytest.mark.django_db(transaction=True)
+def test_early_hints_are_sent_before_the_response(settings):
+    settings.DEBUG = False
+    # The sync-only debug middleware would run the stack below it in sync mode.
+    settings.MIDDLEWARE = [
+        name for name in settings.MIDDLEWARE if "QueryCountDebug" not in name
+    ]
+    path = reverse("core:about")
+    request_started.disconnect(close_old_connections)
+    try:
+        async_to_sync(_asgi_get)(path)
+        messages = async_to_sync(_asgi_get)(path)
+    finally:
+        request_started.connect(close_old_connections)
+
+    assert messages[0]["type"] == "http.response.early_hint"
+    assert b"rel=preload; as=style" in b", ".join(messages[0]["links"])
+    assert messages[1]["type"] == "http.response.start"
+    assert messages[1]["status"] == 200
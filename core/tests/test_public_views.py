@@ -0,0 +1,76 @@
+"""
+Tests for the session-free path of public views.
+"""
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from core.decorators import public_view
+from core.middleware import PublicViewMiddleware
+
+
+def _varies_on_cookie(response):
+    return "cookie" in response.get("Vary", "").lower()
+
+
+@pytest.mark.django_db
+class TestPublicViews:
+    @pytest.mark.parametrize(
+        "route",
+        ["core:home", "core:ai", "core:about", "projects:list", "sitemap"],
+    )
+    def test_public_pages_set_no_cookie(self, client, route):
+        response = client.get(reverse(route))
+
+        assert response.status_code == 200
+        assert not response.cookies
+        assert not _varies_on_cookie(response)
+        assert response.wsgi_request.is_public_view
+        assert not hasattr(response.wsgi_request, "session")
+
+    def test_project_detail_ignores_admin_session(
+        self, client, admin_user, project_factory
+    ):
+        project = project_factory()
+        client.force_login(admin_user)
+
+        response = client.get(project.get_absolute_url())
+
+        assert response.status_code == 200
+        assert not response.cookies
+        assert not _varies_on_cookie(response)
+        assert not hasattr(response.wsgi_request, "user")
+
+    def test_admin_keeps_sessions_and_csrf(self, client):
+        response = client.get(reverse("admin:login"))
+
+        assert not response.wsgi_request.is_public_view
+        assert "csrftoken" in response.cookies
+        assert _varies_on_cookie(response)
+
+    def test_only_safe_methods_are_public(self, rf):
+        request = rf.post(reverse("core:home"))
+
+        PublicViewMiddleware.mark(request)
+
+        assert not request.is_public_view
+
+
+class TestPublicViewMiddleware:
+    def test_strips_cookies_set_by_a_public_view(self):
+        @public_view
+        def view(request):
+            response = HttpResponse()
+            response.set_cookie("tracking", "1")
+            response["Vary"] = "Accept-Language, Cookie"
+            return response
+
+        request = RequestFactory().get("/")
+        request.is_public_view = True
+
+        response = PublicViewMiddleware.strip_cookies(request, view(request))
+
+        assert view.public_view
+        assert not response.cookies
+        assert response["Vary"] == "Accept-Language"
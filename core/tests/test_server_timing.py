@@ -0,0 +1,101 @@
+"""
+Tests for the Server-Timing header and timing log.
+"""
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from core import server_timing
+from core.middleware import ServerTimingMiddleware
+from projects.models import Project
+
+
+def _metrics(response):
+    metrics = {}
+    for item in response["Server-Timing"].split(", "):
+        name, value = item.split(";")
+        metrics[name] = float(value.split("=")[1])
+    return metrics
+
+
+@pytest.mark.django_db
+class TestServerTiming:
+    def test_page_reports_each_phase(self, admin_client, project_factory):
+        project_factory()
+
+        metrics = _metrics(
+            admin_client.get(reverse("admin:projects_project_changelist"))
+        )
+
+        assert metrics["db-count"] >= 1
+        assert metrics["db"] > 0
+        assert metrics["tpl"] > 0
+        assert metrics["view"] >= 0
+        assert metrics["total"] >= metrics["db"]
+        assert {"cache", "cache-hit", "cache-miss"} <= set(metrics)
+
+    def test_pages_shared_caches_store_are_not_timed(self, client):
+        response = client.get(reverse("projects:list"))
+
+        assert "s-maxage" in response["Cache-Control"]
+        assert not response.has_header("Server-Timing")
+
+    def test_cache_hits_and_misses_are_counted(self):
+        cache.set("server-timing-test", 1)
+
+        def view(request):
+            cache.get("server-timing-test")
+            cache.get("server-timing-missing")
+            cache.get_many(["server-timing-test", "server-timing-missing"])
+            return HttpResponse()
+
+        response = ServerTimingMiddleware(view)(RequestFactory().get("/"))
+
+        metrics = _metrics(response)
+        assert metrics["cache-hit"] == 2
+        assert metrics["cache-miss"] == 2
+
+    def test_queries_outside_requests_are_not_counted(self, project_factory):
+        project_factory()
+
+        def view(request):
+            return HttpResponse()
+
+        Project.objects.count()
+        response = ServerTimingMiddleware(view)(RequestFactory().get("/"))
+
+        assert _metrics(response)["db-count"] == 0
+        assert server_timing.current() is None
+
+    def test_async_mode_times_the_view(self, project_factory):
+        project_factory()
+
+        async def view(request):
+            await Project.objects.acount()
+            return HttpResponse()
+
+        response = async_to_sync(ServerTimingMiddleware(view))(
+            RequestFactory().get("/")
+        )
+
+        assert _metrics(response)["db-count"] == 1
+
+    def test_logs_one_json_line_when_enabled(
+        self, client, settings, caplog, monkeypatch
+    ):
+        settings.SERVER_TIMING_LOG = True
+        # The "portfolio" logger does not propagate to caplog's root handler.
+        monkeypatch.setattr(server_timing.logger, "handlers", [caplog.handler])
+
+        client.get(reverse("core:about"))
+
+        line = json.loads(caplog.records[-1].getMessage())
+        assert line["path"] == reverse("core:about")
+        assert line["status"] == 200
+        assert line["db-count"] >= 0
+        assert "total_ms" in line
@@ -0,0 +1,178 @@
+"""
+Tests for surrogate keys, shared-cache headers and purging.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import StringIO
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import CommandError, call_command
+from django.test import RequestFactory
+from django.urls import reverse
+
+from core import shared_cache
+from projects.models import Technology
+from projects.views import AsyncProjectDetailView
+
+
+class _PurgeEndpoint:
+    """Local stand-in for a CDN purge API, recording what it receives."""
+
+    def __init__(self, status=200):
+        self.received = []
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                endpoint.received.append(
+                    {"headers": dict(self.headers), "body": json.loads(body)}
+                )
+                self.send_response(status)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/purge"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _keys(response):
+    return response["Surrogate-Key"].split()
+
+
+@pytest.mark.django_db
+class TestSurrogateKeys:
+    def test_detail_page_names_its_projects_and_technologies(
+        self, client, settings, project_factory, category_factory
+    ):
+        settings.SHARED_CACHE_SECONDS = 3600
+        category = category_factory()
+        project = project_factory(category=category)
+        neighbour = project_factory(category=category)
+        technology = Technology.objects.create(name="Django", slug="django")
+        project.technologies.add(technology)
+
+        response = client.get(project.get_absolute_url())
+
+        keys = _keys(response)
+        assert keys[0] == "site"
+        assert {
+            f"project-{project.pk}",
+            f"project-{neighbour.pk}",
+            f"category-{category.pk}",
+            f"technology-{technology.pk}",
+        } <= set(keys)
+        assert response["Cache-Tag"] == ",".join(keys)
+        cache_control = response["Cache-Control"]
+        assert "public" in cache_control
+        assert "s-maxage=3600" in cache_control
+        assert "stale-while-revalidate=60" in cache_control
+
+    @pytest.mark.parametrize(
+        ("route", "expected"),
+        [
+            ("core:home", {"section-home", "projects"}),
+            ("core:about", {"section-about", "projects", "technologies"}),
+            (
+                "projects:list",
+                {"section-projects", "technologies", "categories"},
+            ),
+            ("sitemap", {"section-sitemap", "projects", "categories"}),
+        ],
+    )
+    def test_pages_name_their_section_and_lists(self, client, route, expected):
+        response = client.get(reverse(route))
+
+        assert expected <= set(_keys(response))
+
+    def test_async_view_tags_the_same_keys(self, client, project_factory):
+        project = project_factory()
+        request = RequestFactory().get(project.get_absolute_url())
+        request.LANGUAGE_CODE = "en"
+
+        response = async_to_sync(AsyncProjectDetailView.as_view())(
+            request, slug=project.slug
+        )
+
+        assert _keys(response) == _keys(client.get(project.get_absolute_url()))
+
+
+@pytest.mark.django_db
+class TestPurge:
+    @pytest.fixture
+    def queued(self, monkeypatch):
+        class NoTimer:
+            def __init__(self, delay, function):
+                pass
+
+            def start(self):
+                pass
+
+        monkeypatch.setattr(shared_cache.threading, "Timer", NoTimer)
+        monkeypatch.setattr(shared_cache, "_pending", {})
+        monkeypatch.setattr(shared_cache, "_timer", None)
+
+    def test_content_changes_are_purged_in_one_request(
+        self,
+        settings,
+        queued,
+        project_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        with _PurgeEndpoint() as endpoint:
+            settings.CACHE_PURGE_URL = endpoint.url
+            settings.CACHE_PURGE_TOKEN = "secret"
+            with django_capture_on_commit_callbacks(execute=True):
+                project = project_factory()
+                technology = Technology.objects.create(
+                    name="Rust", slug="rust"
+                )
+
+            shared_cache._send_pending()
+
+        assert len(endpoint.received) == 1
+        request = endpoint.received[0]
+        tags = request["body"]["tags"]
+        assert {
+            f"project-{project.pk}",
+            "projects",
+            f"technology-{technology.pk}",
+            "technologies",
+        } <= set(tags)
+        assert request["headers"]["Surrogate-Key"] == " ".join(tags)
+        assert request["headers"]["Authorization"] == "Bearer secret"
+
+    def test_nothing_is_scheduled_without_a_purge_url(
+        self, settings, project_factory, django_capture_on_commit_callbacks
+    ):
+        settings.CACHE_PURGE_URL = ""
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            project_factory()
+
+        assert callbacks == []
+
+    def test_purge_command_purges_every_page(self, settings):
+        with _PurgeEndpoint() as endpoint:
+            settings.CACHE_PURGE_URL = endpoint.url
+            call_command("purge_cache", "--all", stdout=StringIO())
+
+        assert endpoint.received[0]["body"] == {"tags": ["site"]}
+
+    def test_purge_command_reports_refused_purges(self, settings):
+        with _PurgeEndpoint(status=403) as endpoint:
+            settings.CACHE_PURGE_URL = endpoint.url
+            with pytest.raises(CommandError, match="403"):
+                call_command("purge_cache", "project-1", stdout=StringIO())
@@ -0,0 +1,166 @@
+"""
+Tests for the static site export.
+"""
+import gzip
+import subprocess
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.http import HttpResponse
+
+from core import static_site
+
+
+class TestPageFile:
+    def test_maps_pages_to_files(self):
+        root = Path("/site")
+
+        assert static_site.page_file(root, "/fr/") == Path(
+            "/site/fr/index.html"
+        )
+        assert static_site.page_file(
+            root, "/en/projects/?category=cli"
+        ) == Path("/site/en/projects/index@category=cli.html")
+        assert static_site.page_file(root, "/sitemap.xml") == Path(
+            "/site/sitemap.xml"
+        )
+
+
+class TestWriteHeaders:
+    def test_writes_the_security_headers_of_a_page(self, tmp_path):
+        response = HttpResponse()
+        response["Content-Security-Policy"] = (
+            "default-src 'self'; img-src \"data:\""
+        )
+        response["X-Frame-Options"] = "DENY"
+        response["Set-Cookie"] = "sessionid=1"
+
+        static_site.write_headers(tmp_path, response)
+
+        assert (tmp_path / "nginx-headers.conf").read_text() == (
+            "add_header Content-Security-Policy "
+            '"default-src \'self\'; img-src \\"data:\\"" always;\n'
+            'add_header X-Frame-Options "DENY" always;\n'
+        )
+
+
+@pytest.mark.django_db
+class TestBuildStaticSite:
+    def test_list_pages_follow_filter_form_and_pagination(
+        self, settings, project_factory
+    ):
+        settings.PROJECTS_PER_PAGE = 1
+        project = project_factory()
+        project_factory(category=project.category)
+
+        pages = static_site.list_pages()
+
+        assert "/en/projects/" in pages
+        assert (
+            f"/en/projects/?q=&category={project.category.slug}&sort=recent"
+            in pages
+        )
+        assert "/en/projects/?page=2" in pages
+        assert "/fr/projects/?page=2" in static_site.listing_pages()
+
+    def test_exports_every_language_with_encoded_siblings(
+        self, tmp_path, project_factory
+    ):
+        project = project_factory()
+        stale = tmp_path / "en" / "projects" / "gone" / "index.html"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("old")
+
+        call_command(
+            "build_static_site", output=str(tmp_path), stdout=StringIO()
+        )
+
+        detail = f"projects/{project.slug}/index.html"
+        french = (tmp_path / "fr" / detail).read_text()
+        assert "CRM CLI pour une agence événementielle" in french
+        compressed = (tmp_path / "en" / f"{detail}.gz").read_bytes()
+        assert gzip.decompress(compressed) == (
+            tmp_path / "en" / detail
+        ).read_bytes()
+        headers = (tmp_path / "nginx-headers.conf").read_text()
+        assert 'add_header X-Frame-Options "DENY" always;' in headers
+        assert "add_header Referrer-Policy" in headers
+        assert (tmp_path / "sitemap.xml").exists()
+        assert (tmp_path / "robots.txt").exists()
+        assert not (tmp_path / "index.html").exists()
+        assert not stale.exists()
+
+
+@pytest.mark.django_db
+class TestIncrementalRebuild:
+    @pytest.fixture
+    def queued(self, settings, tmp_path, monkeypatch):
+        settings.STATIC_SITE_ROOT = str(tmp_path)
+        launched = []
+
+        class NoTimer:
+            def __init__(self, delay, function):
+                pass
+
+            def start(self):
+                pass
+
+        monkeypatch.setattr(static_site.threading, "Timer", NoTimer)
+
+        def run(command, **kwargs):
+            launched.append(command)
+            return subprocess.CompletedProcess(command, 0)
+
+        monkeypatch.setattr(static_site.subprocess, "run", run)
+        monkeypatch.setattr(
+            static_site,
+            "_pending",
+            {"pages": {}, "projects": {}, "removed": {}, "full": False},
+        )
+        monkeypatch.setattr(static_site, "_timer", None)
+        return launched
+
+    def test_project_changes_are_merged_into_one_rebuild(
+        self, queued, project_factory, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            project = project_factory()
+            project.title = "Renamed"
+            project.save()
+
+        static_site._launch_rebuild()
+
+        assert len(queued) == 1
+        command = queued[0]
+        assert command[2] == "build_static_site"
+        assert command.count("--project") == 1
+        assert command[command.index("--project") + 1] == str(project.pk)
+
+    def test_unpublishing_removes_the_exported_page(
+        self, queued, project_factory, django_capture_on_commit_callbacks
+    ):
+        project = project_factory()
+        with django_capture_on_commit_callbacks(execute=True):
+            project.is_published = False
+            project.save()
+
+        static_site._launch_rebuild()
+
+        assert queued[0][-4:] == [
+            "--remove",
+            f"/en/projects/{project.slug}/",
+            "--remove",
+            f"/fr/projects/{project.slug}/",
+        ]
+
+    def test_nothing_is_scheduled_without_an_export(
+        self, settings, project_factory, django_capture_on_commit_callbacks
+    ):
+        settings.STATIC_SITE_ROOT = ""
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            project_factory()
+
+        assert callbacks == []
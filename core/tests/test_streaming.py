@@ -0,0 +1,124 @@
+"""
+Tests for streamed template responses.
+"""
+import re
+from html import unescape
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.middleware.cache import FetchFromCacheMiddleware
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import translation
+
+from core.middleware import StreamingUpdateCacheMiddleware
+from core.views import AIView
+
+CSRF_TOKEN = re.compile(r'name="csrfmiddlewaretoken" value="[^"]+"')
+
+
+def _body(response):
+    if response.streaming:
+        return b"".join(response.streaming_content).decode()
+    return response.content.decode()
+
+
+@pytest.mark.django_db
+class TestStreamingTemplateResponses:
+    def test_streamed_page_matches_rendered_page(
+        self, client, settings, project_factory
+    ):
+        project = project_factory()
+        url = reverse("projects:detail", kwargs={"slug": project.slug})
+
+        settings.STREAM_HTML_RESPONSES = False
+        rendered = client.get(url)
+        settings.STREAM_HTML_RESPONSES = True
+        streamed = client.get(url)
+
+        assert not rendered.streaming
+        assert streamed.streaming
+        assert CSRF_TOKEN.sub("", _body(streamed)) == CSRF_TOKEN.sub(
+            "", _body(rendered)
+        )
+
+    def test_head_and_navbar_are_flushed_first(self, client, settings):
+        settings.STREAM_HTML_RESPONSES = True
+
+        response = client.get(reverse("core:ai"))
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+
+        assert len(chunks) == 2
+        assert "</head>" in chunks[0]
+        assert "<main" not in chunks[0]
+        assert chunks[1].lstrip().startswith("<main")
+
+    def test_streamed_page_keeps_request_language(
+        self, client, settings, project_factory
+    ):
+        settings.STREAM_HTML_RESPONSES = True
+        project = project_factory()
+
+        with translation.override("fr"):
+            url = reverse("projects:detail", kwargs={"slug": project.slug})
+        response = client.get(url)
+
+        body = unescape(_body(response))
+        assert "CRM CLI pour une agence événementielle" in body
+
+    def test_public_views_do_not_issue_a_csrf_token(self, client, settings):
+        settings.STREAM_HTML_RESPONSES = True
+
+        response = client.get(reverse("core:ai"))
+        _body(response)
+
+        assert settings.CSRF_COOKIE_NAME not in response.cookies
+        assert "CSRF_COOKIE" not in response.wsgi_request.META
+
+    def test_other_views_issue_the_csrf_token_before_streaming(self, settings):
+        settings.STREAM_HTML_RESPONSES = True
+        request = RequestFactory().get("/ai/")
+
+        AIView.as_view()(request)
+
+        assert request.META["CSRF_COOKIE"]
+
+
+class TestStreamingUpdateCacheMiddleware:
+    def setup_method(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _fetch(self, request):
+        middleware = FetchFromCacheMiddleware(lambda request: HttpResponse())
+        return middleware.process_request(request)
+
+    def _serve(self, view):
+        request = self.factory.get("/streamed/")
+        assert self._fetch(request) is None
+        middleware = StreamingUpdateCacheMiddleware(view)
+        return middleware(request)
+
+    def test_caches_full_body_once_stream_is_consumed(self):
+        response = self._serve(
+            lambda request: StreamingHttpResponse(iter(["<head>", "<body>"]))
+        )
+
+        assert self._fetch(self.factory.get("/streamed/")) is None
+        assert b"".join(response.streaming_content) == b"<head><body>"
+        assert "max-age" in response["Cache-Control"]
+
+        cached = self._fetch(self.factory.get("/streamed/"))
+        assert cached is not None
+        assert not cached.streaming
+        assert cached.content == b"<head><body>"
+
+    def test_does_not_cache_interrupted_stream(self):
+        response = self._serve(
+            lambda request: StreamingHttpResponse(iter(["<head>", "<body>"]))
+        )
+
+        next(iter(response.streaming_content))
+
+        assert self._fetch(self.factory.get("/streamed/")) is None
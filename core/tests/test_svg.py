@@ -0,0 +1,103 @@
+import pytest
+
+from core.svg import inline_svg, minify_svg, round_numbers
+
+EDITOR_SVG = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!-- Created with Inkscape -->
+<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:xlink="http://www.w3.org/1999/xlink"
+     xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+     xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+     width="800" height="800" viewBox="0 0 600 599.999999"
+     inkscape:version="1.3">
+  <metadata>
+    <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/>
+  </metadata>
+  <sodipodi:namedview id="view" pagecolor="#ffffff"/>
+  <defs>
+    <clipPath id="clip"><rect width="10.123456" height="5"/></clipPath>
+  </defs>
+  <g clip-path="url(#clip)">
+    <path d="M 0.123456 1.987654 L 2.5 3.5" inkscape:label="outline"/>
+    <use xlink:href="#clip"/>
+  </g>
+  <text x="1"> Hello <tspan>world</tspan></text>
+</svg>
+"""
+
+
+class TestMinifySvg:
+    def test_strips_metadata_comments_and_editor_namespaces(self):
+        minified = minify_svg(EDITOR_SVG).decode()
+
+        assert "metadata" not in minified
+        assert "inkscape" not in minified
+        assert "sodipodi" not in minified
+        assert "<!--" not in minified
+        assert "<?xml" not in minified
+        assert len(minified) < len(EDITOR_SVG)
+
+    def test_rounds_coordinates_and_keeps_text(self):
+        minified = minify_svg(EDITOR_SVG).decode()
+
+        # One decimal is a 6000th of the 600-unit drawing
+        assert 'd="M 0.1 2 L 2.5 3.5"' in minified
+        assert 'width="10.1"' in minified
+        assert 'viewBox="0 0 600 600"' in minified
+        assert "> Hello <tspan>world</tspan></text>" in minified
+
+    def test_precision_follows_the_drawing_size(self):
+        icon = (
+            b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">'
+            b'<path d="M 0.123456 1.987654"/></svg>'
+        )
+        poster = icon.replace(b"0 0 24 24", b"0 0 2343.75 2343.749891")
+
+        assert b'd="M 0.12 1.99"' in minify_svg(icon)
+        assert b'd="M 0 2"' in minify_svg(poster)
+        assert b'd="M 0.123 1.988"' in minify_svg(icon, precision=3)
+
+    def test_transforms_and_gradient_stops_keep_their_precision(self):
+        card = b"""<svg xmlns="http://www.w3.org/2000/svg"
+     viewBox="0 0 600 600">
+  <linearGradient id="fade" gradientTransform="rotate(12.3456)">
+    <stop offset="0.33" stop-color="#000"/>
+    <stop offset="0.6667" stop-color="#fff"/>
+  </linearGradient>
+  <g transform="matrix(0.0523 0 0 0.0523 10.25 10.25)">
+    <path transform="scale(0.25) translate(1.123456 2)" d="M 10.25 0"/>
+  </g>
+</svg>"""
+
+        minified = minify_svg(card).decode()
+
+        assert 'gradientTransform="rotate(12.3456)"' in minified
+        assert 'offset="0.33"' in minified
+        assert 'offset="0.6667"' in minified
+        assert 'transform="matrix(0.0523 0 0 0.0523 10.25 10.25)"' in minified
+        assert 'transform="scale(0.25) translate(1.1235 2)"' in minified
+        # Coordinates still follow the 600-unit drawing
+        assert 'd="M 10.2 0"' in minified
+
+    def test_rounding_never_merges_adjacent_numbers(self):
+        assert round_numbers("M1.999.5L-0.0000001 3") == "M2 0.5L0 3"
+
+    def test_rejects_documents_that_are_not_svg(self):
+        with pytest.raises(ValueError):
+            minify_svg(b"<html></html>")
+
+
+class TestInlineSvg:
+    def test_prefixes_ids_and_sets_root_attributes(self, tmp_path):
+        path = tmp_path / "card.svg"
+        path.write_bytes(EDITOR_SVG)
+
+        markup = inline_svg(
+            path, id_prefix="card-demo", attributes={"role": "img"}
+        )
+
+        assert 'id="card-demo-clip"' in markup
+        assert 'clip-path="url(#card-demo-clip)"' in markup
+        assert 'xlink:href="#card-demo-clip"' in markup
+        assert 'role="img"' in markup
+        assert 'width="800"' not in markup
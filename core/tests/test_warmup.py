@@ -0,0 +1,56 @@
+"""
+Tests for worker warm-up.
+"""
+from pathlib import Path
+
+import pytest
+
+from core import warmup
+from core.localization import translation_service
+
+
+class TestWarmUp:
+    def test_lists_project_templates_only(self):
+        names = warmup.project_template_names()
+
+        assert "projects/project_detail.html" in names
+        assert "core/components/navbar.html" in names
+        assert not any(name.startswith("admin/") for name in names)
+
+    def test_compiles_every_project_template(self):
+        assert warmup.warm_templates() == len(warmup.project_template_names())
+
+    def test_primes_translators_for_each_language(self, settings, monkeypatch):
+        monkeypatch.setattr(translation_service, "_translators", {})
+
+        warmup.warm_caches()
+
+        assert set(translation_service._translators) == {
+            code for code, _name in settings.LANGUAGES
+        }
+
+    def test_reset_connections_closes_redis_clients(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from django.core.cache import caches
+
+        closed = []
+        client = SimpleNamespace(do_close_clients=lambda: closed.append(True))
+        redis_cache = SimpleNamespace(client=client)
+        monkeypatch.setattr(
+            caches, "all", lambda initialized_only=False: [redis_cache]
+        )
+
+        warmup.reset_connections()
+
+        assert closed == [True]
+
+    @pytest.mark.skipif(
+        not Path("/proc/self/smaps_rollup").exists(),
+        reason="needs Linux /proc",
+    )
+    def test_memory_usage_splits_unique_pages(self):
+        usage = warmup.memory_usage()
+
+        assert set(usage) == {"rss", "pss", "unique"}
+        assert 0 < usage["unique"] <= usage["pss"] <= usage["rss"]
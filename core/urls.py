@@ -1,14 +1,65 @@
 from django.urls import path
-from .views import AIView, AboutView, CLIProjectsView, CompetencesView, DjangoProjectsView, HomeView
+from django.views.decorators.cache import cache_page
+
+from .async_views import select_view
+from .decorators import public_view
+from .views import (
+    AIView,
+    AboutView,
+    AsyncAboutView,
+    AsyncAIView,
+    AsyncCLIProjectsView,
+    AsyncCompetencesView,
+    AsyncDjangoProjectsView,
+    AsyncHomeView,
+    CLIProjectsView,
+    CompetencesView,
+    DjangoProjectsView,
+    HomeView,
+)
 
 
 app_name = "core"
 
 urlpatterns = [
-    path("", HomeView.as_view(), name="home"),
-    path("ai/", AIView.as_view(), name="ai"),
-    path("cli/", CLIProjectsView.as_view(), name="cli"),
-    path("django/", DjangoProjectsView.as_view(), name="django"),
-    path("about/", AboutView.as_view(), name="about"),
-    path("skills/", CompetencesView.as_view(), name="skills"),
+    path(
+        "",
+        public_view(select_view(HomeView, AsyncHomeView).as_view()),
+        name="home",
+    ),
+    path(
+        "ai/",
+        public_view(select_view(AIView, AsyncAIView).as_view()),
+        name="ai",
+    ),
+    path(
+        "cli/",
+        public_view(
+            select_view(CLIProjectsView, AsyncCLIProjectsView).as_view()
+        ),
+        name="cli",
+    ),
+    path(
+        "django/",
+        public_view(
+            select_view(DjangoProjectsView, AsyncDjangoProjectsView).as_view()
+        ),
+        name="django",
+    ),
+    path(
+        "about/",
+        public_view(
+            cache_page(60 * 60)(
+                select_view(AboutView, AsyncAboutView).as_view()
+            )
+        ),
+        name="about",
+    ),
+    path(
+        "skills/",
+        public_view(
+            select_view(CompetencesView, AsyncCompetencesView).as_view()
+        ),
+        name="skills",
+    ),
 ]
@@ -1,35 +1,308 @@
+import logging
+import math
 from io import BytesIO
 
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from PIL import Image
+from PIL import Image, ImageChops, ImageSequence, ImageStat
+
+logger = logging.getLogger("portfolio")
+
+# Content type and file extension of each encoding the optimizer may pick.
+IMAGE_ENCODINGS = {
+    "JPEG": ("image/jpeg", ".jpg"),
+    "PNG": ("image/png", ".png"),
+    "WEBP": ("image/webp", ".webp"),
+}
+
+# Images with at most this many distinct colors are treated as flat art
+# (screenshots, terminal captures, diagrams) rather than photos.
+FLAT_MAX_COLORS = 4096
+
+# Minimum PSNR in dB a lossy encoding must reach to be kept, per image class.
+MIN_PSNR = {"photo": 34.0, "flat": 40.0, "transparent": 40.0}
+
+
+def classify_image(image):
+    """
+    Classify an image to decide which encodings are worth trying.
+
+    Returns:
+        str: "transparent" when some pixels are not fully opaque, "flat" for
+        images with few distinct colors, "photo" otherwise.
+    """
+
+    if image.mode in {"RGBA", "LA", "PA"} or "transparency" in image.info:
+        alpha = image.convert("RGBA").getchannel("A")
+        if alpha.getextrema()[0] < 255:
+            return "transparent"
+    if image.convert("RGB").getcolors(maxcolors=FLAT_MAX_COLORS) is not None:
+        return "flat"
+    return "photo"
+
+
+# Image.info entries carried over to every re-encoding: dropping the ICC
+# profile would shift wide-gamut images to sRGB.
+PRESERVED_METADATA = ("icc_profile", "exif")
+
+
+def _metadata(image):
+    """Return the save() options keeping the color profile and EXIF data."""
+    return {
+        key: image.info[key]
+        for key in PRESERVED_METADATA
+        if image.info.get(key)
+    }
+
+
+def _encode(image, image_format, **options):
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, **options)
+    return buffer.getvalue()
+
+
+def _candidates(image, image_class, formats, quality, metadata):
+    """Yield ``(format, data, lossless)`` encodings worth comparing."""
+    only_format = len(formats) == 1
+    if "PNG" in formats:
+        if image_class != "photo":
+            method = (
+                Image.Quantize.FASTOCTREE
+                if image.mode == "RGBA"
+                else Image.Quantize.MEDIANCUT
+            )
+            palette = image.quantize(
+                256, method=method, dither=Image.Dither.NONE
+            )
+            data = _encode(palette, "PNG", optimize=True, **metadata)
+            yield "PNG", data, False
+        if only_format:
+            # Lossless fallback; otherwise lossless WebP plays that role.
+            yield "PNG", _encode(image, "PNG", optimize=True, **metadata), True
+    if "WEBP" in formats:
+        if image_class != "photo" or only_format:
+            yield "WEBP", _encode(
+                image, "WEBP", lossless=True, method=4, **metadata
+            ), True
+        yield "WEBP", _encode(
+            image, "WEBP", quality=quality, method=4, **metadata
+        ), False
+    if "JPEG" in formats and image.mode != "RGBA":
+        yield "JPEG", _encode(
+            image,
+            "JPEG",
+            quality=quality,
+            optimize=True,
+            progressive=True,
+            **metadata,
+        ), False
+
+
+def _comparable(image):
+    """Return ``image`` with color premultiplied by alpha, for PSNR checks."""
+    if image.mode != "RGBA":
+        return image
+    black = Image.new("RGBA", image.size, (0, 0, 0, 255))
+    red, green, blue, _alpha = Image.alpha_composite(black, image).split()
+    return Image.merge("RGBA", (red, green, blue, image.getchannel("A")))
+
+
+def psnr(reference, data):
+    """
+    Return the peak signal-to-noise ratio of encoded bytes against a source.
+
+    Args:
+        reference: Source image, already passed through ``_comparable``.
+        data: Encoded candidate.
+
+    Returns:
+        float: PSNR in dB (``math.inf`` for identical pixels).
+    """
+
+    with Image.open(BytesIO(data)) as decoded:
+        candidate = _comparable(decoded.convert(reference.mode))
+    stat = ImageStat.Stat(ImageChops.difference(reference, candidate))
+    pixels = reference.width * reference.height
+    mse = sum(stat.sum2) / (len(stat.sum2) * pixels)
+    return math.inf if mse == 0 else 10 * math.log10(255**2 / mse)
+
+
+def encode_best(image, formats=None, quality=85, image_class=None):
+    """
+    Encode ``image`` with the smallest candidate that keeps enough quality.
+
+    Palette PNG, lossless and lossy WebP and JPEG are tried depending on the
+    image class. Lossy results below the class PSNR threshold are discarded;
+    if every candidate falls below it, the most faithful one wins. The ICC
+    profile and EXIF data of the source are kept in every candidate.
+
+    Args:
+        image: Pillow image.
+        formats: Allowed output formats (default: every IMAGE_ENCODINGS key).
+        quality: Quality used by lossy encoders.
+        image_class: Precomputed ``classify_image`` result, useful when the
+            image was resized after classification.
+
+    Returns:
+        tuple[bytes, str, str]: Encoded bytes, chosen format and image class.
+
+    Raises:
+        ValueError: If no allowed format can represent the image.
+    """
+
+    image_class = image_class or classify_image(image)
+    metadata = _metadata(image)
+    image = image.convert("RGBA" if image_class == "transparent" else "RGB")
+    formats = set(formats or IMAGE_ENCODINGS)
+    reference = _comparable(image)
+    threshold = MIN_PSNR[image_class]
+
+    best = None
+    most_faithful = None
+    for image_format, data, lossless in _candidates(
+        image, image_class, formats, quality, metadata
+    ):
+        score = math.inf if lossless else psnr(reference, data)
+        if score >= threshold:
+            if best is None or len(data) < len(best[1]):
+                best = (image_format, data)
+        elif most_faithful is None or score > most_faithful[0]:
+            most_faithful = (score, image_format, data)
+
+    if best is None and most_faithful is None:
+        raise ValueError(
+            f"No encoding among {sorted(formats)} fits this image"
+        )
+    image_format, data = best or most_faithful[1:]
+    return data, image_format, image_class
+
+
+def recompress_image(data, quality=85):
+    """
+    Re-encode image bytes in their original format with tighter settings.
+
+    PNG screenshots and transparent images may be palette-quantized when the
+    result stays above the quality threshold.
+
+    Args:
+        data: Raw bytes of a JPEG, PNG or WebP image.
+        quality: Quality used by lossy encoders.
+
+    Returns:
+        tuple[bytes, str]: Re-encoded bytes and the detected format.
+
+    Raises:
+        ValueError: If the format is unsupported or the image is animated.
+    """
+
+    image = Image.open(BytesIO(data))
+    image_format = image.format
+    if image_format not in IMAGE_ENCODINGS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+    if getattr(image, "is_animated", False):
+        raise ValueError("Animated images are not recompressed")
+
+    optimized, _format, _image_class = encode_best(
+        image, formats={image_format}, quality=quality
+    )
+    return optimized, image_format
+
+
+# File name suffixes of the variants generated from an animated GIF.
+ANIMATED_SUFFIX = ".anim.webp"
+POSTER_SUFFIX = ".poster.webp"
+
+
+def convert_animated_gif(data, max_dimension=None, quality=75):
+    """
+    Convert an animated GIF into an animated WebP and a static poster frame.
+
+    Frame durations and the loop count are preserved. Animated WebP is
+    typically several times smaller than the equivalent GIF.
+
+    Args:
+        data: Raw bytes of an animated GIF.
+        max_dimension: Optional bounding box size frames are shrunk to.
+        quality: Quality used by the lossy WebP encoder.
+
+    Returns:
+        tuple[bytes, bytes]: Animated WebP bytes and poster WebP bytes.
+
+    Raises:
+        ValueError: If the data is not an animated GIF.
+    """
+
+    image = Image.open(BytesIO(data))
+    if image.format != "GIF" or not getattr(image, "is_animated", False):
+        raise ValueError("Not an animated GIF")
+
+    frames = []
+    durations = []
+    for frame in ImageSequence.Iterator(image):
+        durations.append(frame.info.get("duration", 100))
+        frame = frame.convert("RGBA")
+        if max_dimension:
+            frame.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+        frames.append(frame)
+
+    animated = BytesIO()
+    frames[0].save(
+        animated,
+        format="WEBP",
+        save_all=True,
+        append_images=frames[1:],
+        duration=durations,
+        loop=image.info.get("loop", 0),
+        quality=quality,
+        method=4,
+    )
+    poster = BytesIO()
+    frames[0].save(poster, format="WEBP", quality=80, method=6)
+    return animated.getvalue(), poster.getvalue()
 
 
 def optimize_image(image_field, max_width=1920, quality=85):
-    """Compress and resize uploaded images for optimal delivery."""
+    """
+    Compress and resize uploaded images for optimal delivery.
 
-    image = Image.open(image_field)
+    The image is classified (photo, flat, transparent) and stored in whichever
+    of palette PNG, WebP or JPEG is smallest while staying above the quality
+    threshold, so screenshots stay sharp and logos keep their alpha channel.
+    The returned file exposes ``image_format``, ``image_class`` and
+    ``bytes_saved`` attributes.
+    """
 
-    if image.mode in {"RGBA", "LA", "P"}:
-        image = image.convert("RGB")
+    image = Image.open(image_field)
+    image_class = classify_image(image)
+    image = image.convert("RGBA" if image_class == "transparent" else "RGB")
 
     if image.width > max_width:
         ratio = max_width / float(image.width)
         new_height = int(image.height * ratio)
         image = image.resize((max_width, new_height), Image.LANCZOS)
 
-    buffer = BytesIO()
-    image.save(buffer, format="JPEG", quality=quality, optimize=True)
-    buffer.seek(0)
+    data, image_format, image_class = encode_best(
+        image, quality=quality, image_class=image_class
+    )
+    content_type, extension = IMAGE_ENCODINGS[image_format]
+    original_size = getattr(image_field, "size", None) or len(data)
 
-    file_name = image_field.name.rsplit(".", 1)[0] + ".jpg"
-    return InMemoryUploadedFile(
-        buffer,
+    file_name = image_field.name.rsplit(".", 1)[0] + extension
+    optimized = InMemoryUploadedFile(
+        BytesIO(data),
         field_name="ImageField",
         name=file_name,
-        content_type="image/jpeg",
-        size=buffer.getbuffer().nbytes,
+        content_type=content_type,
+        size=len(data),
         charset=None,
     )
+    optimized.image_format = image_format
+    optimized.image_class = image_class
+    optimized.bytes_saved = original_size - len(data)
+    logger.info(
+        f"Optimized {image_field.name}: {image_class} image stored as "
+        f"{image_format} ({original_size} -> {len(data)} bytes)"
+    )
+    return optimized
 
 
 def get_client_ip(request):
@@ -2,14 +2,33 @@ import logging
 import random
 
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseRedirect,
+)
 from django.urls import reverse
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
 from django.utils.translation import get_language
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_safe
 from django.views.generic import TemplateView
 
+from core import metrics
+from core.async_views import AsyncTemplateMixin
+from core.image_resize import get_resized, verify
 from core.localization.translation_service import translate_text
+from core.shared_cache import (
+    PROJECTS_KEY,
+    TECHNOLOGIES_KEY,
+    SurrogateKeyMixin,
+    project_keys,
+    section_key,
+)
+from core.streaming import StreamingTemplateMixin
 from projects.models import Project, Technology
 
 logger = logging.getLogger("portfolio")
@@ -34,6 +53,7 @@ CLI_PROJECT_SLUGS = [
 
 DJANGO_TECH_SLUGS = ["django", "django-rest-framework"]
 FEATURED_PROJECTS_COUNT = 4
+RESIZED_IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 
 def _ordered_projects_by_slugs(slugs):
@@ -50,6 +70,18 @@ def _ordered_projects_by_slugs(slugs):
         ]
 
 
+async def _aordered_projects_by_slugs(slugs):
+    projects = (
+        Project.published.select_related("category")
+        .prefetch_related("technologies")
+        .filter(slug__in=slugs)
+    )
+    projects_by_slug = {project.slug: project async for project in projects}
+    return [
+        projects_by_slug[slug] for slug in slugs if slug in projects_by_slug
+    ]
+
+
 def _top_technologies(categories, limit=6):
     return (
         Technology.objects.filter(category__in=categories)
@@ -70,14 +102,39 @@ def _random_featured_projects(limit=FEATURED_PROJECTS_COUNT):
     return random.sample(featured_projects, selection_size)
 
 
-class HomeView(TemplateView):
+async def _arandom_featured_projects(limit=FEATURED_PROJECTS_COUNT):
+    featured_projects = [
+        project
+        async for project in Project.published.select_related("category")
+        .prefetch_related("technologies")
+        .filter(is_featured=True)
+    ]
+    selection_size = min(len(featured_projects), limit)
+    if not selection_size:
+        return []
+    return random.sample(featured_projects, selection_size)
+
+
+class HomeView(SurrogateKeyMixin, TemplateView):
     """Homepage view with a short introduction and navigation hub."""
 
     template_name = "core/home.html"
+    surrogate_keys = (section_key("home"), PROJECTS_KEY)
+
+    def get_surrogate_keys(self, context):
+        return [
+            *super().get_surrogate_keys(context),
+            *project_keys(context["featured_projects"]),
+        ]
 
     def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
+        context = self.get_page_context(**kwargs)
         context["featured_projects"] = _random_featured_projects()
+        return context
+
+    def get_page_context(self, **kwargs):
+        """Context that needs no queries, shared with AsyncHomeView."""
+        context = super().get_context_data(**kwargs)
         context["home_intro"] = {
             "title": "dim-gggl",
             "body": (
@@ -121,12 +178,27 @@ class HomeView(TemplateView):
         return context
 
 
-class AIView(TemplateView):
+class AIView(SurrogateKeyMixin, StreamingTemplateMixin, TemplateView):
     """Editorial AI page with prompting sections and curated projects."""
 
     template_name = "core/ai.html"
+    surrogate_keys = (section_key("ai"), PROJECTS_KEY)
+
+    def get_surrogate_keys(self, context):
+        return [
+            *super().get_surrogate_keys(context),
+            *project_keys(context["vibe_projects"]),
+        ]
 
     def get_context_data(self, **kwargs):
+        context = self.get_page_context(**kwargs)
+        context["vibe_projects"] = _ordered_projects_by_slugs(
+            VIBE_PROJECT_SLUGS
+        )
+        return context
+
+    def get_page_context(self, **kwargs):
+        """Context that needs no queries, shared with AsyncAIView."""
         context = super().get_context_data(**kwargs)
         context["ai_page"] = {
             "prompting": {
@@ -297,18 +369,32 @@ Qui te ressemblerait...
                 "project_slugs": VIBE_PROJECT_SLUGS,
             },
         }
-        context["vibe_projects"] = _ordered_projects_by_slugs(VIBE_PROJECT_SLUGS)
         return context
 
 
-class CLIProjectsView(TemplateView):
+class CLIProjectsView(SurrogateKeyMixin, TemplateView):
     """Curated CLI portfolio page."""
 
     template_name = "core/cli.html"
+    surrogate_keys = (section_key("cli"), PROJECTS_KEY)
+
+    def get_surrogate_keys(self, context):
+        return [
+            *super().get_surrogate_keys(context),
+            *project_keys(context["projects"]),
+        ]
 
     def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
+        context = self.get_page_context(**kwargs)
         projects = _ordered_projects_by_slugs(CLI_PROJECT_SLUGS)
+        context["projects"] = projects
+        missing = len(CLI_PROJECT_SLUGS) - len(projects)
+        context["missing_project_count"] = missing
+        return context
+
+    def get_page_context(self, **kwargs):
+        """Context that needs no queries, shared with AsyncCLIProjectsView."""
+        context = super().get_context_data(**kwargs)
         context["page_intro"] = {
             "title": "CLI",
             "body": (
@@ -316,17 +402,30 @@ class CLIProjectsView(TemplateView):
                 "workflow, ergonomics, and packaging."
             ),
         }
-        context["projects"] = projects
-        context["missing_project_count"] = len(CLI_PROJECT_SLUGS) - len(projects)
         return context
 
 
-class DjangoProjectsView(TemplateView):
+class DjangoProjectsView(SurrogateKeyMixin, TemplateView):
     """Published Django and DRF project page."""
 
     template_name = "core/django.html"
+    surrogate_keys = (section_key("django"), PROJECTS_KEY, TECHNOLOGIES_KEY)
+
+    def get_surrogate_keys(self, context):
+        return [
+            *super().get_surrogate_keys(context),
+            *project_keys(context["projects"]),
+        ]
 
     def get_context_data(self, **kwargs):
+        context = self.get_page_context(**kwargs)
+        context["projects"] = self.get_projects()
+        context["total_projects"] = Project.published.count()
+        context["technologies_count"] = Technology.objects.count()
+        return context
+
+    def get_page_context(self, **kwargs):
+        """Context needing no queries, shared with AsyncDjangoProjectsView."""
         context = super().get_context_data(**kwargs)
         intro_body = (
             "Projects built with Django and Django REST Framework, both from "
@@ -342,23 +441,31 @@ class DjangoProjectsView(TemplateView):
                 or intro_body
             ),
         }
-        context["projects"] = (
+        return context
+
+    def get_projects(self):
+        return (
             Project.published.select_related("category")
             .prefetch_related("technologies")
             .filter(technologies__slug__in=DJANGO_TECH_SLUGS)
             .order_by("order", "-completed_at")
             .distinct()
         )
-        context["total_projects"] = Project.published.count()
-        context["technologies_count"] = Technology.objects.count()
-        return context
 
 
-@method_decorator(cache_page(60 * 60), name="dispatch")
-class AboutView(TemplateView):
-    """About page with technologies breakdown."""
+class AboutView(SurrogateKeyMixin, TemplateView):
+    """About page with technologies breakdown (cached an hour, see urls)."""
 
     template_name = "core/about.html"
+    surrogate_keys = (section_key("about"), PROJECTS_KEY, TECHNOLOGIES_KEY)
+
+    # Context key and technology categories of each skills group.
+    SKILL_GROUPS = {
+        "backend_techs": ["backend", "language"],
+        "frontend_techs": ["frontend"],
+        "database_techs": ["database"],
+        "tools": ["tool"],
+    }
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -366,33 +473,24 @@ class AboutView(TemplateView):
         # Statistics
         context["total_projects"] = Project.published.count()
         context["technologies_count"] = Technology.objects.count()
-        context["years_experience"] = settings.PORTFOLIO_PERSON["years_experience"]
+        context["years_experience"] = settings.PORTFOLIO_PERSON[
+            "years_experience"
+        ]
 
         # Technologies by category with color gradient based on proficiency
-        context["backend_techs"] = self._add_skill_colors(
-            Technology.objects.filter(category__in=["backend", "language"]).order_by(
-                "-proficiency", "name"
+        for key, categories in self.SKILL_GROUPS.items():
+            context[key] = self._add_skill_colors(
+                self.get_technologies(categories)
             )
-        )
-
-        context["frontend_techs"] = self._add_skill_colors(
-            Technology.objects.filter(category="frontend").order_by(
-                "-proficiency", "name"
-            )
-        )
 
-        context["database_techs"] = self._add_skill_colors(
-            Technology.objects.filter(category="database").order_by(
-                "-proficiency", "name"
-            )
-        )
+        return context
 
-        context["tools"] = self._add_skill_colors(
-            Technology.objects.filter(category="tool").order_by("-proficiency", "name")
+    @staticmethod
+    def get_technologies(categories):
+        return Technology.objects.filter(category__in=categories).order_by(
+            "-proficiency", "name"
         )
 
-        return context
-
     def _add_skill_colors(self, technologies):
         """
         Add gradient colors to technologies based on proficiency level.
@@ -419,10 +517,69 @@ class AboutView(TemplateView):
         return tech_list
 
 
-class CompetencesView(TemplateView):
+class CompetencesView(SurrogateKeyMixin, TemplateView):
     """Skills/competences page."""
 
     template_name = "core/competences.html"
+    surrogate_keys = (section_key("skills"),)
+
+
+class AsyncHomeView(AsyncTemplateMixin, HomeView):
+    async def aget_context_data(self, **kwargs):
+        context = self.get_page_context(**kwargs)
+        context["featured_projects"] = await _arandom_featured_projects()
+        return context
+
+
+class AsyncAIView(AsyncTemplateMixin, AIView):
+    async def aget_context_data(self, **kwargs):
+        context = self.get_page_context(**kwargs)
+        context["vibe_projects"] = await _aordered_projects_by_slugs(
+            VIBE_PROJECT_SLUGS
+        )
+        return context
+
+
+class AsyncCLIProjectsView(AsyncTemplateMixin, CLIProjectsView):
+    async def aget_context_data(self, **kwargs):
+        context = self.get_page_context(**kwargs)
+        projects = await _aordered_projects_by_slugs(CLI_PROJECT_SLUGS)
+        context["projects"] = projects
+        missing = len(CLI_PROJECT_SLUGS) - len(projects)
+        context["missing_project_count"] = missing
+        return context
+
+
+class AsyncDjangoProjectsView(AsyncTemplateMixin, DjangoProjectsView):
+    async def aget_context_data(self, **kwargs):
+        context = self.get_page_context(**kwargs)
+        context["projects"] = [
+            project async for project in self.get_projects()
+        ]
+        context["total_projects"] = await Project.published.acount()
+        context["technologies_count"] = await Technology.objects.acount()
+        return context
+
+
+class AsyncAboutView(AsyncTemplateMixin, AboutView):
+    async def aget_context_data(self, **kwargs):
+        context = super(AboutView, self).get_context_data(**kwargs)
+        context["total_projects"] = await Project.published.acount()
+        context["technologies_count"] = await Technology.objects.acount()
+        context["years_experience"] = settings.PORTFOLIO_PERSON[
+            "years_experience"
+        ]
+        for key, categories in self.SKILL_GROUPS.items():
+            technologies = [
+                technology
+                async for technology in self.get_technologies(categories)
+            ]
+            context[key] = self._add_skill_colors(technologies)
+        return context
+
+
+class AsyncCompetencesView(AsyncTemplateMixin, CompetencesView):
+    pass
 
 
 class RobotsTxtView(TemplateView):
@@ -439,6 +596,76 @@ class RobotsTxtView(TemplateView):
         return HttpResponse("\n".join(lines), content_type="text/plain")
 
 
+@require_safe
+def language_redirect(request):
+    """
+    Redirect the bare root to the home page in the visitor's language.
+
+    LocaleMiddleware picked the language from the language cookie, then
+    Accept-Language, since the path carries none.
+    """
+    with translation.override(request.LANGUAGE_CODE):
+        response = HttpResponseRedirect(reverse("core:home"))
+    patch_vary_headers(response, ("Cookie",))
+    return response
+
+
+@require_safe
+def resized_image(request, width, height, path):
+    """
+    Serve a signed resized variant of a media or static image.
+
+    Variants are rendered on first request and then served from the bounded
+    disk cache, either streamed by Django or handed to nginx through
+    X-Accel-Redirect when IMAGE_RESIZE_ACCEL_REDIRECT_PREFIX is set.
+    """
+    max_dimension = settings.IMAGE_RESIZE_MAX_DIMENSION
+    if not (0 < width <= max_dimension and 0 < height <= max_dimension):
+        raise Http404("Unsupported image size")
+    version = request.GET.get("v", "")
+    if not verify(width, height, path, version, request.GET.get("s")):
+        return HttpResponseForbidden("Invalid image signature")
+
+    accel_prefix = settings.IMAGE_RESIZE_ACCEL_REDIRECT_PREFIX
+    # A variant evicted between the cache lookup and open() is rendered again.
+    for _attempt in range(2):
+        resized = get_resized(path, width, height)
+        if resized is None:
+            raise Http404("Image not found")
+        cached_path, content_type = resized
+        if accel_prefix:
+            relative = cached_path.relative_to(settings.IMAGE_RESIZE_CACHE_DIR)
+            response = HttpResponse(content_type=content_type)
+            response["X-Accel-Redirect"] = (
+                f"{accel_prefix.rstrip('/')}/{relative}"
+            )
+            # The redirect must not outlive the eviction of its file in the
+            # page cache; browsers and CDNs still cache the image itself.
+            request._cache_update_cache = False
+            break
+        try:
+            response = FileResponse(
+                cached_path.open("rb"), content_type=content_type
+            )
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        raise Http404("Image not found")
+    response["Cache-Control"] = RESIZED_IMAGE_CACHE_CONTROL
+    return response
+
+
+@never_cache
+@require_safe
+def metrics_view(request):
+    """Prometheus metrics of every worker, for internal addresses only."""
+    if not settings.METRICS_ENABLED or not metrics.is_internal(request):
+        raise Http404
+    content, content_type = metrics.render()
+    return HttpResponse(content, content_type=content_type)
+
+
 def ratelimit_error(request, exception=None):
     """Custom error page for rate-limited requests."""
     return HttpResponse(
@@ -0,0 +1,164 @@
+"""
+Worker warm-up.
+
+A freshly forked gunicorn worker pays, on its first requests, for template
+loading and parsing, templatetag library imports, URL resolver population
+and catalog loading. ``warm_up`` does that work up front so the first
+visitor of a recycled worker gets the same response time as the rest.
+
+It is called from the gunicorn hooks in ``gunicorn_config.py``: in the
+master when the app is preloaded (workers inherit the result), otherwise in
+each worker after it loads the application. ``reset_connections`` and
+``memory_usage`` support the preload profile: no socket is shared across
+fork, and each worker reports how much memory it does not share.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+from django.template.utils import get_app_template_dirs
+
+logger = logging.getLogger("portfolio")
+
+TEMPLATE_SUFFIXES = (".html", ".txt", ".xml")
+
+
+def project_template_names() -> list[str]:
+    """
+    Return the names of the project's own templates.
+
+    Templates from ``DIRS`` and from apps living under ``BASE_DIR`` are
+    listed; third-party templates (admin, debug toolbar...) are left to load
+    on demand.
+    """
+
+    base_dir = Path(settings.BASE_DIR).resolve()
+    roots = [
+        Path(directory)
+        for template in settings.TEMPLATES
+        for directory in template.get("DIRS", [])
+    ]
+    roots += [
+        Path(directory)
+        for directory in get_app_template_dirs("templates")
+        if Path(directory).resolve().is_relative_to(base_dir)
+    ]
+
+    names = set()
+    for root in roots:
+        if not root.is_dir():
+            continue
+        for path in root.rglob("*"):
+            if path.suffix in TEMPLATE_SUFFIXES and path.is_file():
+                names.add(path.relative_to(root).as_posix())
+    return sorted(names)
+
+
+def warm_templates() -> int:
+    """
+    Compile the project templates into each Django engine's loader cache.
+
+    Loading a template also imports the tag libraries it ``{% load %}``s.
+    Outside of DEBUG the engines use the cached loader, so compiled
+    templates are reused by every later request.
+
+    Returns:
+        int: Number of templates compiled.
+    """
+
+    names = project_template_names()
+    compiled = 0
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for name in names:
+            try:
+                engine.get_template(name)
+            except TemplateSyntaxError as exc:
+                logger.warning(f"Warm-up skipped template {name}: {exc}")
+            else:
+                compiled += 1
+    return compiled
+
+
+def warm_caches() -> None:
+    """
+    Populate the URL resolver, static manifest, translators and the
+    maintenance pages.
+    """
+    from django.contrib.staticfiles.storage import staticfiles_storage
+    from django.urls import get_resolver
+
+    from core import maintenance
+    from core.localization.translation_service import get_translator
+
+    resolver = get_resolver()
+    resolver.reverse_dict  # populates the resolver and its namespaces
+    # Manifest storages read staticfiles.json when first accessed.
+    getattr(staticfiles_storage, "hashed_files", None)
+    for language, _name in settings.LANGUAGES:
+        get_translator(language)
+    maintenance.render_pages()
+
+
+def warm_up() -> None:
+    """Compile templates and prime the per-process caches."""
+    start = time.perf_counter()
+    warm_caches()
+    compiled = warm_templates()
+    logger.info(
+        f"Warm-up compiled {compiled} templates in "
+        f"{(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+
+
+def reset_connections() -> None:
+    """
+    Drop the database and Redis connections of the current process.
+
+    Called in the master before forking and in each worker after, so every
+    worker opens its own connections instead of sharing a socket.
+    """
+
+    from django.core.cache import caches
+    from django.db import connections
+
+    connections.close_all()
+    for cache in caches.all(initialized_only=True):
+        client = getattr(cache, "client", None)
+        # django_redis clients keep their connection pools open on close().
+        if hasattr(client, "do_close_clients"):
+            client.do_close_clients()
+
+
+def memory_usage(pid: int | str = "self") -> dict[str, int]:
+    """
+    Return the memory of a process in KiB, from /proc (Linux only).
+
+    Returns:
+        dict[str, int]: ``rss``; ``pss``, shared pages split between the
+        processes sharing them; ``unique``, pages no other process shares.
+        Empty when /proc is unavailable.
+    """
+
+    fields = {}
+    try:
+        lines = Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()
+    except OSError:
+        return {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        fields[name] = int(value.split()[0])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "unique": (
+            fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+        ),
+    }
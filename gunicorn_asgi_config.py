@@ -0,0 +1,26 @@
+"""
+ASGI deployment profile: uvicorn workers under gunicorn, async views on.
+
+    gunicorn -c gunicorn_asgi_config.py portfolio_dimitri.asgi:application
+
+Everything not set here comes from gunicorn_config.py. An async worker
+serves many requests at once, so fewer processes are needed than with
+sync workers; compare both with ``manage.py benchmark_servers``.
+"""
+
+import multiprocessing
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from gunicorn_config import *  # noqa: E402,F401,F403
+from gunicorn_config import raw_env  # noqa: E402
+
+workers = multiprocessing.cpu_count() + 1
+worker_class = "uvicorn_worker.UvicornWorker"
+
+raw_env = [
+    *raw_env,
+    "ASYNC_VIEWS=True",
+]
@@ -1,4 +1,8 @@
+import gc
 import multiprocessing
+import os
+import shutil
+import time
 from pathlib import Path
 
 
@@ -12,6 +16,9 @@ worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 50
 timeout = 30
+# Import Django, settings and the catalogs once in the master and warm them
+# up (when_ready); forked and recycled workers share that state copy-on-write.
+preload_app = True
 
 accesslog = "/var/log/gunicorn/portfolio_access.log"
 errorlog = "/var/log/gunicorn/portfolio_error.log"
@@ -23,3 +30,84 @@ daemon = False
 raw_env = [
     "DJANGO_SETTINGS_MODULE=portfolio_dimitri.settings",
 ]
+
+# Workers write their Prometheus metrics there and /metrics merges them
+# (core/metrics.py). The directory must exist, and be emptied of a previous
+# run's files, before the app is preloaded: prometheus_client opens files in
+# it as soon as core.metrics is imported, which happens before on_starting.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/run/gunicorn/prometheus")
+
+
+def _reset_metrics_dir():
+    """Empty the metrics directory once per master (not again on reload)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR_OWNER") == str(os.getpid()):
+        return
+    metrics_dir = Path(os.environ["PROMETHEUS_MULTIPROC_DIR"])
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    metrics_dir.mkdir(parents=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR_OWNER"] = str(os.getpid())
+
+
+_reset_metrics_dir()
+
+
+def when_ready(server):
+    """Load shared read-only data in the master when the app is preloaded."""
+    if server.cfg.preload_app:
+        # Workers forked afterwards inherit the catalog and compiled
+        # templates copy-on-write.
+        from core.localization.catalog_store import load_catalogs
+        from core.warmup import reset_connections, warm_up
+
+        load_catalogs()
+        warm_up()
+        reset_connections()
+        # Keep the garbage collector away from the inherited objects: a
+        # collection in a worker writes to their headers and would copy
+        # every page they live on.
+        gc.freeze()
+
+
+def pre_fork(server, worker):
+    worker.spawn_started = time.perf_counter()
+
+
+def post_fork(server, worker):
+    """Make sure the worker opens its own database and Redis connections."""
+    if server.cfg.preload_app:
+        from core.warmup import reset_connections
+
+        reset_connections()
+
+
+def post_worker_init(worker):
+    """Warm up a worker that loaded the app itself before serving requests."""
+    if not worker.cfg.preload_app:
+        from core.warmup import warm_up
+
+        warm_up()
+
+    from core.warmup import memory_usage
+
+    spawn_time = (time.perf_counter() - worker.spawn_started) * 1000
+    worker.log.info(
+        f"Worker {worker.pid} ready in {spawn_time:.0f} ms, "
+        f"unique RSS {memory_usage().get('unique', 0) / 1024:.1f} MiB"
+    )
+
+
+def worker_exit(server, worker):
+    """Report how much memory the worker stopped sharing while serving."""
+    from core.warmup import memory_usage
+
+    worker.log.info(
+        f"Worker {worker.pid} exiting, "
+        f"unique RSS {memory_usage().get('unique', 0) / 1024:.1f} MiB"
+    )
+
+
+def child_exit(server, worker):
+    """Drop the live gauges (memory, resizes in progress) of a dead worker."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
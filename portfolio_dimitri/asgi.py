@@ -9,8 +9,13 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "portfolio_dimitri.settings")
 
-application = get_asgi_application()
+# get_asgi_application(), with a handler that can send 103 Early Hints.
+django.setup(set_prefix=False)
+
+from core.preload import EarlyHintsASGIHandler  # noqa: E402
+
+application = EarlyHintsASGIHandler()
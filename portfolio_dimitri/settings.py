@@ -115,8 +115,14 @@ CSRF_TRUSTED_ORIGINS = [
     if origin.strip()
 ]
 
-# Maintenance mode
+# Maintenance mode: forced on by MAINTENANCE_MODE, or switched at runtime by
+# ``manage.py maintenance on/off``, which creates/removes the flag file.
 MAINTENANCE_MODE = _str_to_bool(os.environ.get("MAINTENANCE_MODE", "False"))
+MAINTENANCE_FLAG_FILE = Path(
+    os.environ.get("MAINTENANCE_FLAG_FILE", BASE_DIR / ".maintenance")
+)
+# Seconds announced in the Retry-After header of the 503 page.
+MAINTENANCE_RETRY_AFTER = int(os.environ.get("MAINTENANCE_RETRY_AFTER", 300))
 
 
 # ==============================================================================
@@ -143,37 +149,76 @@ INSTALLED_APPS = [
 
 # Note: django_ratelimit requires Redis. Use custom rate_limit decorator in development.
 
+# Views marked @public_view skip the Public* session, CSRF, auth and
+# messages middleware (see core.middleware.PublicViewMiddleware). The
+# language comes from the cookie, not the session, so LocaleMiddleware can
+# run before them.
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "core.middleware.AsyncWhiteNoiseMiddleware",
     "django.middleware.locale.LocaleMiddleware",
+    "core.middleware.TranslatorMiddleware",
+    "core.middleware.PublicViewMiddleware",
+    "core.middleware.PublicSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "core.middleware.MaintenanceModeMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "core.middleware.PublicCsrfViewMiddleware",
+    "core.middleware.PublicAuthenticationMiddleware",
+    "core.middleware.PublicMessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "core.middleware.SecurityHeadersMiddleware",
+    "core.middleware.PreloadHintsMiddleware",
 ]
 
 # Add cache middleware in production only
 if not DEBUG:
     MIDDLEWARE = [
-        "django.middleware.cache.UpdateCacheMiddleware",
+        "core.middleware.StreamingUpdateCacheMiddleware",
         *MIDDLEWARE,
-        "django.middleware.cache.FetchFromCacheMiddleware",
+        "core.middleware.CompressedFetchFromCacheMiddleware",
     ]
 
 # Add query count middleware in development only
 if DEBUG:
     MIDDLEWARE.append("core.middleware.QueryCountDebugMiddleware")
 
+# Prometheus metrics on /metrics (core/metrics.py), readable from the
+# METRICS_ALLOWED_IPS addresses or networks only. The X-Real-IP header is
+# only trusted from METRICS_TRUSTED_PROXIES peers ("unix" for the socket
+# nginx proxies to). The middleware goes right after ServerTimingMiddleware,
+# inserted below.
+METRICS_ENABLED = _str_to_bool(os.environ.get("METRICS_ENABLED", "True"))
+METRICS_ALLOWED_IPS = [
+    address.strip()
+    for address in os.environ.get(
+        "METRICS_ALLOWED_IPS", "127.0.0.1,::1"
+    ).split(",")
+    if address.strip()
+]
+METRICS_TRUSTED_PROXIES = [
+    address.strip()
+    for address in os.environ.get(
+        "METRICS_TRUSTED_PROXIES", "unix,127.0.0.1,::1"
+    ).split(",")
+    if address.strip()
+]
+if METRICS_ENABLED:
+    MIDDLEWARE.insert(0, "core.middleware.MetricsMiddleware")
+
+# Server-Timing header with the DB, cache, template and view time of every
+# request (core/server_timing.py); outermost, so page cache hits are timed
+# and cached pages never store it. SERVER_TIMING_LOG also logs it as JSON.
+SERVER_TIMING = _str_to_bool(os.environ.get("SERVER_TIMING", "True"))
+SERVER_TIMING_LOG = _str_to_bool(os.environ.get("SERVER_TIMING_LOG", "False"))
+if SERVER_TIMING:
+    MIDDLEWARE.insert(0, "core.middleware.ServerTimingMiddleware")
+
 ROOT_URLCONF = "portfolio_dimitri.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # DjangoTemplates timing renders for the Server-Timing header
+        "BACKEND": "core.template_backends.TimedDjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -324,7 +369,8 @@ _redis_url = os.environ.get("REDIS_URL")
 if _redis_url and not DEBUG:
     CACHES = {
         "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            # django_redis RedisCache counting hits for Server-Timing
+            "BACKEND": "core.cache_backends.TimedRedisCache",
             "LOCATION": _redis_url,
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
@@ -344,7 +390,7 @@ else:
     # Use LocMemCache in development (supports atomic operations for django-ratelimit)
     CACHES = {
         "default": {
-            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "BACKEND": "core.cache_backends.TimedLocMemCache",
             "LOCATION": "portfolio-dev-cache",
             "TIMEOUT": 60 * 15,
             "OPTIONS": {
@@ -354,9 +400,27 @@ else:
     }
 
 CACHE_MIDDLEWARE_ALIAS = "default"
-CACHE_MIDDLEWARE_SECONDS = 60 * 15
+# 0 disables the per-site page cache (benchmark_servers measures renders)
+CACHE_MIDDLEWARE_SECONDS = int(
+    os.environ.get("CACHE_MIDDLEWARE_SECONDS", 60 * 15)
+)
 CACHE_MIDDLEWARE_KEY_PREFIX = "portfolio"
 
+# Shared caches in front of Django (nginx proxy_cache, CDN), see
+# core/shared_cache.py. Pages are purged by surrogate key through
+# CACHE_PURGE_URL when content changes (empty: no purge), so they may be
+# kept long; without a purge endpoint they expire within a minute.
+CACHE_PURGE_URL = os.environ.get("CACHE_PURGE_URL", "")
+CACHE_PURGE_TOKEN = os.environ.get("CACHE_PURGE_TOKEN", "")
+SHARED_CACHE_SECONDS = int(
+    os.environ.get(
+        "SHARED_CACHE_SECONDS", 60 * 60 * 24 if CACHE_PURGE_URL else 60
+    )
+)
+SHARED_CACHE_STALE_SECONDS = int(
+    os.environ.get("SHARED_CACHE_STALE_SECONDS", 60)
+)
+
 
 # ==============================================================================
 # SECURITY SETTINGS
@@ -543,6 +607,68 @@ PROJECTS_PER_PAGE = 8
 FEATURED_PROJECTS_COUNT = 4
 SIMILAR_PROJECTS_COUNT = 3
 
+# Binary catalog written by compile_catalog (falls back to content_catalog.py)
+LOCALIZATION_COMPILED_CATALOG = Path(
+    os.environ.get(
+        "LOCALIZATION_COMPILED_CATALOG",
+        BASE_DIR / ".cache" / "localization_catalog.bin",
+    )
+)
+
+# Bulk image optimization (optimize_images management command)
+IMAGE_OPTIMIZATION_DIRS = [
+    BASE_DIR / "static" / "images",
+    BASE_DIR / "static" / "images" / "gallerie",
+    MEDIA_ROOT,
+]
+IMAGE_OPTIMIZATION_LEDGER = Path(
+    os.environ.get(
+        "IMAGE_OPTIMIZATION_LEDGER",
+        BASE_DIR / ".cache" / "image_optimization_ledger.json",
+    )
+)
+
+# Static SVG card art whose minified markup is at or below this size is
+# inlined in project cards. video-specs (14.7 KB minified) fits; the next
+# smallest card, epic_events (45 KB), would weigh on every listing page.
+INLINE_SVG_MAX_BYTES = int(
+    os.environ.get("INLINE_SVG_MAX_BYTES", str(16 * 1024))
+)
+
+# On-demand image resizing (/media/r/<w>x<h>/<path>)
+IMAGE_RESIZE_CACHE_DIR = Path(
+    os.environ.get("IMAGE_RESIZE_CACHE_DIR", BASE_DIR / ".cache" / "resized")
+)
+IMAGE_RESIZE_CACHE_MAX_BYTES = int(
+    os.environ.get("IMAGE_RESIZE_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+)
+IMAGE_RESIZE_MAX_DIMENSION = 2560
+# Internal nginx location serving the cache directory
+# (empty: stream from Django)
+IMAGE_RESIZE_ACCEL_REDIRECT_PREFIX = os.environ.get(
+    "IMAGE_RESIZE_ACCEL_REDIRECT_PREFIX", ""
+)
+
+# On-disk HTTP cache used by import_gallery_images between runs
+GALLERY_DOWNLOAD_CACHE_DIR = Path(
+    os.environ.get(
+        "GALLERY_DOWNLOAD_CACHE_DIR", BASE_DIR / ".cache" / "gallery"
+    )
+)
+
+# Stream heavy pages (views using core.streaming.StreamingTemplateMixin)
+STREAM_HTML_RESPONSES = _str_to_bool(
+    os.environ.get("STREAM_HTML_RESPONSES", str(not DEBUG))
+)
+
+# Route the public pages to their async views (core/async_views.py).
+# Turned on by the ASGI deployment profile (gunicorn_asgi_config.py).
+ASYNC_VIEWS = _str_to_bool(os.environ.get("ASYNC_VIEWS", "False"))
+
+# Static export written by build_static_site (empty: export disabled).
+# When the directory exists, content changes re-render the affected pages.
+STATIC_SITE_ROOT = os.environ.get("STATIC_SITE_ROOT", "")
+
 
 # ==============================================================================
 # MISCELLANEOUS
@@ -16,13 +16,22 @@ Including another URLconf
 """
 
 from django.conf import settings
+from django.conf.urls.i18n import i18n_patterns
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path
+from django.views.i18n import set_language
 
+from core.decorators import public_view, surrogate_keys
+from core.shared_cache import CATEGORIES_KEY, PROJECTS_KEY, section_key
 from core.sitemaps import StaticViewSitemap
-from core.views import RobotsTxtView
+from core.views import (
+    RobotsTxtView,
+    language_redirect,
+    metrics_view,
+    resized_image,
+)
 from projects.sitemaps import CategorySitemap, ProjectSitemap
 
 
@@ -34,12 +43,39 @@ sitemaps = {
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("i18n/", include("django.conf.urls.i18n")),
+    path("i18n/setlang/", set_language, name="set_language"),
+    # The only page whose content depends on the visitor's language
+    # preferences; every localized page lives under /en/ or /fr/.
+    path("", language_redirect, name="language_redirect"),
+    path(
+        "sitemap.xml",
+        public_view(
+            surrogate_keys(
+                section_key("sitemap"), PROJECTS_KEY, CATEGORIES_KEY
+            )(sitemap)
+        ),
+        {"sitemaps": sitemaps},
+        name="sitemap",
+    ),
+    path(
+        "robots.txt",
+        public_view(
+            surrogate_keys(section_key("robots"))(RobotsTxtView.as_view())
+        ),
+        name="robots",
+    ),
+    path("metrics", metrics_view, name="metrics"),
+    path(
+        "media/r/<int:width>x<int:height>/<path:path>",
+        public_view(resized_image),
+        name="resized_image",
+    ),
+]
+
+urlpatterns += i18n_patterns(
     path("", include("core.urls")),
     path("projects/", include("projects.urls")),
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap"),
-    path("robots.txt", RobotsTxtView.as_view(), name="robots"),
-]
+)
 
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,33 @@
+"""
+Management command to regenerate the technology icon sprite.
+
+Writes projects/static/projects/icons/tech-icons.svg from the TECH_ICONS
+registry. Run it after adding or changing an icon and commit the result.
+
+Usage:
+    python manage.py build_tech_sprite
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from projects.tech_icons import SPRITE_STATIC_PATH, TECH_ICONS, build_sprite
+
+APP_DIR = Path(__file__).resolve().parents[2]
+SPRITE_FILE = APP_DIR / "static" / SPRITE_STATIC_PATH
+
+
+class Command(BaseCommand):
+    help = "Regenerate the static SVG sprite of technology icons"
+
+    def handle(self, *args, **options):
+        sprite = build_sprite()
+        SPRITE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        SPRITE_FILE.write_text(sprite, encoding="utf-8")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Wrote {len(TECH_ICONS)} icons to {SPRITE_FILE} "
+                f"({len(sprite.encode())} bytes)"
+            )
+        )
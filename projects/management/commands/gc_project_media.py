@@ -0,0 +1,90 @@
+"""
+Management command to delete content-addressed project media no longer used.
+
+Deduplicated images are shared between projects, so deleting a Project or a
+ProjectImage never removes the underlying file. This command removes files in
+the content-addressed tree that no row references anymore.
+
+Usage:
+    python manage.py gc_project_media --dry-run
+    python manage.py gc_project_media --min-age 3600
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from projects.models import Project, ProjectImage
+from projects.storage import project_media_storage
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete orphaned files from the content-addressed project media store"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List orphaned files without deleting them",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=3600,
+            help="Only delete files older than this many seconds "
+            "(default: 3600) so uploads whose row is not committed yet are "
+            "kept",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        storage = project_media_storage()
+        cutoff = time.time() - options["min_age"]
+
+        referenced = set(
+            Project.objects.exclude(featured_image="").values_list(
+                "featured_image", flat=True
+            )
+        )
+        referenced.update(ProjectImage.objects.values_list("image", flat=True))
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING("DRY RUN MODE - No file will be deleted")
+            )
+
+        deleted = 0
+        freed = 0
+        for name in self.stored_names(storage):
+            if name in referenced:
+                continue
+            if storage.get_modified_time(name).timestamp() > cutoff:
+                continue
+
+            size = storage.size(name)
+            if not dry_run:
+                storage.delete(name)
+            deleted += 1
+            freed += size
+            self.stdout.write(f"  ✗ {name} ({size} bytes)")
+
+        verb = "Would delete" if dry_run else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n{verb} {deleted} orphaned file(s), {freed} bytes "
+                f"({len(referenced)} referenced)"
+            )
+        )
+
+    def stored_names(self, storage):
+        """Yield every file name stored under the content-addressed prefix."""
+        try:
+            shards, _files = storage.listdir(storage.prefix)
+        except FileNotFoundError:
+            return
+        for shard in sorted(shards):
+            _directories, files = storage.listdir(f"{storage.prefix}/{shard}")
+            for filename in sorted(files):
+                yield f"{storage.prefix}/{shard}/{filename}"
@@ -2,19 +2,124 @@
 Management command to import gallery images from the old portfolio.
 Downloads images and creates ProjectImage objects for each project.
 
+Downloads run in a bounded thread pool over a pooled HTTP session. Responses
+are kept in an on-disk cache and revalidated with ETag/If-Modified-Since, so
+reruns only transfer images that changed upstream.
+
 Usage:
     python manage.py import_gallery_images
+    python manage.py import_gallery_images --workers 8 --force
 """
 
+import hashlib
+import json
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import requests
+from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.management.base import BaseCommand
+from requests.adapters import HTTPAdapter
 
 from projects.models import Project, ProjectImage
 
 
+def _write_atomic(path, data):
+    """Write ``data`` to ``path`` through a temporary file and a rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class CachedDownloader:
+    """
+    Fetch URLs through a shared session backed by a conditional disk cache.
+
+    Each cached URL is stored as ``<sha256>.body`` next to a ``<sha256>.json``
+    file holding the validators returned by the server.
+    """
+
+    def __init__(self, cache_dir, pool_size=4, timeout=10):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _paths(self, url):
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return (
+            self.cache_dir / f"{digest}.body",
+            self.cache_dir / f"{digest}.json",
+        )
+
+    def fetch(self, url):
+        """
+        Return the body of ``url``, reusing the cached copy when still valid.
+
+        Returns:
+            tuple[bytes, bool]: Response body and whether it came from cache.
+        """
+
+        body_path, meta_path = self._paths(url)
+        headers = {}
+        cached = self._read_cached(body_path, meta_path)
+        if cached is not None:
+            meta = cached[1]
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and headers:
+            return cached[0], True
+
+        response.raise_for_status()
+        # The body is replaced before its validators, so a meta file never
+        # describes a body other than the one next to it.
+        _write_atomic(body_path, response.content)
+        _write_atomic(
+            meta_path,
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+            ).encode("utf-8"),
+        )
+        return response.content, False
+
+    @staticmethod
+    def _read_cached(body_path, meta_path):
+        """Return the cached body and validators, or None on a cache miss."""
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            # Missing, unreadable or truncated entries are fetched again
+            return None
+        if not isinstance(meta, dict):
+            return None
+        return body, meta
+
+    def close(self):
+        self.session.close()
+
+
 class Command(BaseCommand):
     help = "Import gallery images from old portfolio GitHub Pages"
 
@@ -113,10 +218,23 @@ class Command(BaseCommand):
             action="store_true",
             help="Delete existing gallery images before importing",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of parallel downloads (default: 4)",
+        )
+        parser.add_argument(
+            "--cache-dir",
+            type=str,
+            default=str(settings.GALLERY_DOWNLOAD_CACHE_DIR),
+            help="Directory used to cache downloaded images between runs",
+        )
 
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
         force = options["force"]
+        workers = max(options["workers"], 1)
 
         self.stdout.write(
             self.style.SUCCESS("Starting gallery images import from old portfolio...")
@@ -131,95 +249,87 @@ class Command(BaseCommand):
         total_skipped = 0
         total_errors = 0
 
-        for project_slug, images in self.GALLERY_IMAGES.items():
-            try:
-                project = Project.objects.get(slug=project_slug)
+        projects = Project.objects.in_bulk(
+            list(self.GALLERY_IMAGES), field_name="slug"
+        )
+        for project_slug in self.GALLERY_IMAGES:
+            if project_slug not in projects:
                 self.stdout.write(
-                    f"\nProcessing project: {project.title} ({project_slug})"
+                    self.style.ERROR(
+                        f"✗ Project not found: {project_slug} - Run load_projects first"
+                    )
                 )
+                total_errors += 1
 
-                if force and not dry_run:
-                    deleted_count = project.gallery_images.all().delete()[0]
-                    if deleted_count > 0:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"  Deleted {deleted_count} existing gallery images"
-                            )
-                        )
-
-                for image_data in images:
-                    url = image_data["url"]
-                    caption = image_data["caption"]
-                    order = image_data["order"]
-
-                    # Check if image already exists
-                    existing = project.gallery_images.filter(
-                        caption=caption, order=order
-                    ).first()
-
-                    if existing and not force:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"  ⊘ Skipped: {caption} (already exists)"
-                            )
-                        )
-                        total_skipped += 1
-                        continue
-
-                    if dry_run:
-                        self.stdout.write(
-                            self.style.NOTICE(f"  [DRY RUN] Would download: {caption}")
-                        )
-                        total_created += 1
-                        continue
-
-                    # Download the image
-                    try:
-                        self.stdout.write(f"  Downloading: {url}")
-                        response = requests.get(url, timeout=10)
-                        response.raise_for_status()
-
-                        # Extract filename from URL
-                        filename = os.path.basename(url)
-
-                        # Create ProjectImage object
-                        gallery_image = ProjectImage(
-                            project=project,
-                            caption=caption,
-                            order=order,
-                        )
+        if force and not dry_run:
+            deleted_count = ProjectImage.objects.filter(
+                project__in=projects.values()
+            ).delete()[0]
+            if deleted_count > 0:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  Deleted {deleted_count} existing gallery images"
+                    )
+                )
 
-                        # Save the downloaded image
-                        gallery_image.image.save(
-                            filename,
-                            ContentFile(response.content),
-                            save=True,
-                        )
+        # Resolve every existing gallery image in a single query
+        existing = set(
+            ProjectImage.objects.filter(
+                project__in=projects.values()
+            ).values_list("project__slug", "caption", "order")
+        )
 
-                        self.stdout.write(self.style.SUCCESS(f"  ✓ Created: {caption}"))
-                        total_created += 1
+        pending = []
+        for project_slug, images in self.GALLERY_IMAGES.items():
+            project = projects.get(project_slug)
+            if project is None:
+                continue
+            self.stdout.write(
+                f"\nProcessing project: {project.title} ({project_slug})"
+            )
 
-                    except requests.RequestException as e:
-                        self.stdout.write(
-                            self.style.ERROR(f"  ✗ Failed to download {url}: {str(e)}")
+            for image_data in images:
+                caption = image_data["caption"]
+                key = (project_slug, caption, image_data["order"])
+                if key in existing and not force:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"  ⊘ Skipped: {caption} (already exists)"
                         )
-                        total_errors += 1
-                    except Exception as e:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f"  ✗ Error creating gallery image: {str(e)}"
-                            )
+                    )
+                    total_skipped += 1
+                elif dry_run:
+                    self.stdout.write(
+                        self.style.NOTICE(
+                            f"  [DRY RUN] Would download: {caption}"
                         )
-                        total_errors += 1
-
-            except Project.DoesNotExist:
-                self.stdout.write(
-                    self.style.ERROR(
-                        f"✗ Project not found: {project_slug} - Run load_projects first"
                     )
-                )
-                total_errors += 1
-                continue
+                    total_created += 1
+                else:
+                    pending.append((project, image_data))
+
+        if pending:
+            self.stdout.write(
+                f"\nDownloading {len(pending)} image(s) "
+                f"with {workers} worker(s)..."
+            )
+            downloader = CachedDownloader(
+                options["cache_dir"], pool_size=workers
+            )
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(downloader.fetch, image_data["url"])
+                        for _, image_data in pending
+                    ]
+                    # Database writes stay on the main thread
+                    for (project, image_data), future in zip(pending, futures):
+                        if self.save_image(project, image_data, future):
+                            total_created += 1
+                        else:
+                            total_errors += 1
+            finally:
+                downloader.close()
 
         # Summary
         self.stdout.write("\n" + "=" * 60)
@@ -235,3 +345,40 @@ class Command(BaseCommand):
                     "\nThis was a DRY RUN. Run without --dry-run to actually import."
                 )
             )
+
+    def save_image(self, project, image_data, future):
+        """Create the ProjectImage for a finished download."""
+        url = image_data["url"]
+        caption = image_data["caption"]
+        try:
+            content, from_cache = future.result()
+        except Exception as e:
+            # A failed download (network, cache file, bad response) only
+            # costs this image; the others are still imported.
+            self.stdout.write(
+                self.style.ERROR(f"  ✗ Failed to download {url}: {str(e)}")
+            )
+            return False
+
+        try:
+            gallery_image = ProjectImage(
+                project=project,
+                caption=caption,
+                order=image_data["order"],
+            )
+            gallery_image.image.save(
+                os.path.basename(url),
+                ContentFile(content),
+                save=True,
+            )
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f"  ✗ Error creating gallery image: {str(e)}")
+            )
+            return False
+
+        source = " (cached)" if from_cache else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"  ✓ Created: {caption}{source}")
+        )
+        return True
@@ -218,6 +218,8 @@ class Command(BaseCommand):
         # Create or update projects
         created_count = 0
         updated_count = 0
+        # Project.save() precomputes catalog translations and rendered HTML
+        translated_count = 0
 
         # Map slugs to featured images relative to MEDIA root
         image_mapping = {
@@ -268,6 +270,9 @@ class Command(BaseCommand):
                 },
             )
 
+            if project.translations:
+                translated_count += 1
+
             # Set technologies (replace associations)
             project.technologies.clear()
             for tech_name in tech_names:
@@ -289,6 +294,7 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(
                 f"\n🎉 Import completed! {len(projects_data)} projects processed. "
-                f"Created: {created_count}, Updated: {updated_count}"
+                f"Created: {created_count}, Updated: {updated_count}, "
+                f"Translated: {translated_count}"
             )
         )
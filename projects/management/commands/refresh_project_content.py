@@ -0,0 +1,31 @@
+"""
+Management command to rebuild the precomputed content of every project.
+
+Project.save() keeps ``translations`` and ``rendered_html`` up to date for
+edited projects. Run this after the migrations adding those fields, and
+after editing the content catalog or the Markdown renderer, so existing
+rows pick up the current output.
+
+Usage:
+    python manage.py refresh_project_content
+"""
+
+from django.core.management.base import BaseCommand
+
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Rebuild the stored translations and rendered HTML of every project"
+
+    def handle(self, *args, **options):
+        projects = list(Project.objects.all())
+        for project in projects:
+            project.refresh_translations()
+            project.refresh_rendered_html()
+        Project.objects.bulk_update(
+            projects, ["translations", "rendered_html"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Refreshed {len(projects)} project(s)")
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-19 01:13
+
+import projects.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0005_alter_project_primary_color"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="project",
+            name="featured_image",
+            field=models.ImageField(
+                blank=True,
+                help_text="Primary image (recommended 1200x630px)",
+                storage=projects.storage.project_media_storage,
+                upload_to="projects/featured/",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectimage",
+            name="image",
+            field=models.ImageField(
+                storage=projects.storage.project_media_storage,
+                upload_to="projects/gallery/",
+            ),
+        ),
+    ]
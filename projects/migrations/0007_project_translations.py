@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-19 01:24
+
+from django.db import migrations, models
+
+# Existing rows are filled by `manage.py refresh_project_content`, which uses
+# the current catalog rather than a copy frozen into this migration.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_content_addressed_project_images"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="translations",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Catalog translations of content fields, by language",
+            ),
+        ),
+    ]
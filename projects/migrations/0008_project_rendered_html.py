@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-19 03:50
+
+from django.db import migrations, models
+
+# Existing rows are filled by `manage.py refresh_project_content`, which uses
+# the current Markdown renderer rather than a copy frozen into this migration.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0007_project_translations"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="rendered_html",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Markdown fields rendered to HTML, by language",
+            ),
+        ),
+    ]
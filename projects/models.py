@@ -6,7 +6,40 @@ from django.conf import settings
 from django.templatetags.static import static
 from pathlib import Path
 
-from core.utils import optimize_image
+from core.localization.translation_service import (
+    DEFAULT_LANGUAGE,
+    build_content_translations,
+)
+from core.markdown import render_markdown
+from core.utils import ANIMATED_SUFFIX, POSTER_SUFFIX, optimize_image
+
+from .storage import file_digest, project_media_storage
+
+
+def prepare_project_image(field_file):
+    """
+    Return the value to store for a freshly uploaded project image.
+
+    Uploads whose source bytes are already stored reuse the existing file and
+    skip optimization entirely; new uploads are optimized and keyed by the
+    digest of their source so the next identical upload is recognized.
+
+    Args:
+        field_file: Uncommitted FieldFile holding the upload.
+
+    Returns:
+        str | File: Existing storage name, or the optimized file to save.
+    """
+
+    storage = field_file.storage
+    digest = file_digest(field_file)
+    existing = storage.find(digest) if hasattr(storage, "find") else None
+    if existing:
+        return existing
+
+    optimized = optimize_image(field_file)
+    optimized.content_digest = digest
+    return optimized
 
 
 # Custom validators
@@ -156,6 +189,7 @@ class Project(models.Model):
     # Media
     featured_image = models.ImageField(
         upload_to="projects/featured/",
+        storage=project_media_storage,
         blank=True,
         help_text="Primary image (recommended 1200x630px)",
     )
@@ -192,6 +226,18 @@ class Project(models.Model):
         default=list,
         help_text="List of main features (JSON array)",
     )
+    translations = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Catalog translations of content fields, by language",
+    )
+    rendered_html = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Markdown fields rendered to HTML, by language",
+    )
 
     # External links
     github_url = models.URLField(blank=True, verbose_name="GitHub URL")
@@ -235,6 +281,21 @@ class Project(models.Model):
     objects = models.Manager()
     published = PublishedManager()
 
+    # Content fields whose translations are precomputed into `translations`
+    TRANSLATED_FIELDS = (
+        "tagline",
+        "description",
+        "challenges",
+        "learnings",
+        "features",
+    )
+    # Markdown fields whose HTML is prerendered into `rendered_html`
+    RICH_TEXT_FIELDS = (
+        "description",
+        "challenges",
+        "learnings",
+    )
+
     class Meta:
         ordering = ["order", "-completed_at"]
         verbose_name = "Project"
@@ -250,19 +311,26 @@ class Project(models.Model):
 
     def save(self, *args, **kwargs):
         """
-        Auto-generate slug and optimize featured image.
+        Auto-generate slug, precompute content translations and rendered
+        HTML, and optimize featured image.
+        Already stored images are deduplicated instead of re-optimized.
         Note: Image optimization is synchronous - consider using Celery 
         for async processing.
         """
         if not self.slug:
             self.slug = slugify(self.title)
 
+        self.refresh_translations()
+        self.refresh_rendered_html()
+
         # Only optimize if it's a new image (not already committed)
         if self.featured_image and not getattr(
             self.featured_image, "_committed", False
         ):
             try:
-                self.featured_image = optimize_image(self.featured_image)
+                self.featured_image = prepare_project_image(
+                    self.featured_image
+                )
             except Exception as e:
                 # Log the error but don't block the save
                 import logging
@@ -274,6 +342,36 @@ class Project(models.Model):
 
         super().save(*args, **kwargs)
 
+    def refresh_translations(self) -> None:
+        """
+        Rebuild `translations` from the content catalog.
+        Templates read these through the `localized` filter instead of
+        looking up full English texts in the catalog on every render.
+        """
+        self.translations = build_content_translations(
+            {field: getattr(self, field) for field in self.TRANSLATED_FIELDS}
+        )
+
+    def refresh_rendered_html(self) -> None:
+        """
+        Rebuild `rendered_html` from the Markdown fields.
+        One entry is stored per language, rendered from the translated text
+        when `translations` holds one, so detail views skip all parsing.
+        Call after `refresh_translations`.
+        """
+        languages = [DEFAULT_LANGUAGE, *sorted(self.translations)]
+        self.rendered_html = {
+            language: {
+                field: render_markdown(
+                    self.translations.get(language, {}).get(
+                        field, getattr(self, field)
+                    )
+                )
+                for field in self.RICH_TEXT_FIELDS
+            }
+            for language in languages
+        }
+
     def get_absolute_url(self) -> str:
         """Return the canonical URL for this project."""
         return reverse("projects:detail", kwargs={"slug": self.slug})
@@ -315,50 +413,106 @@ class Project(models.Model):
 
         return similar
 
-    def get_card_image_url(self) -> str:
+    def get_linked_projects(self):
         """
-        Return the URL for the project card image.
-        Looks for static/images/<slug>_card.png or <slug>_card.svg.
-        Falls back to featured_image if no card image is found.
+        Return the published projects whose detail page may show this one.
+
+        Covers the projects it can appear on as a similar project (same
+        category or a shared technology) and its previous/next neighbours.
 
         Returns:
-            str: URL to the card image or empty string
+            list[Project]: Linked projects, without this one
+        """
+        from django.db.models import Q
+
+        related = Project.published.exclude(pk=self.pk).filter(
+            Q(category_id=self.category_id)
+            | Q(technologies__in=self.technologies.all())
+        )
+        ordered = list(
+            Project.objects.order_by("order", "-completed_at").values_list(
+                "pk", flat=True
+            )
+        )
+        neighbours = set()
+        if self.pk in ordered:
+            index = ordered.index(self.pk)
+            window = ordered[max(index - 1, 0) : index + 2]
+            neighbours = set(window) - {self.pk}
+
+        return [
+            *related.distinct(),
+            *Project.published.filter(pk__in=neighbours),
+        ]
+
+    def get_card_image_source(self) -> str:
         """
-        import os
-        from django.conf import settings
-        from django.templatetags.static import static
+        Return the source path of the project card image.
+        Looks for the poster frame of an animated card, then
+        static/images/<slug>_card.svg or <slug>_card.png, then falls back to
+        featured_image.
 
+        Returns:
+            str: "static/"-prefixed path, media-relative name or empty string
+        """
         static_dir = settings.BASE_DIR / "static"
 
-        # Check for SVG version
-        svg_filename = f"{self.slug}_card.svg"
-        svg_full_path = static_dir / "images" / svg_filename
+        for extension in (POSTER_SUFFIX.lstrip("."), "svg", "png"):
+            filename = f"{self.slug}_card.{extension}"
+            if (static_dir / "images" / filename).exists():
+                return f"static/images/{filename}"
 
-        if svg_full_path.exists():
-            return static(f"images/{svg_filename}")
+        if self.featured_image:
+            return self.featured_image.name
 
-        # Check for PNG version
-        png_filename = f"{self.slug}_card.png"
-        png_full_path = static_dir / "images" / png_filename
+        return ""
 
-        if png_full_path.exists():
-            return static(f"images/{png_filename}")
+    def get_card_image_url(self) -> str:
+        """
+        Return the URL of the still project card image.
+        The file is the one get_card_image_source picks: the poster frame
+        of an animated card, then <slug>_card.svg or <slug>_card.png, then
+        featured_image. Animated cards also get get_card_animation_url,
+        which the card swaps in once it scrolls into view.
 
+        Returns:
+            str: URL to the card image or empty string
+        """
+        source = self.get_card_image_source()
 
+        if source.startswith("static/"):
+            return static(source[len("static/"):])
 
-        # Fallback to featured_image
-        if self.featured_image:
+        if source:
             return self.featured_image.url
 
         return ""
 
+    def get_card_animation_url(self) -> str:
+        """
+        Return the URL of the animated card art, if any.
+        Animated variants are generated from static/images/<slug>_card.gif by
+        the convert_gifs command; the card shows its poster frame until the
+        card scrolls into view.
+
+        Returns:
+            str: URL to the animated WebP or empty string
+        """
+        filename = f"{self.slug}_card{ANIMATED_SUFFIX}"
+        if (settings.BASE_DIR / "static" / "images" / filename).exists():
+            return static(f"images/{filename}")
+        return ""
+
     def get_gallery_images(self) -> list:
         """
         Return a list of static gallery images for this project.
         Looks for images in static/images/gallerie/ named <slug>_1.png, <slug>_2.png, etc.
+        Animated GIFs are listed with their poster frame as 'source' and the
+        animation as 'animated_url'.
 
         Returns:
-            list: List of dicts with 'url' and 'number' keys
+            list: List of dicts with 'url', 'source', 'number' and
+            'animated_url' keys
         """
         gallery_images = []
         gallery_dir = settings.BASE_DIR / "static" / "images" / "gallerie"
@@ -375,8 +529,30 @@ class Project(models.Model):
             if png_path.exists():
                 gallery_images.append({
                     'url': static(f"images/gallerie/{png_filename}"),
+                    'source': f"static/images/gallerie/{png_filename}",
                     'number': i,
-                    'format': 'png'
+                    'format': 'png',
+                    'animated_url': '',
+                })
+                continue
+
+            # Check animated GIF, preferring the converted WebP variants
+            gif_filename = f"{self.slug}_{i}.gif"
+
+            if (gallery_dir / gif_filename).exists():
+                animated_filename = f"{self.slug}_{i}{ANIMATED_SUFFIX}"
+                poster_filename = f"{self.slug}_{i}{POSTER_SUFFIX}"
+                if not (gallery_dir / animated_filename).exists():
+                    # Unconverted: the resize endpoint renders the first frame
+                    animated_filename = poster_filename = gif_filename
+                gallery_images.append({
+                    'url': static(f"images/gallerie/{poster_filename}"),
+                    'source': f"static/images/gallerie/{poster_filename}",
+                    'number': i,
+                    'format': 'animated',
+                    'animated_url': static(
+                        f"images/gallerie/{animated_filename}"
+                    ),
                 })
                 continue
 
@@ -387,8 +563,10 @@ class Project(models.Model):
             if svg_path.exists():
                 gallery_images.append({
                     'url': static(f"images/gallerie/{svg_filename}"),
+                    'source': f"static/images/gallerie/{svg_filename}",
                     'number': i,
-                    'format': 'svg'
+                    'format': 'svg',
+                    'animated_url': '',
                 })
 
         return gallery_images
@@ -402,7 +580,10 @@ class ProjectImage(models.Model):
         on_delete=models.CASCADE,
         related_name="gallery_images",
     )
-    image = models.ImageField(upload_to="projects/gallery/")
+    image = models.ImageField(
+        upload_to="projects/gallery/",
+        storage=project_media_storage,
+    )
     caption = models.CharField(max_length=200, blank=True)
     order = models.IntegerField(default=0, db_index=True)
 
@@ -415,10 +596,10 @@ class ProjectImage(models.Model):
         return f"{self.project.title} - Image {self.order}"
 
     def save(self, *args, **kwargs):
-        """Optimize gallery images on save."""
+        """Optimize (or deduplicate) gallery images on save."""
         if self.image and not getattr(self.image, "_committed", False):
             try:
-                self.image = optimize_image(self.image)
+                self.image = prepare_project_image(self.image)
             except Exception as e:
                 import logging
 
@@ -1,6 +1,9 @@
 from django.core.cache import cache
 from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
+from django.urls import reverse
+
+from core import shared_cache, static_site
 
 from .models import Project, Technology, Category
 
@@ -24,3 +27,82 @@ def invalidate_on_tech_change(sender, instance, **kwargs):
     """Invalidate cache when project technologies are modified."""
     cache.delete("project_list_sidebar_data")
     cache.delete("project_navigation_ids")
+
+
+@receiver(post_save, sender=Project)
+@receiver(m2m_changed, sender=Project.technologies.through)
+def rebuild_project_pages(sender, instance, **kwargs):
+    """Re-render the exported pages showing a project."""
+    if not isinstance(instance, Project):
+        return
+    if kwargs.get("action", "post_add").startswith("pre_"):
+        return
+    removed = (
+        [] if instance.is_published else static_site.project_pages(instance)
+    )
+    static_site.schedule_rebuild(projects=[instance.pk], removed=removed)
+
+
+@receiver(post_delete, sender=Project)
+def rebuild_after_project_delete(sender, instance, **kwargs):
+    """Rebuild the export; every page may link to the deleted project."""
+    static_site.schedule_rebuild(full=True)
+
+
+@receiver([post_save, post_delete], sender=Technology)
+@receiver([post_save, post_delete], sender=Category)
+def rebuild_taxonomy_pages(sender, instance, **kwargs):
+    """Re-render the listings, skill pages and the affected projects."""
+    if static_site.export_root() is None:
+        return
+    lookup = "category" if sender is Category else "technologies"
+    project_ids = Project.objects.filter(**{lookup: instance.pk}).values_list(
+        "pk", flat=True
+    )
+    static_site.schedule_rebuild(
+        pages=[
+            *static_site.each_language(
+                lambda: [reverse("core:about"), reverse("core:skills")]
+            ),
+            *static_site.listing_pages(),
+        ],
+        projects=list(project_ids),
+    )
+
+
+@receiver(post_save, sender=Project)
+@receiver(m2m_changed, sender=Project.technologies.through)
+def purge_project_pages(sender, instance, **kwargs):
+    """Purge the shared-cache pages showing a project."""
+    if not isinstance(instance, Project) or not shared_cache.purge_enabled():
+        return
+    if kwargs.get("action", "post_add").startswith("pre_"):
+        return
+    shared_cache.schedule_purge(shared_cache.project_change_keys(instance))
+
+
+@receiver(post_delete, sender=Project)
+def purge_deleted_project_pages(sender, instance, **kwargs):
+    """Purge the pages that showed or linked to a deleted project."""
+    shared_cache.schedule_purge(
+        [shared_cache.project_key(instance.pk), shared_cache.PROJECTS_KEY]
+    )
+
+
+@receiver([post_save, post_delete], sender=Technology)
+def purge_technology_pages(sender, instance, **kwargs):
+    """Purge the pages showing a technology or the technology list."""
+    shared_cache.schedule_purge(
+        [
+            shared_cache.technology_key(instance.pk),
+            shared_cache.TECHNOLOGIES_KEY,
+        ]
+    )
+
+
+@receiver([post_save, post_delete], sender=Category)
+def purge_category_pages(sender, instance, **kwargs):
+    """Purge the pages showing a category or the category list."""
+    shared_cache.schedule_purge(
+        [shared_cache.category_key(instance.pk), shared_cache.CATEGORIES_KEY]
+    )
@@ -8,6 +8,9 @@ from .models import Category, Project
 class ProjectSitemap(Sitemap):
     changefreq = "monthly"
     priority = 0.8
+    i18n = True
+    alternates = True
+    x_default = True
 
     def items(self):
         return Project.objects.filter(
@@ -24,6 +27,9 @@ class ProjectSitemap(Sitemap):
 class CategorySitemap(Sitemap):
     changefreq = "monthly"
     priority = 0.6
+    i18n = True
+    alternates = True
+    x_default = True
 
     def items(self):
         return Category.objects.all()
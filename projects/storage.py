@@ -0,0 +1,103 @@
+"""
+Content-addressed storage for project media.
+
+Files are named after the SHA-256 digest of their source bytes and stored in
+a shared, sharded directory. Importing the same image twice, or attaching it
+to several projects, therefore reuses a single file instead of writing a
+suffixed duplicate.
+"""
+
+import hashlib
+from pathlib import PurePosixPath
+
+from django.core.files.storage import FileSystemStorage
+
+CONTENT_ADDRESSED_PREFIX = "projects/cas"
+
+
+def file_digest(file_obj):
+    """
+    Return the SHA-256 hex digest of a Django file and rewind it.
+
+    Args:
+        file_obj: File-like object exposing ``chunks()`` or ``read()``.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+
+    digest = hashlib.sha256()
+    if hasattr(file_obj, "seek"):
+        file_obj.seek(0)
+    if hasattr(file_obj, "chunks"):
+        for chunk in file_obj.chunks():
+            digest.update(chunk)
+    else:
+        digest.update(file_obj.read())
+    if hasattr(file_obj, "seek"):
+        file_obj.seek(0)
+    return digest.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage naming files by the digest of their content.
+
+    Callers may set ``content_digest`` on the file they save to key it by the
+    digest of the original upload rather than the bytes actually written.
+    Project images use this so a re-imported source skips re-optimization.
+    """
+
+    prefix = CONTENT_ADDRESSED_PREFIX
+
+    def __init__(self, *args, **kwargs):
+        # Identical names always hold identical bytes, so overwriting during a
+        # concurrent save is harmless and avoids Django's suffixing loop.
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(*args, **kwargs)
+
+    def _shard(self, digest):
+        return f"{self.prefix}/{digest[:2]}"
+
+    def content_name(self, digest, extension=""):
+        """Return the storage name for a digest and file extension."""
+        return f"{self._shard(digest)}/{digest}{extension.lower()}"
+
+    def find(self, digest):
+        """
+        Return the stored name for ``digest`` whatever its extension.
+
+        Returns:
+            str | None: Existing storage name, or None when not stored yet.
+        """
+
+        try:
+            _directories, files = self.listdir(self._shard(digest))
+        except FileNotFoundError:
+            return None
+        for filename in files:
+            if filename.split(".", 1)[0] == digest:
+                return f"{self._shard(digest)}/{filename}"
+        return None
+
+    def is_content_addressed(self, name):
+        """Return True when ``name`` lives in the content-addressed tree."""
+        return bool(name) and name.startswith(f"{self.prefix}/")
+
+    def save(self, name, content, max_length=None):
+        """Save ``content`` under its digest, skipping the write if present."""
+        digest = getattr(content, "content_digest", None)
+        if not digest:
+            digest = file_digest(content)
+        target = self.content_name(digest, PurePosixPath(name or "").suffix)
+        if self.exists(target):
+            return target
+        return super().save(target, content, max_length=max_length)
+
+
+def project_media_storage():
+    """Storage callable of project image fields (keeps migrations stable)."""
+    return _project_media_storage
+
+
+_project_media_storage = ContentAddressedStorage()
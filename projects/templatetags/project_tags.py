@@ -1,12 +1,25 @@
-import re
-
 from django import template
-from django.utils.html import conditional_escape
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 
+from core.image_resize import resized_image_url
+from core.localization.translation_service import (
+    DEFAULT_LANGUAGE,
+    get_translator,
+)
+from core.markdown import render_markdown
+from core.svg import inline_svg
+from projects.tech_icons import SPRITE_STATIC_PATH, icon_id
+
 
 register = template.Library()
 
+# Minified card art keeps about 60% of its source size or more; sources
+# beyond this multiple of INLINE_SVG_MAX_BYTES cannot fit and are not parsed.
+INLINE_SVG_SOURCE_RATIO = 2
+
 
 @register.inclusion_tag(
     "projects/components/project_meta_tags.html", takes_context=True
@@ -27,39 +40,48 @@ def project_meta_tags(context, project):
 
 @register.filter(name="render_project_text")
 def render_project_text(value):
-    """Render project text while transforming backtick code snippets into HTML code blocks.
+    """Render Markdown project text to HTML.
 
     Args:
-        value: Raw project text that may contain Markdown-style backticks.
+        value: Raw project text in Markdown.
 
     Returns:
-        Safe HTML string with inline (`code`) and fenced (```code```) snippets wrapped in <code>/<pre>.
+        Safe HTML string; raw HTML in the source is escaped.
     """
-    if not value:
-        return ""
+    return mark_safe(render_markdown(value))
 
-    escaped = conditional_escape(value)
 
-    def replace_fenced(match):
-        code_content = match.group(1).strip()
-        return f"<pre><code>{code_content}</code></pre>"
+@register.filter(name="rich_text")
+def rich_text(project, field_name):
+    """Return the prerendered HTML of a project Markdown field.
 
-    def replace_inline(match):
-        code_content = match.group(1)
-        return f"<code>{code_content}</code>"
+    Reads `Project.rendered_html` for the active language, so no Markdown is
+    parsed per request. Rows saved before prerendering are rendered on the fly.
 
-    fenced_pattern = re.compile(r"```(.*?)```", re.DOTALL)
-    inline_pattern = re.compile(r"`([^`]+)`")
+    Args:
+        project: Project instance
+        field_name: One of `Project.RICH_TEXT_FIELDS`
 
-    html = fenced_pattern.sub(replace_fenced, escaped)
-    html = inline_pattern.sub(replace_inline, html)
-    return mark_safe(html)
+    Returns:
+        Safe HTML string
+    """
+    translator = get_translator()
+    rendered = project.rendered_html or {}
+    by_field = rendered.get(translator.language) or rendered.get(
+        DEFAULT_LANGUAGE
+    )
+    if by_field is not None and field_name in by_field:
+        return mark_safe(by_field[field_name])
+    return render_project_text(translator.field(project, field_name))
 
 
 @register.filter(name="tech_icon")
 def tech_icon(tech_name, css_class="w-5 h-5"):
     """Return SVG icon for a given technology.
 
+    The icon references a symbol of the static tech icon sprite instead of
+    inlining its path, so repeated icons cost a few bytes each.
+
     Args:
         tech_name: Name of the technology
         css_class: CSS classes for the SVG element
@@ -67,48 +89,75 @@ def tech_icon(tech_name, css_class="w-5 h-5"):
     Returns:
         Safe HTML string with SVG icon
     """
-    tech_name_lower = tech_name.lower() if tech_name else ""
-
-    # Dictionary of technology icons (SVG paths)
-    icons = {
-        "python": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M14.25.18l.9.2.73.26.59.3.45.32.34.34.25.34.16.33.1.3.04.26.02.2-.01.13V8.5l-.05.63-.13.55-.21.46-.26.38-.3.31-.33.25-.35.19-.35.14-.33.1-.3.07-.26.04-.21.02H8.77l-.69.05-.59.14-.5.22-.41.27-.33.32-.27.35-.2.36-.15.37-.1.35-.07.32-.04.27-.02.21v3.06H3.17l-.21-.03-.28-.07-.32-.12-.35-.18-.36-.26-.36-.36-.35-.46-.32-.59-.28-.73-.21-.88-.14-1.05-.05-1.23.06-1.22.16-1.04.24-.87.32-.71.36-.57.4-.44.42-.33.42-.24.4-.16.36-.1.32-.05.24-.01h.16l.06.01h8.16v-.83H6.18l-.01-2.75-.02-.37.05-.34.11-.31.17-.28.25-.26.31-.23.38-.2.44-.18.51-.15.58-.12.64-.1.71-.06.77-.04.84-.02 1.27.05zm-6.3 1.98l-.23.33-.08.41.08.41.23.34.33.22.41.09.41-.09.33-.22.23-.34.08-.41-.08-.41-.23-.33-.33-.22-.41-.09-.41.09zm13.09 3.95l.28.06.32.12.35.18.36.27.36.35.35.47.32.59.28.73.21.88.14 1.04.05 1.23-.06 1.23-.16 1.04-.24.86-.32.71-.36.57-.4.45-.42.33-.42.24-.4.16-.36.09-.32.05-.24.02-.16-.01h-8.22v.82h5.84l.01 2.76.02.36-.05.34-.11.31-.17.29-.25.25-.31.24-.38.2-.44.17-.51.15-.58.13-.64.09-.71.07-.77.04-.84.01-1.27-.04-1.07-.14-.9-.2-.73-.25-.59-.3-.45-.33-.34-.34-.25-.34-.16-.33-.1-.3-.04-.25-.02-.2.01-.13v-5.34l.05-.64.13-.54.21-.46.26-.38.3-.32.33-.24.35-.2.35-.14.33-.1.3-.06.26-.04.21-.02.13-.01h5.84l.69-.05.59-.14.5-.21.41-.28.33-.32.27-.35.2-.36.15-.36.1-.35.07-.32.04-.28.02-.21V6.07h2.09l.14.01zm-6.47 14.25l-.23.33-.08.41.08.41.23.33.33.23.41.08.41-.08.33-.23.23-.33.08-.41-.08-.41-.23-.33-.33-.23-.41-.08-.41.08z"/></svg>',
-        "django": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M11.146 0h3.924v18.166c-2.013.382-3.491.535-5.096.535-4.791 0-7.288-2.166-7.288-6.32 0-4.002 2.65-6.6 6.753-6.6.637 0 1.121.051 1.707.204V0zm0 9.143a3.894 3.894 0 00-1.325-.204c-1.988 0-3.134 1.223-3.134 3.364 0 2.09 1.096 3.236 3.109 3.236.433 0 .79-.025 1.35-.102V9.142zM21.314 6.06v9.097c0 3.134-.229 4.638-.917 5.937-.637 1.249-1.478 2.039-3.211 2.905l-3.644-1.733c1.733-.815 2.574-1.529 3.109-2.625.56-1.121.739-2.421.739-5.835V6.059h3.924zM17.39.021h3.924v4.026H17.39V.021z"/></svg>',
-        "javascript": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M0 0h24v24H0V0zm22.034 18.276c-.175-1.095-.888-2.015-3.003-2.873-.736-.345-1.554-.585-1.797-1.14-.091-.33-.105-.51-.046-.705.15-.646.915-.84 1.515-.66.39.12.75.42.976.9 1.034-.676 1.034-.676 1.755-1.125-.27-.42-.404-.601-.586-.78-.63-.705-1.469-1.065-2.834-1.034l-.705.089c-.676.165-1.32.525-1.71 1.005-1.14 1.291-.811 3.541.569 4.471 1.365 1.02 3.361 1.244 3.616 2.205.24 1.17-.87 1.545-1.966 1.41-.811-.18-1.26-.586-1.755-1.336l-1.83 1.051c.21.48.45.689.81 1.109 1.74 1.756 6.09 1.666 6.871-1.004.029-.09.24-.705.074-1.65l.046.067zm-8.983-7.245h-2.248c0 1.938-.009 3.864-.009 5.805 0 1.232.063 2.363-.138 2.711-.33.689-1.18.601-1.566.48-.396-.196-.597-.466-.83-.855-.063-.105-.11-.196-.127-.196l-1.825 1.125c.305.63.75 1.172 1.324 1.517.855.51 2.004.675 3.207.405.783-.226 1.458-.691 1.811-1.411.51-.93.402-2.07.397-3.346.012-2.054 0-4.109 0-6.179l.004-.056z"/></svg>',
-        "typescript": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M1.125 0C.502 0 0 .502 0 1.125v21.75C0 23.498.502 24 1.125 24h21.75c.623 0 1.125-.502 1.125-1.125V1.125C24 .502 23.498 0 22.875 0zm17.363 9.75c.612 0 1.154.037 1.627.111a6.38 6.38 0 0 1 1.306.34v2.458a3.95 3.95 0 0 0-.643-.361 5.093 5.093 0 0 0-.717-.26 5.453 5.453 0 0 0-1.426-.2c-.3 0-.573.028-.819.086a2.1 2.1 0 0 0-.623.242c-.17.104-.3.229-.393.374a.888.888 0 0 0-.14.49c0 .196.053.373.156.529.104.156.252.304.443.444s.423.276.696.41c.273.135.582.274.926.416.47.197.892.407 1.266.628.374.222.695.473.963.753.268.279.472.598.614.957.142.359.214.776.214 1.253 0 .657-.125 1.21-.373 1.656a3.033 3.033 0 0 1-1.012 1.085 4.38 4.38 0 0 1-1.487.596c-.566.12-1.163.18-1.79.18a9.916 9.916 0 0 1-1.84-.164 5.544 5.544 0 0 1-1.512-.493v-2.63a5.033 5.033 0 0 0 3.237 1.2c.333 0 .624-.03.872-.09.249-.06.456-.144.623-.25.166-.108.29-.234.373-.38a1.023 1.023 0 0 0-.074-1.089 2.12 2.12 0 0 0-.537-.5 5.597 5.597 0 0 0-.807-.444 27.72 27.72 0 0 0-1.007-.436c-.918-.383-1.602-.852-2.053-1.405-.45-.553-.676-1.222-.676-2.005 0-.614.123-1.141.369-1.582.246-.441.58-.804 1.004-1.089a4.494 4.494 0 0 1 1.47-.629 7.536 7.536 0 0 1 1.77-.201zm-15.113.188h9.563v2.166H9.506v9.646H6.789v-9.646H3.375z"/></svg>',
-        "react": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M14.23 12.004a2.236 2.236 0 0 1-2.235 2.236 2.236 2.236 0 0 1-2.236-2.236 2.236 2.236 0 0 1 2.235-2.236 2.236 2.236 0 0 1 2.236 2.236zm2.648-10.69c-1.346 0-3.107.96-4.888 2.622-1.78-1.653-3.542-2.602-4.887-2.602-.41 0-.783.093-1.106.278-1.375.793-1.683 3.264-.973 6.365C1.98 8.917 0 10.42 0 12.004c0 1.59 1.99 3.097 5.043 4.03-.704 3.113-.39 5.588.988 6.38.32.187.69.275 1.102.275 1.345 0 3.107-.96 4.888-2.624 1.78 1.654 3.542 2.603 4.887 2.603.41 0 .783-.09 1.106-.275 1.374-.792 1.683-3.263.973-6.365C22.02 15.096 24 13.59 24 12.004c0-1.59-1.99-3.097-5.043-4.032.704-3.11.39-5.587-.988-6.38-.318-.184-.688-.277-1.092-.278zm-.005 1.09v.006c.225 0 .406.044.558.127.666.382.955 1.835.73 3.704-.054.46-.142.945-.25 1.44-.96-.236-2.006-.417-3.107-.534-.66-.905-1.345-1.727-2.035-2.447 1.592-1.48 3.087-2.292 4.105-2.295zm-9.77.02c1.012 0 2.514.808 4.11 2.28-.686.72-1.37 1.537-2.02 2.442-1.107.117-2.154.298-3.113.538-.112-.49-.195-.964-.254-1.42-.23-1.868.054-3.32.714-3.707.19-.09.4-.127.563-.132zm4.882 3.05c.455.468.91.992 1.36 1.564-.44-.02-.89-.034-1.345-.034-.46 0-.915.01-1.36.034.44-.572.895-1.096 1.345-1.565zM12 8.1c.74 0 1.477.034 2.202.093.406.582.802 1.203 1.183 1.86.372.64.71 1.29 1.018 1.946-.308.655-.646 1.31-1.013 1.95-.38.66-.773 1.288-1.18 1.87-.728.063-1.466.098-2.21.098-.74 0-1.477-.035-2.202-.093-.406-.582-.802-1.204-1.183-1.86-.372-.64-.71-1.29-1.018-1.946.303-.657.646-1.313 1.013-1.954.38-.66.773-1.286 1.18-1.868.728-.064 1.466-.098 2.21-.098zm-3.635.254c-.24.377-.48.763-.704 1.16-.225.39-.435.782-.635 1.174-.265-.656-.49-1.31-.676-1.947.64-.15 1.315-.283 2.015-.386zm7.26 0c.695.103 1.365.23 2.006.387-.18.632-.405 1.282-.66 1.933-.2-.39-.41-.783-.64-1.174-.225-.392-.465-.774-.705-1.146zm3.063.675c.484.15.944.317 1.375.498 1.732.74 2.852 1.708 2.852 2.476-.005.768-1.125 1.74-2.857 2.475-.42.18-.88.342-1.355.493-.28-.958-.646-1.956-1.1-2.98.45-1.017.81-2.01 1.085-2.964zm-13.395.004c.278.96.645 1.957 1.1 2.98-.45 1.017-.812 2.01-1.086 2.964-.484-.15-.944-.318-1.37-.5-1.732-.737-2.852-1.706-2.852-2.474 0-.768 1.12-1.742 2.852-2.476.42-.18.88-.342 1.356-.494zm11.678 4.28c.265.657.49 1.312.676 1.948-.64.157-1.316.29-2.016.39.24-.375.48-.762.705-1.158.225-.39.435-.788.636-1.18zm-9.945.02c.2.392.41.783.64 1.175.23.39.465.772.705 1.143-.695-.102-1.365-.23-2.006-.386.18-.63.406-1.282.66-1.933zM17.92 16.32c.112.493.2.968.254 1.423.23 1.868-.054 3.32-.714 3.708-.147.09-.338.128-.563.128-1.012 0-2.514-.807-4.11-2.28.686-.72 1.37-1.536 2.02-2.44 1.107-.118 2.154-.3 3.113-.54zm-11.83.01c.96.234 2.006.415 3.107.532.66.905 1.345 1.727 2.035 2.446-1.595 1.483-3.092 2.295-4.11 2.295-.22-.005-.406-.05-.553-.132-.666-.38-.955-1.834-.73-3.703.054-.46.142-.944.25-1.438zm4.56.64c.44.02.89.034 1.345.034.46 0 .915-.01 1.36-.034-.44.572-.895 1.095-1.345 1.565-.455-.47-.91-.993-1.36-1.565z"/></svg>',
-        "vue": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M24,1.61H14.06L12,5.16,9.94,1.61H0L12,22.39ZM12,14.08,5.16,2.23H9.59L12,6.41l2.41-4.18h4.43Z"/></svg>',
-        "html": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M1.5 0h21l-1.91 21.563L11.977 24l-8.564-2.438L1.5 0zm7.031 9.75l-.232-2.718 10.059.003.23-2.622L5.412 4.41l.698 8.01h9.126l-.326 3.426-2.91.804-2.955-.81-.188-2.11H6.248l.33 4.171L12 19.351l5.379-1.443.744-8.157H8.531z"/></svg>',
-        "css": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M1.5 0h21l-1.91 21.563L11.977 24l-8.565-2.438L1.5 0zm17.09 4.413L5.41 4.41l.213 2.622 10.125.002-.255 2.716h-6.64l.24 2.573h6.182l-.366 3.523-2.91.804-2.956-.81-.188-2.11h-2.61l.29 3.855L12 19.288l5.373-1.53L18.59 4.414z"/></svg>',
-        "postgresql": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M23.5594 14.7228a.5269.5269 0 0 0-.0563-.1191c-.139-.2632-.4768-.3418-.7399-.1781-.2632.1625-.3523.5-.1781.7643.0742.1055.1551.2058.2349.3015.0235.0258.0469.0504.0704.0762.2984.3538.609.7179.8267 1.1637.0445.0879.086.1711.1288.2557.0691.1429.1399.2871.2318.4332.0398.0609.086.1145.1288.1674.0926.115.1782.2253.2188.3742.0613.2205.022.4527-.1348.6292-.1288.1486-.31.2471-.5317.2857-.1288.0222-.2602.0258-.3902.0258-.1379 0-.2747-.0024-.411-.0062-.8838-.0258-1.8132-.4312-2.7169-.625-.7367-.1575-1.4918-.2588-2.2481-.2588-.0258 0-.0516.0012-.0773.0012-.9848.0062-1.9706.0785-2.8899.347-.2943.0879-.5953.1734-.9055.2625-.9493.2722-2.0317.5848-3.0949.5848h-.0024c-.9629 0-1.7532-.2808-2.417-.8584-.3278-.2858-.612-.6152-.8713-.9644-.5661-.7598-1.0821-1.566-1.6096-2.3816-.6152-.9538-1.2516-1.9404-1.9649-2.8247-.886-1.0998-1.7834-1.8179-2.747-2.2014-.4093-.1626-.8093-.2425-1.2232-.2425-.5268 0-1.0443.1275-1.5349.2894-.3902.1288-.7896.2825-1.1827.4093C.4142 9.4683.3345 9.4917.2548 9.5152.1589 9.5445.0606 9.5729 0 9.6598v.2013c0 .0445 0 .0879.0012.1324.0036.2908.0085.5828.0676.8597.0763.3525.2161.6878.4386.9842.2824.378.6982.6515 1.1428.8024.396.1348.8132.196 1.2256.2661.1324.0222.2659.0468.3982.074.5965.1243 1.178.2601 1.7262.5049.6444.2882 1.201.7022 1.717 1.0997.2013.1551.3914.3026.5828.4492.1288.0996.2590.1980.3902.2953.6304.4656 1.275.8399 1.9144 1.1135.5804.2494 1.2292.3915 1.9355.4234.0294.0012.0586.0012.088.0012.7045 0 1.4067-.2040 2.0894-.6077.4738-.2813.952-.6378 1.4206-.9933.2825-.2155.5614-.4272.8379-.6257.7949-.5683 1.6663-.9056 2.664-.1032.2528.2034.461.4879.6053.8267.2045.4856.1888 1.0196-.0411 1.4902-.2847.5848-.8387.9447-1.4998 1.3301-.2164.1263-.4399.2540-.6621.3853-.4948.2941-.8989.6077-1.2346 1.0008-.2699.3137-.4847.6621-.6745 1.0443-.0985.1979-.1922.3993-.2859.6042-.1324.2871-.2647.5754-.433.8476-.4128.6621-1.0173 1.189-1.7943 1.5664-.6489.315-1.382.4786-2.1796.4856h-.0422c-.7574 0-1.5055-.1532-2.2245-.4551-.6454-.2718-1.2703-.6491-1.8584-1.0195-.6106-.3854-1.2125-.7672-1.8515-1.0769-.7696-.3738-1.6096-.5848-2.499-.6279-.0223-.0012-.0445-.0012-.0668-.0012-.5117 0-1.0195.086-1.5078.2555-.4562.1581-.911.3689-1.3445.5661-.0938.043-.1887.086-.2836.1288-.8303.3714-1.6838.7548-2.568.7548-.0656 0-.1312-.0024-.1992-.0085-.0445-.0036-.0914-.0085-.1348-.0118l-.0012-.107-.0012-.107c0-.0422-.0012-.0856-.0012-.1288v-.1697c-.0012-.9432-.0024-1.9206.1348-2.8608.1288-.8999.3538-1.7892.6902-2.6417.2554-.6466.5719-1.2758.8871-1.9038.1371-.2729.2742-.5458.4053-.8198.1805-.3785.3659-.7583.5466-1.1371.3981-.8374.7948-1.6736 1.1591-2.5229.3128-.7274.5859-1.4902.8553-2.2421.1923-.5364.3833-1.0728.589-1.5961.252-.6385.5495-1.2626.8471-1.8867.186-.3902.3733-.7803.5547-1.174.2637-.5729.5163-1.1578.9066-1.6663.3914-.5104.9067-.8913 1.5325-1.1296.449-.1708.9224-.2577 1.4059-.2577.5906 0 1.1848.1288 1.7657.3843.7358.3234 1.4019.7949 1.9803 1.4007.3538.3715.6947.7862 1.0295 1.1935.186.2262.3708.4524.5593.6738.4807.5718 1.0278 1.0887 1.6736 1.5804.7949.6053 1.7142 1.1226 2.812 1.5827.2484.1042.503.2002.7564.2974.2045.0785.4102.1569.6124.2413.3186.1348.6384.2895.9594.4443.7907.3819 1.6096.7779 2.4555.952.6053.1255 1.2626.1903 2.0075.2075.0527.0012.1064.0012.1603.0012 1.1044 0 2.2869-.2247 3.4632-.6681 1.1579-.437 2.2128-1.0888 3.0435-1.8831.8762-.836 1.4783-1.8456 1.7894-3.003.2063-.7672.2648-1.5874.1781-2.509-.0234-.2659-.0563-.5332-.0879-.7922-.0222-.1849-.0457-.3685-.0633-.5533-.006-.0586-.006-.1172-.006-.1758 0-.2808.072-.5474.2161-.7915.1348-.2286.3279-.4199.5952-.5906.2893-.1848.6279-.2895.9827-.3062.0317-.0012.0645-.0012.0974-.0012.3255 0 .6487.0737.9382.2136.3185.1544.5871.3538.7977.5906.3855.4351.6182.9629.6793 1.5617.0245.2378.0457.4769.0656.7147.0175.2118.0343.4224.0575.6331.0645.5611.1603 1.1058.2895 1.6628.0832.3596.178.717.2716 1.0756.0938.3574.1887.7159.2705 1.0769.0902.3962.1545.7972.2176 1.1982.0428.2728.0845.5457.1348.8162.0468.2493.1173.4949.1865.7405.0785.2779.1569.5546.2156.8386.1124.5389.1534 1.0898.1534 1.6407 0 .2773-.0138.5545-.0421.8317-.0445.4351-.1366.8714-.2312 1.3088-.0445.2045-.0879.4077-.1288.6125-.0575.2831-.1068.5685-.1545.8528-.0468.2857-.0938.5703-.1545.8528-.0785.3667-.1949.7298-.3125 1.0917-.0986.3089-.1973.6178-.2822.9316-.0763.2822-.1288.5704-.1801.8574-.0188.1091-.0398.2182-.0597.3274-.1043.5533-.2095 1.1066-.207 1.6821.0012.0926.0048.1827.0085.2728.0036.0914.0085.1827.0085.2753 0 .2424-.0234.4783-.0692.7053-.0383.1864-.1077.3713-.1851.5528-.0445.1055-.1042.2072-.1651.3077-.0491.0785-.1007.1581-.1383.2436zm-9.7526-3.0158c-.0023 0-.0047.0011-.0070.0011l.0024-.0036.0047.0025zm-.0305-.1723c.0023.0011.0035.0023.0058.0035l-.0023.0023-.0035-.0058zm.7949-10.4019c0-.1406.0293-.2801.0879-.4125.0563-.1264.1288-.2471.2154-.3572.0855-.1079.1863-.2041.3019-.2871.0961-.0692.2013-.1275.3089-.1781.0012-.0117.0035-.0222.0070-.0339.0059-.0199.0141-.0398.0258-.0586.0293-.0445.0692-.0785.1137-.1043.0938-.0562 1.3196-.7181 1.428-.7899.0117-.0082.0234-.0152.0351-.0222.0047-.0035.0094-.0058.013-.0094.0446-.0293.0915-.0586.1394-.0855.2260-.1288.4579-.2378.7031-.3279.4883-.1781 1.0101-.2895 1.5508-.3279.0188-.0012.0387-.0012.0586-.0023.0035 0 .0058 0 .0082-.0012.0668-.0059.1371-.0082.2085-.0082.0398 0 .0785.0023.1183.0035.0563.0023.1137.0047.1710.0129.0988.0153.1952.0398.2882.0704.0961.0316.1875.0727.2766.1173.0867.0434.1710.0926.2518.1463.0363.0246.0715.0504.1054.0762.0293.0222.0574.0445.0844.0680.0023.0023.0047.0035.0070.0047.0023.0023.0058.0047.0082.0070.0058.0059.0129.0117.0199.0188.0012.0012.0035.0023.0047.0035.1735.1652.3279.3538.4625.5636.0398.0621.0762.1264.1114.1918.0316.0586.0621.1183.0902.1792.0117.0269.0222.0539.0316.080.0070.0188.0153.0387.0222.0586.0398.1078.0727.2177.0961.3302.0175.0855.0281.1722.0351.2589.0035.0527.0047.1066.0047.1605zm-1.591 1.0267c-.0234.0398-.0469.0785-.0726.1183-.006-.0047-.0082-.0094-.0094-.013-.0023-.0035-.0035-.0058-.0058-.0082-.0070-.0093-.0153-.0175-.0234-.0257-.0070-.0071-.0153-.0141-.0234-.0223-.0117-.0117-.0245-.0234-.0375-.0339-.0070-.0058-.0141-.0105-.0222-.0152-.0316-.0222-.0668-.0398-.1043-.0551-.0023-.0012-.0035-.0012-.0058-.0023-.0023-.0012-.0058-.0023-.0082-.0035-.0175-.0070-.0363-.0117-.0563-.0152l-.006-.0012c-.0198-.0035-.041-.0047-.0633-.0047-.0023 0-.0058 0-.0082.0012-.0293 0-.0598.0012-.0914.0035-.0234.0012-.0469.0035-.0715.0070-.0434.0059-.0890.0153-.1371.0281-.0188.0047-.0387.0117-.0586.0188-.006.0023-.0129.0035-.0188.0058-.051.0188-.1043.0422-.1593.0727-.0469.0269-.0961.0609-.1476.1007-.0070.0058-.0153.0129-.0234.0199-.006.0047-.0117.0105-.0175.0152-.051.0481-.1067.1019-.1676.1675-.0363.0398-.0738.0843-.1125.1323-.0176.0222-.0352.0457-.0528.0703-.0070.0094-.0153.0199-.0223.0316-.0386.0539-.0773.1125-.1159.1769-.0094.0164-.0199.0339-.0305.0515-.0176.0304-.0363.0632-.0562.0984-.006.0117-.0129.0234-.0199.0363zm.3057-.0632c.0222-.0387.0481-.0762.0762-.1125.006.0047.0094.0094.0105.0129.006.0152.0035.0339-.0129.0692-.006.0129-.0176.0281-.0293.0410-.0152.0141-.0304.0234-.0398.0281-.0152.0058-.0281.0058-.0363.0035-.0070-.0023-.0105-.0058-.0117-.0082-.0023-.0035-.0023-.0070-.0011-.0105.0011-.0047.0023-.0094.0058-.0141.0058-.0070.0152-.0129.0257-.0188.0058-.0035.0105-.0058.0129-.0105zm8.6093-2.2245c-.0926-.1137-.1945-.2202-.3067-.3185-.0984-.0867-1.6993-1.4794-3.3133-1.4794-.1898 0-.3819.0175-.5753.0539-.7696.1441-1.4935.5495-2.0917 1.173l-.0047.0047c-.006.006-.0129.0129-.0188.0199-.1441.1476-.2788.3055-.4066.4738-.0938.1243-.1828.2531-.2659.3855-.0938.1499-.1805.3067-.2518.4703-.0527.1172-.095.2389-.1288.3632-.006.0222-.0117.0445-.0164.0668-.0246.0995-.0398.201-.0445.3043v.0199c-.0012.0386-.0012.0773 0 .1172 0 .0129 0 .0269.0012.0398.0035.1125.0222.2261.0586.3385.0059.0188.0129.0387.0211.0586.0070.0175.0141.0351.0234.0527.0293.0609.0668.1196.1090.1758.0234.0316.0492.0621.0762.0914.0117.0129.0245.0258.0375.0387.0387.0375.0832.0727.1288.1043.0832.0586.1781.1043.2812.1382.0188.0058.0375.0105.0574.0152.0106.0023.0211.0047.0329.0070.0176.0036.0363.0071.0562.0094.1676.0199.3514.0117.5588-.0269.0199-.0035.0398-.0094.0598-.0141.0058-.0012.0105-.0023.0164-.0035.0527-.0141.1066-.0316.1593-.0527.0094-.0035.0176-.0082.0269-.0117.006-.0035.0129-.0058.0188-.0082.0328-.0152.0645-.0316.0949-.0492.0058-.0035.0117-.0070.0176-.0105.0023-.0012.0047-.0035.0082-.0047.0058-.0035.0129-.0082.0188-.0129.006-.0035.0117-.0082.0175-.0117.0282-.0199.0551-.0410.0808-.0633l.006-.006c.006-.0047.0117-.0105.0175-.0164.0527-.0492.0996-.1054.1394-.1687.006-.0094.0117-.0199.0164-.0305.0012-.0035.0035-.0070.0047-.0105.0164-.0375.0281-.0785.0316-.1218 0-.0058 0-.0105.0012-.0164v-.0175c0-.0082.0011-.0164.0011-.0246 0-.0317-.0058-.0645-.0175-.0984-.0117-.0375-.0304-.0762-.0586-.1183-.0035-.0047-.0058-.0105-.0094-.0164-.006-.0094-.0129-.0188-.0211-.0293-.0070-.0082-.0141-.0175-.0222-.0257-.0070-.0082-.0141-.0164-.0211-.0246-.0246-.0257-.0527-.0492-.0844-.0703-.006-.0047-.0129-.0082-.0199-.0117-.0164-.0105-.0339-.0188-.0527-.0269-.0176-.0070-.0363-.0129-.0562-.0164-.0070-.0012-.0141-.0012-.0211-.0023-.0188-.0024-.0387-.0024-.0598-.0012h-.0012c-.0070 0-.0152 0-.0222.0012-.0070 0-.0129.0012-.0188.0012-.0023 0-.0058 0-.0082.0011-.006 0-.0117.0012-.0176.0012-.0117.0011-.0222.0035-.0339.0058-.0070.0012-.0141.0023-.0211.0047-.0093.0023-.0175.0047-.0268.0082-.006.0012-.0118.0035-.0177.0058-.0105.0035-.0199.0082-.0292.0129-.0059.0023-.0118.0047-.0177.0082-.006.0023-.0116.0058-.0175.0082-.0375.0199-.0727.0445-.1055.0738-.0117.0105-.0234.0211-.0351.0328-.0058.0047-.0105.0105-.0164.0164-.0351.0363-.0668.0785-.0949.1242-.0081.0129-.0163.0270-.0245.0410zm-9.9913 13.0702c.006.006.0117.0105.0175.0152-.006-.0047-.0117-.0094-.0175-.0152zm.113.0867c.0058.0047.0117.0082.0175.0117-.0058-.0035-.0117-.0070-.0175-.0117zm.8507.5155c-.006-.0035-.0117-.0058-.0175-.0094.0058.0036.0117.0059.0175.0094zm.0258.0129c-.006-.0035-.0129-.0070-.0188-.0094.006.0035.0117.0058.0188.0094zm.0281.0129c.006.0023.0117.0058.0176.0082-.006-.0024-.0117-.0059-.0176-.0082zm.0328.0152c-.006-.0035-.0129-.0059-.0188-.0082.0059.0023.0129.0047.0188.0082zm.0492.0188c-.006-.0024-.0129-.0047-.0188-.007.0059.0023.0129.0046.0188.007zm.8074-.0738c-.0023 0-.0047-.0012-.0082-.0012.0035 0 .0058.0012.0082.0012zm.0375 0h-.0012.0012z"/></svg>',
-        "mysql": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M16.405 5.501c-.115 0-.193.014-.274.033v.013h.014c.054.104.146.18.214.273.054.107.1.214.154.32l.014-.015c.094-.066.14-.172.14-.333-.04-.047-.046-.094-.08-.14-.04-.067-.126-.1-.18-.153zM5.77 18.695h-.927a50.854 50.854 0 00-.27-4.41h-.008l-1.41 4.41H2.45l-1.4-4.41h-.01a72.892 72.892 0 00-.195 4.41H0c.055-1.966.192-3.81.41-5.53h1.15l1.335 4.064h.008l1.347-4.064h1.095c.242 2.015.384 3.86.428 5.53zm4.017-4.08c-.378 2.045-.876 3.533-1.492 4.46-.482.716-1.01 1.073-1.583 1.073-.153 0-.34-.046-.566-.138v-.494c.11.017.24.026.386.026.268 0 .483-.075.647-.222.197-.18.295-.382.295-.605 0-.155-.077-.47-.23-.944L6.23 14.615h.91l.727 2.36c.164.536.233.91.205 1.123.4-1.064.678-2.227.835-3.483zm12.325 4.08h-2.63v-5.53h.885v4.85h1.745zm-3.32.135l-1.016-.5c.09-.076.177-.158.255-.25.433-.506.648-1.258.648-2.253 0-1.83-.718-2.746-2.155-2.746-.704 0-1.254.232-1.65.697-.43.508-.646 1.256-.646 2.245 0 .972.19 1.686.574 2.14.35.41.877.615 1.583.615.264 0 .506-.033.725-.098l1.325.772.36-.622zM15.5 17.588c-.225-.36-.337-.94-.337-1.736 0-1.393.424-2.09 1.27-2.09.443 0 .77.167.977.5.224.362.336.936.336 1.723 0 1.404-.424 2.108-1.27 2.108-.44 0-.77-.167-.978-.5z"/></svg>',
-        "docker": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M13.983 11.078h2.119a.186.186 0 00.186-.185V9.006a.186.186 0 00-.186-.186h-2.119a.185.185 0 00-.185.185v1.888c0 .102.083.185.185.185m-2.954-5.43h2.118a.186.186 0 00.186-.186V3.574a.186.186 0 00-.186-.185h-2.118a.185.185 0 00-.185.185v1.888c0 .102.082.185.185.185m0 2.716h2.118a.187.187 0 00.186-.186V6.29a.186.186 0 00-.186-.185h-2.118a.185.185 0 00-.185.185v1.887c0 .102.082.185.185.186m-2.93 0h2.12a.186.186 0 00.184-.186V6.29a.185.185 0 00-.185-.185H8.1a.185.185 0 00-.185.185v1.887c0 .102.083.185.185.186m-2.964 0h2.119a.186.186 0 00.185-.186V6.29a.185.185 0 00-.185-.185H5.136a.186.186 0 00-.186.185v1.887c0 .102.084.185.186.186m5.893 2.715h2.118a.186.186 0 00.186-.185V9.006a.186.186 0 00-.186-.186h-2.118a.185.185 0 00-.185.185v1.888c0 .102.082.185.185.185m-2.93 0h2.12a.185.185 0 00.184-.185V9.006a.185.185 0 00-.184-.186h-2.12a.185.185 0 00-.184.185v1.888c0 .102.083.185.185.185m-2.964 0h2.119a.185.185 0 00.185-.185V9.006a.185.185 0 00-.184-.186h-2.12a.186.186 0 00-.186.186v1.887c0 .102.084.185.186.185m-2.92 0h2.12a.185.185 0 00.184-.185V9.006a.185.185 0 00-.184-.186h-2.12a.185.185 0 00-.184.185v1.888c0 .102.082.185.185.185M23.763 9.89c-.065-.051-.672-.51-1.954-.51-.338 0-.676.03-1.01.09-1.03-1.454-2.792-1.603-3.115-1.603l-.211.008c-.078.035-.143.073-.19.122a4.78 4.78 0 00-.82 1.152c-.399.912-.477 2.011-.11 3.045-.274.156-.67.388-1.23.614-1.12.447-2.61.679-3.86.679-.51 0-1.02-.05-1.52-.15-.13-.02-.23-.13-.23-.26 0-2.55-1.09-4.91-2.89-6.74C5.01 5.16 4.92 5.03 4.8 4.97 4.68 4.91 4.55 4.9 4.43 4.95c-.08.03-.14.1-.17.18-.01.05-.21.59-.21 1.37 0 .84.23 1.64.66 2.34-.19.24-.42.51-.65.81-.64.81-1.05 1.56-1.14 2.13-.04.24-.05.5-.03.76.02.25.15.48.39.6.39.17.83.26 1.28.26.5 0 .99-.09 1.44-.27a3.37 3.37 0 001.41-.83c.32-.31.53-.66.63-.98.1-.32.24-.61.42-.87.18-.26.37-.51.56-.76.2-.26.42-.52.66-.78.42-.48 1-.91 1.67-1.22.67-.31 1.35-.46 2.03-.46.66 0 1.32.15 1.94.45.62.3 1.16.72 1.57 1.21.17.2.34.4.5.6.16.21.31.42.46.64.14.22.28.45.41.69.13.24.26.49.38.75.11.26.23.53.34.81.11.28.21.56.31.85.09.29.18.58.26.88.08.29.15.59.21.89.06.3.12.61.17.92.04.32.08.63.11.95.02.32.04.64.04.96 0 .62-.05 1.24-.15 1.85a11.71 11.71 0 01-1.08 3.36c-.49.92-1.17 1.73-1.99 2.38-.82.65-1.78 1.13-2.82 1.42-.52.14-1.05.22-1.59.23-.54.02-1.08-.03-1.61-.14-.52-.11-1.03-.28-1.52-.51-.48-.23-.94-.52-1.36-.86-.42-.34-.8-.73-1.13-1.16-.33-.43-.62-.89-.86-1.39-.24-.49-.42-1.01-.54-1.54-.12-.52-.18-1.06-.18-1.6 0-.54.06-1.08.18-1.6.12-.52.3-1.03.54-1.52.24-.49.53-.96.86-1.39.33-.43.71-.82 1.13-1.16.42-.34.88-.63 1.36-.86.49-.23.99-.4 1.52-.51.53-.11 1.07-.16 1.61-.14.54.02 1.07.1 1.59.23.52.13 1.03.31 1.52.54.49.23.96.51 1.39.84.43.33.82.71 1.16 1.13.34.42.63.88.86 1.37.23.49.41 1.01.54 1.53.12.53.18 1.07.18 1.61 0 .54-.06 1.07-.18 1.6-.12.52-.31 1.04-.54 1.53-.23.49-.52.95-.86 1.37-.34.42-.73.8-1.16 1.13-.42.33-.9.62-1.39.85-.49.23-1 .41-1.52.54-.52.12-1.06.18-1.59.14-.54-.02-1.07-.1-1.61-.23-1.04-.29-2--.77-2.82-1.42-.82-.65-1.5-1.46-1.99-2.38a11.71 11.71 0 01-1.08-3.36c-.1-.61-.15-1.23-.15-1.85 0-.32.02-.64.04-.96.03-.32.07-.63.11-.95.05-.31.11-.62.17-.92.06-.3.13-.6.21-.89.08-.3.17-.59.26-.88.1-.29.2-.57.31-.85.11-.28.23-.55.34-.81.13-.26.25-.51.38-.75.13-.24.27-.47.41-.69.15-.22.3-.43.46-.64.16-.2.33-.4.5-.6.41-.49.95-.91 1.57-1.21.62-.3 1.28-.45 1.94-.45.68 0 1.36.15 2.03.46.67.31 1.25.74 1.67 1.22.24.26.46.52.66.78.19.25.38.5.56.76.18.26.32.55.42.87.1.32.31.67.63.98.37.36.85.64 1.41.83.45.18.94.27 1.44.27.45 0 .89-.09 1.28-.26.24-.12.37-.35.39-.6.02-.26.01-.52-.03-.76-.09-.57-.5-1.32-1.14-2.13-.23-.3-.46-.57-.65-.81.43-.7.66-1.5.66-2.34 0-.78-.2-1.32-.21-1.37-.03-.08-.09-.15-.17-.18-.12-.05-.25-.04-.37.02-.12.06-.21.19-.26.32-.01.13-.44.62-1.13 1.43-1.8 1.83-2.89 4.19-2.89 6.74 0 .13-.1.24-.23.26-.5.1-1.01.15-1.52.15-1.25 0-2.74-.23-3.86-.68-.56-.23-.95-.45-1.23-.61.37-1.03.29-2.13-.11-3.04a4.78 4.78 0 00-.82-1.15.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25.06.05.67.51 1.95.51.34 0 .67-.03 1.01-.09 1.03 1.45 2.79 1.6 3.11 1.6l.21-.01c.06-.03.13-.08.19-.12.28-.22.52-.48.73-.78.21-.3.38-.63.52-.98.14-.35.24-.72.3-1.09.06-.37.08-.75.08-1.13 0-.38-.02-.76-.08-1.13-.06-.37-.16-.74-.3-1.09-.14-.35-.31-.68-.52-.98-.21-.3-.45-.56-.73-.78a.65.65 0 00-.19-.12l-.21-.01c-.32 0-2.08.15-3.11 1.6-.34-.06-.67-.09-1.01-.09-1.28 0-1.89.46-1.95.51-.08.06-.12.16-.11.25.01.09.06.18.14.23.07.05.17.08.27.08.1 0 .19-.03.27-.08.01-.01.62-.39 1.38-.39.27 0 .54.03.81.08-.13.25-.23.52-.3.79-.07.27-.11.55-.11.83 0 .28.04.56.11.83.07.27.17.54.3.79-.27.05-.54.08-.81.08-.76 0-1.37-.38-1.38-.39a.47.47 0 00-.27-.08.47.47 0 00-.27.08c-.08.05-.13.14-.14.23-.01.09.03.19.11.25z"/></svg>',
-        "git": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M23.546 10.93L13.067.452c-.604-.603-1.582-.603-2.188 0L8.708 2.627l2.76 2.76c.645-.215 1.379-.07 1.889.441.516.515.658 1.258.438 1.9l2.658 2.66c.645-.223 1.387-.078 1.9.435.721.72.721 1.884 0 2.604-.719.719-1.881.719-2.6 0-.539-.541-.674-1.337-.404-1.996L12.86 8.955v6.525c.176.086.342.203.488.348.713.721.713 1.883 0 2.6-.719.721-1.889.721-2.609 0-.719-.719-.719-1.879 0-2.598.182-.18.387-.316.605-.406V8.835c-.217-.091-.424-.222-.6-.401-.545-.545-.676-1.342-.396-2.009L7.636 3.7.45 10.881c-.6.605-.6 1.584 0 2.189l10.48 10.477c.604.604 1.582.604 2.186 0l10.43-10.43c.605-.603.605-1.582 0-2.187"/></svg>',
-        "node": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M11.998,24c-0.321,0-0.641-0.084-0.922-0.247l-2.936-1.737c-0.438-0.245-0.224-0.332-0.08-0.383 c0.585-0.203,0.703-0.25,1.328-0.604c0.065-0.037,0.151-0.023,0.218,0.017l2.256,1.339c0.082,0.045,0.197,0.045,0.272,0l8.795-5.076 c0.082-0.047,0.134-0.141,0.134-0.238V6.921c0-0.099-0.053-0.192-0.137-0.242l-8.791-5.072c-0.081-0.047-0.189-0.047-0.271,0 L3.075,6.68C2.99,6.729,2.936,6.825,2.936,6.921v10.15c0,0.097,0.054,0.189,0.139,0.235l2.409,1.392 c1.307,0.654,2.108-0.116,2.108-0.89V7.787c0-0.142,0.114-0.253,0.256-0.253h1.115c0.139,0,0.255,0.112,0.255,0.253v10.021 c0,1.745-0.95,2.745-2.604,2.745c-0.508,0-0.909,0-2.026-0.551L2.28,18.675c-0.57-0.329-0.922-0.945-0.922-1.604V6.921 c0-0.659,0.353-1.275,0.922-1.603l8.795-5.082c0.557-0.315,1.296-0.315,1.848,0l8.794,5.082c0.57,0.329,0.924,0.944,0.924,1.603 v10.15c0,0.659-0.354,1.273-0.924,1.604l-8.794,5.078C12.643,23.916,12.324,24,11.998,24z M19.099,13.993 c0-1.9-1.284-2.406-3.987-2.763c-2.731-0.361-3.009-0.548-3.009-1.187c0-0.528,0.235-1.233,2.258-1.233 c1.807,0,2.473,0.389,2.747,1.607c0.024,0.115,0.129,0.199,0.247,0.199h1.141c0.071,0,0.138-0.031,0.186-0.081 c0.048-0.054,0.074-0.123,0.067-0.196c-0.177-2.098-1.571-3.076-4.388-3.076c-2.508,0-4.004,1.058-4.004,2.833 c0,1.925,1.488,2.457,3.895,2.695c2.88,0.282,3.103,0.703,3.103,1.269c0,0.983-0.789,1.402-2.642,1.402 c-2.327,0-2.839-0.584-3.011-1.742c-0.02-0.124-0.126-0.215-0.253-0.215h-1.137c-0.141,0-0.254,0.112-0.254,0.253 c0,1.482,0.806,3.248,4.655,3.248C17.501,17.007,19.099,15.91,19.099,13.993z"/></svg>',
-        "mongodb": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M17.193 9.555c-1.264-5.58-4.252-7.414-4.573-8.115-.28-.394-.53-.954-.735-1.44-.036.495-.055.685-.523 1.184-.723.566-4.438 3.682-4.74 10.02-.282 5.912 4.27 9.435 4.888 9.884l.07.05A73.49 73.49 0 0111.91 24h.481c.114-1.032.284-2.056.51-3.07.417-.296.604-.463.85-.693a11.342 11.342 0 003.639-8.464c.01-.814-.103-1.662-.197-2.218zm-5.336 8.195s0-8.291.275-8.29c.213 0 .49 10.695.49 10.695-.381-.045-.765-1.76-.765-2.405z"/></svg>',
-        "redis": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M10.5 2.661l.54.997-1.797.644 2.409.218.748 1.246.467-1.121 2.077-.208-1.61-.613.613-1.326-1.683.623-.524-1.076-.541 1.326-1.59-.644.63 1.326zm2.035 9.096l.054.045c-.169.04-.327.092-.478.15-.453.174-.854.436-1.151.784-.297.347-.485.783-.535 1.247-.05.464.023.935.209 1.351.187.416.49.771.873 1.019.383.247.833.38 1.286.38.452 0 .902-.133 1.285-.38.383-.248.686-.603.872-1.019.187-.416.26-.887.21-1.351-.05-.464-.238-.9-.535-1.247-.297-.348-.698-.61-1.15-.784-.151-.058-.31-.11-.48-.15l.055-.045zm-10.05-4.93c-.103.006-.2.027-.295.06-.285.098-.516.301-.65.572-.134.27-.165.588-.087.897.078.31.26.585.512.776.252.19.566.284.886.265.32-.02.626-.162.862-.4.236-.239.38-.562.405-.913.025-.352-.078-.703-.29-.99-.212-.287-.519-.486-.866-.56-.068-.015-.137-.022-.208-.023l.001-.015.008.001-.278-2.697.034-1.034.017-.51c0-.17-.011-.34-.033-.509-.02-.163-.05-.326-.092-.486l-.137-.484-.194-.463c-.078-.154-.167-.302-.269-.44-.102-.137-.216-.265-.341-.382l-.375-.344a4.17 4.17 0 00-.838-.55l-.467-.25-.502-.227c-.338-.148-.687-.269-1.044-.363l-1.065-.27-1.103-.214c-.367-.067-.74-.115-1.114-.143l-.281-.014-.285-.006-.57.011c-.19.009-.38.02-.571.034l-.571.051-.285.03-.285.038c-.38.055-.76.123-1.138.205l-.566.13-.283.07-.28.076c-.374.104-.745.223-1.112.36l-.273.105-.268.11c-.178.074-.355.154-.53.239l-.26.128-.513.268-.251.139c-.167.096-.332.198-.495.306l-.244.162-.12.08-.237.166-.46.346c-.075.06-.148.122-.22.185l-.218.19-.107.096-.105.099c-.138.131-.271.268-.4.409l-.189.214-.092.107c-.061.073-.119.148-.176.224l-.166.237-.158.245c-.206.325-.38.67-.519 1.03l-.028.077c-.051.14-.094.283-.13.429-.07.291-.107.591-.108.894 0 .3.03.598.09.889.06.288.15.568.27.832l.12.249.135.236.139.228.073.11.146.209c.05.068.1.135.153.2l.078.1.158.192.08.093.165.187c.055.062.112.122.17.181l.086.09.175.175.178.167c.06.055.12.109.182.162l.183.153.092.076.187.148.189.141c.063.047.128.092.194.137l.098.07.196.135.098.066.197.128c.066.042.133.083.2.123l.1.06.2.117.1.056c.068.038.135.076.204.112l.103.055.205.107.103.052.207.102.104.048.415.189.107.045c.07.03.14.06.211.089l.107.043.424.162.106.038.214.076.428.145.107.034c.072.023.144.045.217.067l.109.032.434.123.108.029.22.06.22.056c.073.019.147.037.221.054l.11.025.443.097.111.023c.074.015.149.03.223.044l.112.021.446.078.336.054.224.033.448.062.112.014c.075.01.15.018.225.026l.113.012.45.043.113.01.451.034.113.007.453.025.566.02.283.007h.285l.567-.015.283-.011.283-.016c.189-.012.377-.026.566-.043l.283-.023.282-.027.566-.06.566-.07.141-.02.424-.066.281-.049.281-.053c.375-.072.748-.156 1.118-.254l.277-.074.553-.161.272-.085c.181-.058.361-.119.54-.184l.534-.202.264-.105.262-.11.26-.114.129-.058.256-.12.127-.062.253-.127.125-.065c.167-.09.332-.184.495-.282.162-.1.323-.202.48-.31l.237-.169.234-.174.116-.09.23-.18.227-.185c.075-.062.149-.125.222-.19l.11-.096.218-.198.215-.202.106-.103.211-.209.417-.436.2-.222.098-.112.192-.227.095-.114.188-.232.093-.118.369-.497.178-.253.175-.26.171-.268.168-.276.164-.285.16-.296.312-.604.073-.153.143-.313.137-.32.132-.328.064-.166.122-.341.116-.35.11-.358.106-.368.1-.378.045-.189.087-.396.08-.407.037-.204.067-.416.06-.426c.019-.142.036-.285.05-.428.014-.143.025-.287.034-.431.01-.144.017-.288.022-.432.005-.072.008-.143.01-.215l.004-.217.002-.434-.002-.434-.006-.434-.01-.217-.014-.434-.037-.433-.022-.217-.05-.432-.028-.216-.034-.216-.066-.43-.04-.215-.045-.214-.088-.427-.052-.212-.056-.211-.104-.423-.06-.21-.064-.208-.118-.416-.072-.207-.134-.41-.078-.204-.082-.202-.04-.1-.14-.396-.09-.197-.093-.195-.178-.386-.1-.19-.102-.19-.193-.375-.108-.186-.11-.184-.112-.182-.055-.09-.22-.356-.116-.178-.118-.175-.118-.172-.06-.086-.234-.329-.244-.32-.124-.157-.127-.154-.127-.15-.064-.074-.255-.29-.13-.145-.133-.14-.265-.275-.136-.136-.138-.132-.277-.259-.142-.13c-.048-.043-.095-.085-.143-.126l-.143-.123-.287-.24-.148-.12-.149-.117-.298-.227-.304-.221-.155-.11-.156-.108-.157-.105-.314-.201-.318-.195-.162-.096-.163-.094-.163-.09-.327-.178c-.11-.058-.22-.115-.33-.169l-.166-.083-.167-.08-.168-.076-.168-.074-.337-.143-.17-.069-.171-.065-.172-.063-.172-.06-.345-.116-.175-.056-.175-.053-.176-.05-.176-.046c-.117-.03-.235-.06-.353-.088l-.177-.04-.178-.038c-.12-.024-.238-.047-.357-.068l-.18-.031-.18-.028-.18-.025-.18-.022-.181-.018-.182-.016-.182-.012c-.061-.004-.122-.008-.183-.01l-.184-.008-.368-.006-.184.002-.738.02-.185.01-.184.013-.736.062-.368.042-.183.025-.183.027-.366.06-.183.034c-.061.012-.122.024-.183.037l-.365.083-.182.046-.181.048-.362.102-.181.055-.18.058-.36.12c-.06.021-.119.043-.179.065l-.178.068-.177.071-.176.073-.352.154-.175.08-.173.083-.173.086-.172.088-.343.185-.17.095-.339.197c-.112.068-.224.138-.335.21l-.166.109-.165.112-.164.115-.163.117-.324.243-.16.123c-.053.041-.106.083-.159.126l-.157.13c-.052.043-.104.087-.156.132l-.154.134-.306.283-.074.071-.147.145-.291.297-.142.15-.14.153-.28.315-.068.078-.136.16-.27.326-.13.164-.128.167-.127.17-.126.173-.249.359-.06.09-.12.18-.117.184-.116.187-.114.19-.112.193-.222.393-.053.098-.105.2-.103.204-.101.206-.1.21-.097.213-.19.436-.09.22-.088.223-.17.451-.08.228-.077.231-.15.464-.067.236-.064.239-.124.48-.056.243c-.018.082-.035.163-.052.245l-.1.493-.042.248-.04.25-.037.251-.034.252-.032.254-.029.255-.026.256c-.008.085-.015.171-.023.257l-.018.258-.015.26c-.005.086-.01.173-.013.26l-.01.261-.007.263-.004.264-.001.265.002.266.005.267.009.267.012.268.015.269.018.27.021.271.025.271.028.273.032.274.036.275.04.275.043.277.047.277.05.279.055.279.059.28.062.282.067.283.07.284.075.285.078.286.082.286.046.143c.029.095.059.19.089.285l.091.283.095.281.098.279.103.278.106.275.11.273.114.27.118.268.122.265.127.262.131.258.135.255.14.251.144.247.149.243.048.079.103.164.105.161.108.158.11.154.113.15.116.146.118.142.121.138.123.134.126.13.128.125.131.121.134.116.136.112.139.108.142.104.145.1.147.095.15.091.076.045.077.043.155.087.158.082.16.078.164.073.166.069.169.065.172.061.175.056.177.052.181.047c.06.015.121.03.182.044l.184.039.187.035.19.03c.127.02.255.038.383.054l.193.021.194.017.195.013.196.009.196.005.197.001.395-.007.197-.011.197-.015.197-.019c.131-.016.263-.033.394-.052l.196-.028.195-.032.195-.036.194-.04.193-.044.192-.048.19-.052c.064-.018.127-.036.19-.055l.188-.059c.062-.02.125-.04.187-.062l.186-.066c.062-.022.123-.045.184-.068l.182-.072.181-.076.18-.08c.059-.027.118-.054.177-.082l.175-.086c.058-.029.116-.058.174-.088l.171-.093c.057-.031.114-.063.17-.096l.168-.1.165-.104.163-.108.16-.112c.053-.037.106-.075.158-.114l.156-.118.153-.122.15-.127.147-.13.144-.135.141-.139.138-.144.134-.149.131-.153.127-.158.124-.162.12-.167.116-.172.112-.177.108-.182.104-.187.1-.192.095-.197.09-.201.085-.207.08-.212.075-.217.07-.221.064-.227.06-.231.053-.236.048-.241.043-.246.037-.25.031-.256.025-.26.019-.264.013-.27.006-.273-.001-.278-.007-.282-.014-.286-.021-.29-.027-.294-.034-.298-.041-.302-.048-.305-.054-.309-.062-.312-.068-.316-.075-.319-.082-.322-.088-.325-.095-.328-.102-.33-.109-.333-.116-.335-.123-.338-.13-.34-.137-.342-.144-.344-.151-.346-.158-.348-.165-.349-.172-.351-.179-.352-.186-.354-.193-.355-.2-.356-.206-.357-.213-.357-.22-.358-.228-.358-.235-.359-.24-.359-.248-.359-.255-.359-.262-.36-.27-.36-.276-.36-.284-.36-.291-.36-.298-.359-.305-.36-.313-.359-.32-.359-.327-.359-.334-.359-.341-.359-.349-.359-.356-.358-.364-.358-.37-.359-.378-.358-.384-.359-.392-.358-.399-.359-.406-.359-.413-.359-.42-.359-.428-.359h-.213l-.428.359-.42.359-.414.359-.406.359-.399.359-.391.358-.384.359-.377.358-.37.359-.363.358-.356.358-.349.359-.342.359-.334.359-.327.359-.32.359-.312.359-.305.36-.298.359-.291.36-.283.36-.276.36-.269.36-.262.36-.255.359-.248.359-.24.359-.234.359-.227.358-.22.358-.213.357-.207.357-.199.356-.193.355-.185.354-.179.352-.172.351-.165.349-.158.348-.151.346-.143.344-.137.342-.13.34-.123.338-.116.335-.109.333-.102.33-.095.328-.088.325-.081.322-.075.319-.068.316-.061.312-.055.309-.048.305-.041.302-.034.298-.027.294-.02.29-.014.286-.007.282-.001.278.006.273.013.27.019.264.025.26.031.256.037.25.043.246.048.241.054.236.059.231.064.227.07.221.075.217.081.212.085.207.09.201.095.197.1.192.104.187.108.182.112.177.116.172.12.167.124.162.127.158.131.153.134.149.138.144.141.139.144.135.148.13.15.127.153.122.156.118.158.114.16.112.164.108.165.104.168.1.17.096.172.093.174.088.175.086.177.082.18.08.181.076.182.072.184.068c.061.022.123.044.185.066l.187.062.188.059.19.055.19.052.192.048.193.044.194.04.195.036.195.032.196.028.197.024c.065.008.131.016.197.023l.197.019.197.015.197.011.197.007.197.003.197-.001.196-.005.196-.009.196-.013.195-.017.194-.021.194-.025.193-.029.192-.033.191-.037.19-.041.19-.045.188-.05.187-.053.186-.058.185-.062.183-.066.182-.07.18-.074.179-.078.178-.083.176-.087.174-.091.173-.096.171-.1.169-.104.167-.109.165-.114.163-.118.161-.123.158-.127.156-.132c.052-.044.103-.089.154-.135l.151-.139.149-.144.146-.149.143-.153.14-.158.137-.163.134-.168.13-.173.127-.177.123-.182.119-.187.115-.192.111-.197.107-.202.102-.207.098-.212.093-.217.088-.222.083-.227.078-.231.073-.237.067-.241.062-.247.056-.251.05-.256.044-.261.038-.266.031-.27.025-.276.018-.28.011-.285.005-.29-.003-.294-.01-.299-.018-.304-.026-.308-.034-.313-.042-.317-.05-.322-.059-.326-.067-.33-.076-.334-.085-.338-.093-.342-.102-.346-.111-.35-.12-.353-.129-.357-.138-.36-.147-.364-.156-.367-.165-.37-.174-.373-.184-.376-.193-.378-.202-.381-.211-.384-.221-.386-.23-.389-.239-.391-.249-.393-.258-.396-.268-.398-.277-.4-.287-.402-.297-.404-.306-.407-.316-.408-.326-.41-.336-.412-.346-.414-.356-.415-.366-.417-.376-.418-.386-.42-.396-.421-.407-.422-.417-.424-.427-.425-.438-.426-.448-.427-.458-.428-.469-.429-.48-.43-.49-.431-.5-.432-.511-.433-.522-.434-.532-.435-.543-.436-.554-.436-.565-.437-.576-.437-.587-.438-.598-.439-.609-.439-.62-.439-.631-.44-.642-.44-.654-.441-.665-.441-.676-.441-.687-.441-.699-.441-.71-.441-.721-.441-.733-.44-.744-.441-.755-.44-.767-.439-.778-.439-.789-.439-.801-.438-.812-.438-.824-.438-.835-.437-.846-.436-.858-.436-.869-.435-.881-.434-.892-.433-.904-.433-.915-.431-.926-.431-.938-.43-.949-.429-.961-.427-.972-.427-.983-.425-.995-.424-1.006-.423-1.017-.422-1.029-.42-1.04-.418-1.051-.417-1.062-.415-1.074-.414-1.085-.412-1.096-.41-1.107-.408-1.118-.407-1.129-.404-1.14-.403-1.151-.4-1.162-.398-1.173-.396-1.183-.393-1.194-.391-1.205-.389-1.215-.386-1.226-.384-1.237-.38-1.247-.378-1.257-.375-1.267-.373-1.278-.369-1.288-.367-1.298-.363-1.308-.36-1.318-.357-1.327-.353-1.337-.35-1.347-.346-1.356-.342-1.366-.339-1.375-.334-1.385-.331-1.394-.327-1.403-.323-1.412-.319-1.421-.314-1.43-.31-1.439-.306-1.447-.301-1.456-.296-1.464-.292-1.473-.287-1.481-.282-1.489-.277-1.497-.272-1.505-.267-1.513-.261-1.521-.256-1.528-.25-1.536-.245-1.543-.239-1.551-.233-1.558-.227-1.565-.221-1.571-.215-1.578-.208-1.585-.202-1.591-.195-1.598-.189-1.604-.182-1.61-.175-1.616-.168-1.622-.16-1.628-.153-1.633-.146-1.639-.138-1.644-.131-1.649-.122-.825-.061-.819-.055-.813-.049-.807-.044-.801-.037-.795-.031-.788-.024-.782-.018-.775-.011-.768-.004-.761.002-.754.009-.747.015-.739.022-.732.028-.724.035-.717.041-.709.048-.701.054-.693.061-.684.067-.676.073-.668.08-.659.086-.65.093-.642.099-.633.105-.624.112-.615.118-.606.124-.596.131-.587.137-.578.143-.568.149-.558.155-.549.162-.539.168-.528.174-.519.18-.508.186-.498.192-.487.198-.477.204-.466.209-.455.215-.444.221-.433.227-.422.232-.41.238-.399.243-.387.249-.376.254-.364.259-.352.265-.34.27-.328.274-.316.28-.303.285-.291.29-.278.294-.266.299-.253.303-.24.308-.227.312-.214.317-.201.321-.188.325-.175.329-.161.334-.148.337-.134.341-.12.345-.106.348-.092.352-.078.355-.064.358-.05.361-.036.364-.021.367-.007.37.007.372.022.375.036.377.051.38.065.381.08.384.094.386.109.388.124.39.139.391.154.393.169.394.184.396.198.397.214.398.229.399.244.4.259.4.274.401.289.401.304.402.319.402.334.402.349.402.365.401.38.401.395.4.41.4.425.399.44.397.455.397.47.395.485.394.5.392.515.39.53.388.545.386.56.383.575.381.59.378.605.375.62.372.634.369.649.366.663.362.678.358.692.355.706.35.72.347.734.342.748.338.761.333.775.328.788.324.801.318.814.313.827.308.84.302.852.296.865.29.877.284.889.277.901.271.912.264.924.257.935.25.946.242.957.235.967.227.978.219.988.21.998.202 1.007.193 1.017.184 1.026.175 1.035.165 1.043.156 1.052.146 1.06.136 1.068.125 1.075.115 1.083.104 1.09.092 1.097.081 1.103.07 1.11.058 1.116.045 1.121.033 1.127.02 1.132.007 1.137-.006 1.142-.02 1.146-.033 1.15-.047 1.154-.061 1.157-.074 1.161-.089 1.164-.103 1.166-.117 1.169-.131 1.171-.146 1.172-.16 1.174-.175 1.175-.19 1.176-.204 1.177-.219 1.177-.234 1.177-.249 1.177-.264 1.176-.279 1.176-.294 1.174-.309 1.173-.324 1.171-.339 1.169-.354 1.167-.369 1.165-.384 1.162-.399 1.159-.414 1.156-.429 1.152-.443 1.149-.458 1.145-.473 1.14-.488 1.136-.502 1.131-.517 1.126-.531 1.121-.546 1.115-.56 1.11-.574 1.104-.588 1.098-.602 1.091-.616 1.085-.629 1.078-.643 1.071-.656 1.064-.67 1.056-.683 1.049-.696 1.041-.709 1.033-.721 1.025-.734 1.016-.746 1.008-.759.999-.771.99-.783.981-.794.971-.806.962-.817.952-.828.943-.839.932-.85.922-.861.912-.871.901-.881.89-.891.879-.901.868-.91.856-.92.845-.929.833-.938.821-.946.809-.955.797-.963.784-.971.772-.978.759-.986.746-.993.733-.999.719-1.006.706-1.012.692-1.018.678-1.024.664-1.029.65-1.035.636-1.039.621-1.044.607-1.048.592-1.052.577-1.056.562-1.059.547-1.062.532-1.065.517-1.068.501-1.07.486-1.072.47-1.074.454-1.076.438-1.077.423-1.078.406-1.079.39-1.08.374-1.08.357-1.081.341-1.081.324-1.081.307-1.08.29-1.08.273-1.08.256-1.079.238-1.078.221-1.076.203-1.075.185-1.073.167-1.071.149-1.069.131-1.067.113-1.064.095-1.062.077-1.059.058-1.055.04-1.052.021-1.048.003-1.044-.016-1.04-.035-1.036-.054-1.032-.073-1.027-.092-1.022-.111-1.017-.13-1.012-.149-1.007-.168-1.002-.187-.996-.206-.991-.225-.985-.244-.979-.263-.973-.281-.967-.3-.961-.318-.954-.337-.948-.355-.941-.373-.934-.391-.927-.409-.92-.427-.912-.445-.905-.462-.897-.48-.889-.497-.881-.514-.873-.531-.865-.548-.856-.565-.848-.582-.839-.598-.83-.614-.821-.631-.812-.647-.803-.663-.793-.679-.783-.694-.774-.71-.763-.725-.753-.741-.743-.756-.732-.77-.722-.786-.71-.8-.699-.815-.688-.829-.676-.843-.665-.857-.653-.871-.641-.885-.629-.898-.616-.911-.604-.925-.591-.937-.578-.95-.565-.962-.551-.975-.538-.986-.524-.998-1.51z"/></svg>',
-        "github": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z"/></svg>',
-        "tailwind": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M12.001,4.8c-3.2,0-5.2,1.6-6,4.8c1.2-1.6,2.6-2.2,4.2-1.8c0.913,0.228,1.565,0.89,2.288,1.624 C13.666,10.618,15.027,12,18.001,12c3.2,0,5.2-1.6,6-4.8c-1.2,1.6-2.6,2.2-4.2,1.8c-0.913-0.228-1.565-0.89-2.288-1.624 C16.337,6.182,14.976,4.8,12.001,4.8z M6.001,12c-3.2,0-5.2,1.6-6,4.8c1.2-1.6,2.6-2.2,4.2-1.8c0.913,0.228,1.565,0.89,2.288,1.624 c1.177,1.194,2.538,2.576,5.512,2.576c3.2,0,5.2-1.6,6-4.8c-1.2,1.6-2.6,2.2-4.2,1.8c-0.913-0.228-1.565-0.89-2.288-1.624 C10.337,13.382,8.976,12,6.001,12z"/></svg>',
-        "bootstrap": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M11.77 11.24H9.956V8.202h2.152c1.17 0 1.834.522 1.834 1.466 0 1.008-.773 1.572-2.174 1.572zm.324 1.206H9.957v3.348h2.231c1.459 0 2.232-.585 2.232-1.685s-.795-1.663-2.326-1.663zM24 11.39v1.218c-1.128.108-1.817.944-2.226 2.268-.407 1.319-.407 2.857-.407 2.857h-1.257v-5.28h-.004c-.014-4.97-4.065-8.99-9.04-8.99C5.099 3.463 1.08 7.452 1.067 12.393H1.05v5.28H0s0-1.538-.407-2.857c-.409-1.324-1.098-2.16-2.226-2.268V11.39c1.445.101 2.25 1.24 2.663 2.605.337 1.11.337 2.614.337 2.614h.004v.002l.004.094v.002l-.01-.002v.02l.001.002v-.002h.01v5.949h-.004v.2h.005c.093 2.95 2.474 5.303 5.427 5.303H17.91c2.953 0 5.334-2.353 5.427-5.303h.005v-.2h-.004v-5.949h.01v.002l.001-.002v-.02l-.01.002v-.002l.004-.094v-.002h.004s0-1.504.337-2.614c.413-1.365 1.218-2.504 2.663-2.605zM17.91 22.274H5.854c-1.699 0-3.085-1.379-3.085-3.078v-4.916h18.226v4.916c0 1.7-1.386 3.078-3.085 3.078z"/></svg>',
-        "sass": '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M12 0c6.627 0 12 5.373 12 12s-5.373 12-12 12S0 18.627 0 12 5.373 0 12 0zM9.615 15.998c.175.645.156 1.248-.024 1.792l-.065.18c-.024.061-.052.12-.078.176-.14.29-.326.56-.555.81-.698.759-1.672 1.047-2.09.805-.45-.262-.226-1.335.584-2.19.871-.918 2.12-1.509 2.12-1.509v-.003l.108-.061zm9.911-10.861c-.542-2.133-4.077-2.834-7.422-1.645-1.989.707-4.144 1.818-5.693 3.267C4.568 8.48 4.275 9.98 4.396 10.607c.427 2.211 3.457 3.657 4.703 4.73v.006c-.367.18-3.056 1.529-3.686 2.925-.675 1.47.105 2.521.615 2.655 1.575.436 3.195-.36 4.065-1.649.84-1.261.766-2.881.404-3.676.496-.135 1.08-.195 1.83-.104 2.101.24 2.521 1.56 2.43 2.1-.09.539-.523.854-.674.944-.15.091-.195.12-.181.181.015.09.091.09.21.075.165-.03 1.096-.45 1.141-1.471.045-1.29-1.186-2.729-3.375-2.7-.9.016-1.471.091-1.875.256-.03-.045-.061-.075-.105-.105-1.35-1.455-3.855-2.475-3.75-4.41.03-.705.285-2.564 4.8-4.814 3.705-1.846 6.661-1.335 7.171-.21.733 1.604-1.576 4.59-5.431 5.024-1.47.165-2.235-.404-2.431-.615-.209-.225-.239-.239-.314-.194-.12.06-.045.255 0 .375.12.3.585.825 1.396 1.095.704.225 2.43.359 4.5-.45 2.324-.899 4.139-3.405 3.614-5.505l.073.067z"/></svg>',
-    }
-
-    # Get icon or use a default generic icon
-    icon_svg = icons.get(tech_name_lower,
-        '<svg class="{}" fill="currentColor" viewBox="0 0 24 24"><path d="M12 2L2 7v10c0 5.55 3.84 10.74 9 12 5.16-1.26 9-6.45 9-12V7l-10-5z"/></svg>')
-
-    return mark_safe(icon_svg.format(css_class))
+    return format_html(
+        '<svg class="{}" fill="currentColor" viewBox="0 0 24 24" '
+        'aria-hidden="true"><use href="{}#{}"/></svg>',
+        css_class,
+        static(SPRITE_STATIC_PATH),
+        icon_id(tech_name),
+    )
 
 
 @register.simple_tag
-def project_card_image(project):
+def project_card_image(project, width=None, height=None):
     """
     Return the URL for a project's card image.
-    Uses the project.get_card_image_url() method.
+    Uses the project.get_card_image_url() method, or a resized variant of
+    raster card images when a rendered size is given.
     
     Args:
         project: Project instance
+        width: Optional rendered width in pixels
+        height: Optional rendered height in pixels
         
     Returns:
         str: URL to the card image
     """
+    if width and height:
+        source = project.get_card_image_source()
+        if source and not source.lower().endswith(".svg"):
+            return resized_image_url(source, int(width), int(height))
     return project.get_card_image_url()
+
+
+@register.simple_tag
+def project_card_svg(project):
+    """
+    Return inline SVG markup for a project's card image when it is small.
+
+    Static SVG card art whose minified markup is no larger than
+    settings.INLINE_SVG_MAX_BYTES is embedded directly in the card to save a
+    request; anything else returns an empty string so the template falls
+    back to an <img>. Sources more than INLINE_SVG_SOURCE_RATIO times the
+    limit are not parsed at all.
+
+    Args:
+        project: Project instance
+
+    Returns:
+        str: Safe SVG markup or empty string
+    """
+    source = project.get_card_image_source()
+    if not source.startswith("static/") or not source.lower().endswith(".svg"):
+        return ""
+
+    path = settings.BASE_DIR / source
+    try:
+        limit = settings.INLINE_SVG_MAX_BYTES
+        if path.stat().st_size > limit * INLINE_SVG_SOURCE_RATIO:
+            return ""
+        markup = inline_svg(
+            path,
+            id_prefix=f"card-{project.slug}",
+            attributes={
+                "class": "w-full h-full",
+                "preserveAspectRatio": "xMidYMid slice",
+                "role": "img",
+                "aria-label": project.title,
+            },
+        )
+    except (OSError, ValueError):
+        return ""
+    if len(markup.encode("utf-8")) > limit:
+        return ""
+    return mark_safe(markup)
@@ -0,0 +1,195 @@
+"""
+Tests for the concurrent, cached gallery importer.
+
+A local HTTP server stands in for the old GitHub Pages portfolio so the
+conditional-request behaviour can be asserted without network access.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.management import call_command
+from PIL import Image
+
+from projects.management.commands.import_gallery_images import (
+    CachedDownloader,
+    Command,
+)
+from projects.models import ProjectImage
+
+
+def _png_bytes(color):
+    buffer = BytesIO()
+    Image.new("RGB", (16, 16), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _GalleryHandler(BaseHTTPRequestHandler):
+    images = {
+        "/one.png": _png_bytes("#94db40"),
+        "/two.png": _png_bytes("#ef0041"),
+    }
+    full_responses = []
+    not_modified_responses = []
+
+    def do_GET(self):
+        body = self.images.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        etag = f'"{self.path.strip("/")}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.not_modified_responses.append(self.path)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.full_responses.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def gallery_server():
+    _GalleryHandler.full_responses = []
+    _GalleryHandler.not_modified_responses = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GalleryHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _image(url, caption, order):
+    return {"url": url, "caption": caption, "order": order}
+
+
+@pytest.fixture
+def gallery_mapping(
+    gallery_server, monkeypatch, project_factory, tmp_path, settings
+):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    project = project_factory(slug="epic_events")
+    monkeypatch.setattr(
+        Command,
+        "GALLERY_IMAGES",
+        {
+            "epic_events": [
+                _image(f"{gallery_server}/one.png", "One", 1),
+                _image(f"{gallery_server}/two.png", "Two", 2),
+            ],
+            "missing-project": [
+                _image(f"{gallery_server}/one.png", "One", 1),
+            ],
+        },
+    )
+    return project
+
+
+def _run(tmp_path, *args):
+    output = StringIO()
+    call_command(
+        "import_gallery_images",
+        f"--cache-dir={tmp_path / 'download-cache'}",
+        "--workers=2",
+        *args,
+        stdout=output,
+    )
+    return output.getvalue()
+
+
+@pytest.mark.django_db
+class TestImportGalleryImages:
+    def test_downloads_images_in_parallel_and_creates_gallery(
+        self, gallery_mapping, tmp_path
+    ):
+        output = _run(tmp_path)
+
+        gallery = ProjectImage.objects.filter(project=gallery_mapping)
+        assert gallery.count() == 2
+        assert sorted(_GalleryHandler.full_responses) == [
+            "/one.png",
+            "/two.png",
+        ]
+        assert "Project not found: missing-project" in output
+
+    def test_rerun_skips_existing_images_without_network(
+        self, gallery_mapping, tmp_path
+    ):
+        _run(tmp_path)
+
+        output = _run(tmp_path)
+
+        assert "Skipped: 2" in output
+        assert len(_GalleryHandler.full_responses) == 2
+        assert _GalleryHandler.not_modified_responses == []
+
+    def test_forced_rerun_revalidates_from_disk_cache(
+        self, gallery_mapping, tmp_path
+    ):
+        _run(tmp_path)
+
+        output = _run(tmp_path, "--force")
+
+        gallery = ProjectImage.objects.filter(project=gallery_mapping)
+        assert gallery.count() == 2
+        assert len(_GalleryHandler.full_responses) == 2
+        assert sorted(_GalleryHandler.not_modified_responses) == [
+            "/one.png",
+            "/two.png",
+        ]
+        assert "(cached)" in output
+
+    def test_existing_images_are_resolved_in_one_query(
+        self, gallery_mapping, tmp_path, django_assert_max_num_queries
+    ):
+        _run(tmp_path)
+
+        with django_assert_max_num_queries(2):
+            _run(tmp_path)
+
+    def test_unreadable_cache_entries_are_fetched_again(
+        self, gallery_mapping, tmp_path
+    ):
+        _run(tmp_path)
+        for meta_path in (tmp_path / "download-cache").glob("*.json"):
+            meta_path.write_text('{"etag": "tru', encoding="utf-8")
+
+        output = _run(tmp_path, "--force")
+
+        assert "Created: 2" in output
+        assert len(_GalleryHandler.full_responses) == 4
+        assert _GalleryHandler.not_modified_responses == []
+        assert not list((tmp_path / "download-cache").glob(".*"))
+
+    def test_a_failing_image_does_not_abort_the_import(
+        self, gallery_mapping, tmp_path, monkeypatch
+    ):
+        fetch = CachedDownloader.fetch
+
+        def flaky_fetch(downloader, url):
+            if url.endswith("/one.png"):
+                raise OSError("disk full")
+            return fetch(downloader, url)
+
+        monkeypatch.setattr(CachedDownloader, "fetch", flaky_fetch)
+
+        output = _run(tmp_path)
+
+        assert "Failed to download" in output and "disk full" in output
+        assert "Created: 1" in output
+        assert list(
+            ProjectImage.objects.filter(project=gallery_mapping).values_list(
+                "caption", flat=True
+            )
+        ) == ["Two"]
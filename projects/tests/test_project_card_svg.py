@@ -0,0 +1,53 @@
+import pytest
+
+from projects.templatetags.project_tags import project_card_svg
+
+CARD_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="800" height="800" '
+    'viewBox="0 0 10 10"><defs><clipPath id="c"><rect width="5" height="5"/>'
+    '</clipPath></defs><rect clip-path="url(#c)" width="10" height="10"/>'
+    "</svg>"
+)
+
+
+@pytest.fixture
+def card_dir(tmp_path, settings):
+    settings.BASE_DIR = tmp_path
+    directory = tmp_path / "static" / "images"
+    directory.mkdir(parents=True)
+    return directory
+
+
+@pytest.mark.django_db
+class TestProjectCardSvg:
+    def test_small_svg_is_inlined_with_unique_ids(
+        self, card_dir, project_factory
+    ):
+        project = project_factory(slug="demo", title="Demo")
+        (card_dir / "demo_card.svg").write_text(CARD_SVG)
+
+        markup = project_card_svg(project)
+
+        assert markup.startswith("<svg")
+        assert 'id="card-demo-c"' in markup
+        assert 'aria-label="Demo"' in markup
+
+    def test_svg_over_threshold_is_not_inlined(
+        self, card_dir, project_factory, settings
+    ):
+        settings.INLINE_SVG_MAX_BYTES = 10
+        project = project_factory(slug="demo")
+        (card_dir / "demo_card.svg").write_text(CARD_SVG)
+
+        assert project_card_svg(project) == ""
+
+    def test_threshold_applies_to_the_minified_markup(
+        self, card_dir, project_factory, settings
+    ):
+        project = project_factory(slug="demo")
+        metadata = "<metadata>" + "x" * 400 + "</metadata>"
+        padded = CARD_SVG.replace("<defs>", metadata + "<defs>")
+        (card_dir / "demo_card.svg").write_text(padded)
+        settings.INLINE_SVG_MAX_BYTES = len(padded) - 100
+
+        assert project_card_svg(project).startswith("<svg")
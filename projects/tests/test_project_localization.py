@@ -2,10 +2,14 @@
 Tests for translated project content rendering.
 """
 from html import unescape
+from io import StringIO
 
 import pytest
-from django.conf import settings
+from django.core.management import call_command
 from django.urls import reverse
+from django.utils import translation
+
+from core.localization import translation_service
 
 
 @pytest.mark.django_db
@@ -20,11 +24,10 @@ class TestProjectLocalization:
         """
 
         project = project_factory()
-        client.cookies[settings.LANGUAGE_COOKIE_NAME] = "fr"
 
-        response = client.get(
-            reverse("projects:detail", kwargs={"slug": project.slug})
-        )
+        with translation.override("fr"):
+            url = reverse("projects:detail", kwargs={"slug": project.slug})
+        response = client.get(url)
 
         assert response.status_code == 200
         content = unescape(response.content.decode())
@@ -32,3 +35,63 @@ class TestProjectLocalization:
         assert "Projets d'étude" in content
         assert "CRM CLI pour une agence événementielle" in content
         assert "Authentification JWT (SimpleJWT)" in content
+
+    def test_should_precompute_catalog_translations_on_save(
+        self, project_factory
+    ):
+        """
+        Ensure content fields found in the catalog are stored per language.
+        """
+
+        project = project_factory()
+
+        french = project.translations["fr"]
+        assert french["tagline"] == "CRM CLI pour une agence événementielle"
+        assert "Authentification JWT (SimpleJWT)" in french["features"]
+
+    def test_should_refresh_stored_translations_from_command(
+        self, project_factory
+    ):
+        """
+        Ensure the command fills translations of rows saved without them.
+        """
+
+        project = project_factory()
+        type(project).objects.filter(pk=project.pk).update(translations={})
+
+        call_command("refresh_project_content", stdout=StringIO())
+
+        project.refresh_from_db()
+        french = project.translations["fr"]
+        assert french["tagline"] == "CRM CLI pour une agence événementielle"
+
+    def test_should_render_stored_translations_without_catalog_lookup(
+        self,
+        client,
+        project_factory,
+        monkeypatch,
+    ):
+        """
+        Ensure templates read stored translations instead of the catalog.
+        """
+
+        project = project_factory()
+        looked_up = []
+        original = translation_service.Translator.text
+
+        def spy(translator, text):
+            looked_up.append(text)
+            return original(translator, text)
+
+        monkeypatch.setattr(translation_service.Translator, "text", spy)
+
+        with translation.override("fr"):
+            url = reverse("projects:detail", kwargs={"slug": project.slug})
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert "CRM CLI pour une agence événementielle" in unescape(
+            response.content.decode()
+        )
+        assert project.description not in looked_up
+        assert project.challenges not in looked_up
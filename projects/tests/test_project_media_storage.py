@@ -0,0 +1,95 @@
+from io import BytesIO, StringIO
+from unittest import mock
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from PIL import Image
+
+from projects.models import ProjectImage
+from projects.storage import CONTENT_ADDRESSED_PREFIX
+
+
+def _png_upload(color="#94db40"):
+    buffer = BytesIO()
+    Image.new("RGB", (32, 32), color).save(buffer, format="PNG")
+    return ContentFile(buffer.getvalue(), name="screenshot.png")
+
+
+@pytest.fixture(autouse=True)
+def media_root(tmp_path, settings):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    return settings.MEDIA_ROOT
+
+
+def _stored_files(media_root):
+    return sorted((media_root / CONTENT_ADDRESSED_PREFIX).rglob("*.*"))
+
+
+@pytest.mark.django_db
+class TestContentAddressedProjectMedia:
+    def test_gallery_images_are_named_by_content_hash(self, project_factory):
+        image = ProjectImage(project=project_factory(), order=1)
+        image.image.save("screenshot.png", _png_upload(), save=True)
+
+        assert image.image.name.startswith(f"{CONTENT_ADDRESSED_PREFIX}/")
+        assert "screenshot" not in image.image.name
+
+    def test_identical_uploads_share_one_file_across_projects(
+        self, project_factory, category_factory, media_root
+    ):
+        category = category_factory()
+        first = ProjectImage(
+            project=project_factory(category=category), order=1
+        )
+        first.image.save("a.png", _png_upload(), save=True)
+        second = ProjectImage(
+            project=project_factory(category=category), order=1
+        )
+        second.image.save("b.png", _png_upload(), save=True)
+        project = project_factory(category=category)
+        project.featured_image.save("c.png", _png_upload(), save=True)
+
+        assert first.image.name == second.image.name
+        assert second.image.name == project.featured_image.name
+        assert len(_stored_files(media_root)) == 1
+
+    def test_known_upload_skips_reoptimization(self, project_factory):
+        first = ProjectImage(project=project_factory(), order=1)
+        first.image.save("a.png", _png_upload(), save=True)
+
+        with mock.patch("projects.models.optimize_image") as optimize:
+            second = ProjectImage(project=first.project, order=2)
+            second.image.save("a.png", _png_upload(), save=True)
+
+        optimize.assert_not_called()
+        assert second.image.name == first.image.name
+
+
+@pytest.mark.django_db
+class TestGcProjectMediaCommand:
+    def test_deletes_only_orphaned_files(self, project_factory, media_root):
+        kept = ProjectImage(project=project_factory(), order=1)
+        kept.image.save("kept.png", _png_upload("#94db40"), save=True)
+        orphan = ProjectImage(project=kept.project, order=2)
+        orphan.image.save("orphan.png", _png_upload("#ef0041"), save=True)
+        orphan.delete()
+        output = StringIO()
+
+        call_command("gc_project_media", "--min-age=0", stdout=output)
+
+        assert [path.name for path in _stored_files(media_root)] == [
+            kept.image.name.rsplit("/", 1)[-1]
+        ]
+        assert "Deleted 1 orphaned file(s)" in output.getvalue()
+
+    def test_dry_run_keeps_files(self, project_factory, media_root):
+        orphan = ProjectImage(project=project_factory(), order=1)
+        orphan.image.save("orphan.png", _png_upload(), save=True)
+        orphan.delete()
+
+        call_command(
+            "gc_project_media", "--min-age=0", "--dry-run", stdout=StringIO()
+        )
+
+        assert len(_stored_files(media_root)) == 1
@@ -46,3 +46,41 @@ class TestProjectModel:
         similar = list(p1.get_similar_projects())
         assert p2 in similar
         assert len(similar) <= 3
+
+
+@pytest.mark.django_db
+class TestProjectAnimatedArt:
+    def test_card_uses_poster_and_animation_when_converted(
+        self, tmp_path, settings, project_factory
+    ):
+        settings.BASE_DIR = tmp_path
+        images = tmp_path / "static" / "images"
+        images.mkdir(parents=True)
+        for name in (
+            "demo_card.svg",
+            "demo_card.poster.webp",
+            "demo_card.anim.webp",
+        ):
+            (images / name).write_bytes(b"")
+        project = project_factory(slug="demo")
+
+        assert (
+            project.get_card_image_source()
+            == "static/images/demo_card.poster.webp"
+        )
+        assert project.get_card_animation_url().endswith("demo_card.anim.webp")
+
+    def test_gallery_lists_unconverted_gif_as_animated(
+        self, tmp_path, settings, project_factory
+    ):
+        settings.BASE_DIR = tmp_path
+        gallery = tmp_path / "static" / "images" / "gallerie"
+        gallery.mkdir(parents=True)
+        (gallery / "demo_1.gif").write_bytes(b"")
+        project = project_factory(slug="demo")
+
+        [image] = project.get_gallery_images()
+
+        assert image["format"] == "animated"
+        assert image["source"] == "static/images/gallerie/demo_1.gif"
+        assert image["animated_url"].endswith("demo_1.gif")
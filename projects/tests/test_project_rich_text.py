@@ -0,0 +1,83 @@
+"""
+Tests for prerendered project Markdown fields.
+"""
+from html import unescape
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import translation
+
+from core import markdown
+from core.markdown import render_markdown
+from projects.models import Project
+
+
+class TestRenderMarkdown:
+    def test_renders_code_and_emphasis(self):
+        html = render_markdown("Uses **Django** and `select_related`")
+
+        assert "<strong>Django</strong>" in html
+        assert "<code>select_related</code>" in html
+
+    def test_escapes_raw_html_and_unsafe_links(self):
+        html = render_markdown(
+            "<script>alert(1)</script> [x](javascript:alert(1))"
+        )
+
+        assert "<script>" not in html
+        assert 'href="javascript' not in html
+
+    def test_empty_text_renders_nothing(self):
+        assert render_markdown("") == ""
+        assert render_markdown(None) == ""
+
+
+@pytest.mark.django_db
+class TestProjectRenderedHtml:
+    def test_save_prerenders_each_language(self, project_factory):
+        project = project_factory(description="First line\n\n```\ncode\n```")
+
+        english = project.rendered_html["en"]
+        assert english["description"].startswith("<p>First line</p>")
+        assert "<pre><code>code\n</code></pre>" in english["description"]
+        assert set(project.rendered_html) == {"en", *project.translations}
+
+    def test_command_prerenders_rows_saved_without_html(self, project_factory):
+        project = project_factory(description="Some *text*")
+        Project.objects.filter(pk=project.pk).update(rendered_html={})
+
+        call_command("refresh_project_content", stdout=StringIO())
+
+        project.refresh_from_db()
+        assert (
+            project.rendered_html["en"]["description"]
+            == "<p>Some <em>text</em></p>"
+        )
+        assert set(project.rendered_html) == {"en", *project.translations}
+
+    def test_detail_renders_stored_html_without_parsing(
+        self,
+        client,
+        project_factory,
+        monkeypatch,
+    ):
+        project = project_factory()
+        rendered_html = project.rendered_html
+        rendered_html["fr"]["challenges"] = "<p>Rendu stocké</p>"
+        Project.objects.filter(pk=project.pk).update(
+            rendered_html=rendered_html
+        )
+
+        def fail(text):
+            raise AssertionError("Markdown parsed during the request")
+
+        monkeypatch.setattr(markdown._renderer, "render", fail)
+
+        with translation.override("fr"):
+            url = reverse("projects:detail", kwargs={"slug": project.slug})
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert "<p>Rendu stocké</p>" in unescape(response.content.decode())
@@ -0,0 +1,40 @@
+"""
+Tests for the technology icon sprite.
+"""
+from pathlib import Path
+
+from django.conf import settings
+from django.templatetags.static import static
+
+from projects.tech_icons import SPRITE_STATIC_PATH, TECH_ICONS, build_sprite
+from projects.templatetags.project_tags import tech_icon
+
+
+class TestTechIconSprite:
+    def test_committed_sprite_matches_registry(self):
+        static_dir = Path(settings.BASE_DIR) / "projects" / "static"
+        sprite_file = static_dir / SPRITE_STATIC_PATH
+
+        assert sprite_file.read_text(encoding="utf-8") == build_sprite()
+
+    def test_sprite_has_one_symbol_per_icon(self):
+        sprite = build_sprite()
+
+        for name in TECH_ICONS:
+            assert f'<symbol id="{name}"' in sprite
+
+    def test_tech_icon_references_sprite_symbol(self):
+        html = tech_icon("Python", "w-4 h-4")
+
+        assert f'<use href="{static(SPRITE_STATIC_PATH)}#python"/>' in html
+        assert 'class="w-4 h-4"' in html
+        assert "<path" not in html
+
+    def test_tech_icon_falls_back_to_generic_symbol(self):
+        assert "#generic" in tech_icon("Click")
+        assert "#generic" in tech_icon(None)
+
+    def test_tech_icon_escapes_css_class(self):
+        html = tech_icon("Python", '"><script>')
+
+        assert "<script>" not in html
@@ -1,10 +1,30 @@
 from django.urls import path
-from .views import ProjectListView, ProjectDetailView
+
+from core.async_views import select_view
+from core.decorators import public_view
+from .views import (
+    AsyncProjectDetailView,
+    AsyncProjectListView,
+    ProjectDetailView,
+    ProjectListView,
+)
 
 
 app_name = "projects"
 
 urlpatterns = [
-    path("", ProjectListView.as_view(), name="list"),
-    path("<slug:slug>/", ProjectDetailView.as_view(), name="detail"),
+    path(
+        "",
+        public_view(
+            select_view(ProjectListView, AsyncProjectListView).as_view()
+        ),
+        name="list",
+    ),
+    path(
+        "<slug:slug>/",
+        public_view(
+            select_view(ProjectDetailView, AsyncProjectDetailView).as_view()
+        ),
+        name="detail",
+    ),
 ]
@@ -7,7 +7,19 @@ from django.db.models import Q, Count, Prefetch
 from django.urls import reverse
 from django.views.generic import ListView, DetailView
 
+from core import metrics
+from core.async_views import AsyncDetailMixin, AsyncListMixin
 from core.localization.translation_service import translate_text
+from core.shared_cache import (
+    CATEGORIES_KEY,
+    PROJECTS_KEY,
+    TECHNOLOGIES_KEY,
+    SurrogateKeyMixin,
+    project_key,
+    project_keys,
+    section_key,
+)
+from core.streaming import StreamingTemplateMixin
 
 from .models import Project, Technology, Category, ProjectImage
 
@@ -29,6 +41,10 @@ ORIGIN_CONTEXTS = {
 }
 
 
+SIDEBAR_CACHE_KEY = "project_list_sidebar_data"
+NAVIGATION_CACHE_KEY = "project_navigation_ids"
+
+
 def make_cache_key(request, prefix="projectlist"):
     """
     Generate a unique cache key based on query parameters.
@@ -39,7 +55,79 @@ def make_cache_key(request, prefix="projectlist"):
     return f"{prefix}:{hashlib.md5(cache_key_data.encode()).hexdigest()}"
 
 
-class ProjectListView(ListView):
+def sidebar_technologies():
+    """Technologies with published project counts."""
+    return (
+        Technology.objects.annotate(
+            project_count=Count(
+                "projects", filter=Q(projects__is_published=True)
+            )
+        )
+        .filter(project_count__gt=0)
+        .order_by("-project_count", "name")
+    )
+
+
+def sidebar_categories():
+    """Categories with published project counts."""
+    return (
+        Category.objects.annotate(
+            project_count=Count(
+                "projects", filter=Q(projects__is_published=True)
+            )
+        )
+        .filter(project_count__gt=0)
+        .order_by("order", "name")
+    )
+
+
+def navigation_queryset():
+    """(id, slug) of every project in display order, for prev/next links."""
+    return Project.objects.order_by("order", "-completed_at").values_list(
+        "id", "slug"
+    )
+
+
+def project_navigation(project, ordered_ids, published_projects):
+    """
+    Return the previous/next project context of a detail page.
+
+    Args:
+        project: Displayed project.
+        ordered_ids: (id, slug) pairs from navigation_queryset().
+        published_projects: Published projects by id.
+    """
+
+    context = {}
+    try:
+        ids_only = [pid for pid, _ in ordered_ids]
+        idx = ids_only.index(project.id)
+
+        if idx > 0:
+            prev_id = ids_only[idx - 1]
+            previous_project = published_projects.get(prev_id)
+            if previous_project:
+                context["previous_project"] = {
+                    "id": prev_id,
+                    "slug": previous_project.slug,
+                    "title": previous_project.title,
+                }
+
+        if idx < len(ids_only) - 1:
+            next_id = ids_only[idx + 1]
+            next_project = published_projects.get(next_id)
+            if next_project:
+                context["next_project"] = {
+                    "id": next_id,
+                    "slug": next_project.slug,
+                    "title": next_project.title,
+                }
+    except ValueError:
+        logger.warning(f"Project {project.id} not found in ordered list")
+    return context
+
+
+class ProjectListView(SurrogateKeyMixin, StreamingTemplateMixin, ListView):
     """
     List projects with advanced filtering and sorting.
     Uses granular caching based on query parameters.
@@ -49,6 +137,18 @@ class ProjectListView(ListView):
     template_name = "projects/project_list.html"
     context_object_name = "projects"
     paginate_by = settings.PROJECTS_PER_PAGE
+    surrogate_keys = (
+        section_key("projects"),
+        PROJECTS_KEY,
+        TECHNOLOGIES_KEY,
+        CATEGORIES_KEY,
+    )
+
+    def get_surrogate_keys(self, context):
+        return [
+            *super().get_surrogate_keys(context),
+            *project_keys(context["object_list"]),
+        ]
 
     def get_queryset(self):
         """
@@ -63,6 +163,7 @@ class ProjectListView(ListView):
                 "slug",
                 "title",
                 "tagline",
+                "translations",
                 "primary_color",
                 "secondary_color",
                 "featured_image",
@@ -109,52 +210,34 @@ class ProjectListView(ListView):
         context = super().get_context_data(**kwargs)
 
         # Cache key for sidebar data (changes less frequently)
-        sidebar_cache_key = "project_list_sidebar_data"
-        sidebar_data = cache.get(sidebar_cache_key)
+        sidebar_data = cache.get(SIDEBAR_CACHE_KEY)
+        metrics.count_view_cache("sidebar", sidebar_data is not None)
 
         if sidebar_data is None:
-            # Technologies with project counts
-            technologies = (
-                Technology.objects.annotate(
-                    project_count=Count(
-                        "projects", filter=Q(projects__is_published=True)
-                    )
-                )
-                .filter(project_count__gt=0)
-                .order_by("-project_count", "name")
-            )
-
-            # Categories with counts
-            categories = (
-                Category.objects.annotate(
-                    project_count=Count(
-                        "projects", filter=Q(projects__is_published=True)
-                    )
-                )
-                .filter(project_count__gt=0)
-                .order_by("order", "name")
-            )
-
             sidebar_data = {
-                "technologies": list(technologies),
-                "categories": list(categories),
+                "technologies": list(sidebar_technologies()),
+                "categories": list(sidebar_categories()),
                 "total_projects": Project.published.count(),
             }
-            cache.set(sidebar_cache_key, sidebar_data, 60 * 30)  # 30 minutes
+            cache.set(SIDEBAR_CACHE_KEY, sidebar_data, 60 * 30)  # 30 minutes
 
         context.update(sidebar_data)
-
-        # Active filters and stats
-        context["active_tech_slugs"] = self.request.GET.getlist("tech")
-        context["active_category"] = self.request.GET.get("category", "")
-        context["search_query"] = self.request.GET.get("q", "")
-        context["current_sort"] = self.request.GET.get("sort", "order")
+        context.update(self.get_filter_context())
         context["filtered_count"] = self.get_queryset().count()
 
         return context
 
+    def get_filter_context(self):
+        """Active filters, echoed back to the filter form."""
+        return {
+            "active_tech_slugs": self.request.GET.getlist("tech"),
+            "active_category": self.request.GET.get("category", ""),
+            "search_query": self.request.GET.get("q", ""),
+            "current_sort": self.request.GET.get("sort", "order"),
+        }
+
 
-class ProjectDetailView(DetailView):
+class ProjectDetailView(SurrogateKeyMixin, StreamingTemplateMixin, DetailView):
     """
     Display a single project's detail page with optimized similar projects logic.
     """
@@ -164,6 +247,18 @@ class ProjectDetailView(DetailView):
     context_object_name = "project"
     slug_url_kwarg = "slug"
 
+    def get_surrogate_keys(self, context):
+        """The project, its similar projects and previous/next links."""
+        return [
+            *super().get_surrogate_keys(context),
+            *project_keys([self.object, *context["similar_projects"]]),
+            *(
+                project_key(context[link]["id"])
+                for link in ("previous_project", "next_project")
+                if link in context
+            ),
+        ]
+
     def get_queryset(self):
         """Optimize queries with prefetch of related objects."""
         gallery_prefetch = Prefetch(
@@ -184,51 +279,34 @@ class ProjectDetailView(DetailView):
         )
 
         # Navigation: previous and next projects
-        cache_key = "project_navigation_ids"
-        ordered_ids = cache.get(cache_key)
+        ordered_ids = cache.get(NAVIGATION_CACHE_KEY)
+        metrics.count_view_cache("navigation", ordered_ids is not None)
 
         if ordered_ids is None:
-            ordered_ids = list(
-                Project.objects.order_by("order", "-completed_at").values_list(
-                    "id", "slug"
-                )
+            ordered_ids = list(navigation_queryset())
+            cache.set(NAVIGATION_CACHE_KEY, ordered_ids, 60 * 30)  # 30 minutes
+
+        published_projects = {
+            related_project.id: related_project
+            for related_project in Project.published.only(
+                "id", "slug", "title"
             )
-            cache.set(cache_key, ordered_ids, 60 * 30)  # 30 minutes
+        }
+        context.update(
+            project_navigation(project, ordered_ids, published_projects)
+        )
+        context.update(self.get_origin_context())
 
-        try:
-            ids_only = [pid for pid, _ in ordered_ids]
-            projects_dict = {
-                related_project.id: related_project
-                for related_project in Project.published.only("id", "slug", "title")
-            }
-            idx = ids_only.index(project.id)
-
-            if idx > 0:
-                prev_id = ids_only[idx - 1]
-                previous_project = projects_dict.get(prev_id)
-                if previous_project:
-                    context["previous_project"] = {
-                        "id": prev_id,
-                        "slug": previous_project.slug,
-                        "title": previous_project.title,
-                    }
-
-            if idx < len(ids_only) - 1:
-                next_id = ids_only[idx + 1]
-                next_project = projects_dict.get(next_id)
-                if next_project:
-                    context["next_project"] = {
-                        "id": next_id,
-                        "slug": next_project.slug,
-                        "title": next_project.title,
-                    }
-        except ValueError:
-            logger.warning(f"Project {project.id} not found in ordered list")
+        return context
 
+    def get_origin_context(self):
+        """Back link to the section page the visitor came from."""
         requested_origin = self.request.GET.get("from", "")
         origin_context = ORIGIN_CONTEXTS.get(requested_origin)
-        if origin_context:
-            context["origin_context"] = {
+        if not origin_context:
+            return {}
+        return {
+            "origin_context": {
                 "label": translate_text(
                     origin_context["label"],
                     getattr(self.request, "LANGUAGE_CODE", None),
@@ -236,5 +314,59 @@ class ProjectDetailView(DetailView):
                 or origin_context["label"],
                 "url": reverse(origin_context["url"]),
             }
+        }
+
+
+class AsyncProjectListView(AsyncListMixin, ProjectListView):
+    async def aget_context_data(self, **kwargs):
+        context = await super().aget_context_data(**kwargs)
+
+        sidebar_data = await cache.aget(SIDEBAR_CACHE_KEY)
+        metrics.count_view_cache("sidebar", sidebar_data is not None)
+        if sidebar_data is None:
+            sidebar_data = {
+                "technologies": [
+                    tech async for tech in sidebar_technologies()
+                ],
+                "categories": [
+                    category async for category in sidebar_categories()
+                ],
+                "total_projects": await Project.published.acount(),
+            }
+            await cache.aset(SIDEBAR_CACHE_KEY, sidebar_data, 60 * 30)
 
+        context.update(sidebar_data)
+        context.update(self.get_filter_context())
+        context["filtered_count"] = context["paginator"].count
+        return context
+
+
+class AsyncProjectDetailView(AsyncDetailMixin, ProjectDetailView):
+    async def aget_context_data(self, **kwargs):
+        context = await super().aget_context_data(**kwargs)
+        project = self.object
+
+        context["similar_projects"] = [
+            similar
+            async for similar in project.get_similar_projects(
+                limit=settings.SIMILAR_PROJECTS_COUNT
+            )
+        ]
+
+        ordered_ids = await cache.aget(NAVIGATION_CACHE_KEY)
+        metrics.count_view_cache("navigation", ordered_ids is not None)
+        if ordered_ids is None:
+            ordered_ids = [pair async for pair in navigation_queryset()]
+            await cache.aset(NAVIGATION_CACHE_KEY, ordered_ids, 60 * 30)
+
+        published_projects = {
+            related_project.id: related_project
+            async for related_project in Project.published.only(
+                "id", "slug", "title"
+            )
+        }
+        context.update(
+            project_navigation(project, ordered_ids, published_projects)
+        )
+        context.update(self.get_origin_context())
         return context
@@ -31,6 +31,9 @@ pip install -r requirements/prod.txt
 echo "🗄️  Application des migrations..."
 python manage.py migrate --settings=portfolio_dimitri.settings
 
+echo "🌍 Mise à jour des contenus précalculés des projets..."
+python manage.py refresh_project_content --settings=portfolio_dimitri.settings
+
 echo "📁 Collecte des fichiers statiques..."
 python manage.py collectstatic --noinput --settings=portfolio_dimitri.settings
 